@@ -1,36 +1,203 @@
-from flask import Flask
-from dotenv import load_dotenv
-import os
+from time import perf_counter
+_import_started_at = perf_counter()
+
+# Load configuration first, so every module below reads the same settings
 from config import mongo_client
+from flask import Flask, Response, jsonify
+import os
+import sys
+import threading
+import time
 from routes.auth_routes import auth_bp
 from routes.speaker_routes import speaker_bp
 from routes.booking_routes import booking_bp
+from services.email_service import start_email_workers
+from services.reminder_service import start_reminder_scheduler
+from services.booking_service import start_cleanup_scheduler
+from utils.indexes import ensure_indexes
+from services.speaker_service import backfill_speaker_search_fields
+from services.booking_service import backfill_seats_available, backfill_bookings_cleared, backfill_booking_session_times
+from utils.auth_middleware import add_auth_server_timing
+from utils.metrics import start_request_timer, record_request_metrics, render_metrics, startup_seconds
+from utils.health import check_readiness, mark_startup_complete, start_readiness_monitor
+
+# Seconds between connection attempts while MongoDB is unreachable at startup
+STARTUP_RETRY_SECONDS = 5
+
+# Record how long importing the application took
+_import_seconds = perf_counter() - _import_started_at
+startup_seconds.set(_import_seconds, "import")
+print(f"Imported application in {_import_seconds * 1000:.0f}ms")
+
+def wait_for_database():
+    """
+    Block until MongoDB answers a ping, retrying every STARTUP_RETRY_SECONDS
+    """
+    while True:
+        try:
+            mongo_client.admin.command('ping')
+            print("MongoDB connection successful!")
+            return
+        except Exception as e:
+            print(f"MongoDB connection failed, retrying in {STARTUP_RETRY_SECONDS}s: {e}")
+            time.sleep(STARTUP_RETRY_SECONDS)
+
+def run_migrations():
+    """
+    Bring indexes and data up to date
+
+    One-off work meant to run once per deploy (python -m app migrate),
+    not in every server process. Every step is idempotent, so running it
+    again is harmless.
+
+    Returns:
+        bool: True if every step succeeded
+    """
+    ok = True
+
+    # Create any missing indexes (failures are logged per index)
+    _, failed = ensure_indexes()
+    if failed:
+        ok = False
+
+    # Add search fields to speaker profiles that predate them
+    try:
+        backfill_speaker_search_fields()
+    except Exception as e:
+        print(f"Failed to backfill speaker search fields: {e}")
+        ok = False
+
+    # Add seats_available to sessions that predate it
+    try:
+        backfill_seats_available()
+    except Exception as e:
+        print(f"Failed to backfill session seat counts: {e}")
+        ok = False
+
+    # Copy session date and time onto bookings that predate them, so they page correctly
+    try:
+        backfill_booking_session_times()
+    except Exception as e:
+        print(f"Failed to backfill booking session times: {e}")
+        ok = False
+
+    # Add bookings_cleared to sessions that predate it
+    try:
+        backfill_bookings_cleared()
+    except Exception as e:
+        print(f"Failed to backfill session cleanup flags: {e}")
+        ok = False
+
+    return ok
+
+def run_startup_tasks(migrate=False):
+    """
+    Wait for the database, then mark this process as ready
+
+    Args:
+        migrate (bool): Also run the migrations, for single-process setups
+            such as the development server
+    """
+    started_at = perf_counter()
+
+    wait_for_database()
 
-# Load environment variables
-load_dotenv()
+    if migrate:
+        run_migrations()
 
-# Initialize Flask app
-app = Flask(__name__)
+    startup_seconds.set(perf_counter() - started_at, "startup_tasks")
+    mark_startup_complete()
 
-# Test MongoDB connection
-try:
-    mongo_client.admin.command('ping')
-    print("MongoDB connection successful!")
-except Exception as e:
-    print(f"MongoDB connection failed: {e}")
+def start_background_services(migrate=False):
+    """
+    Start this process's background threads
 
-# Register blueprints
-app.register_blueprint(auth_bp, url_prefix='/api')
-app.register_blueprint(speaker_bp, url_prefix='/api')
-app.register_blueprint(booking_bp, url_prefix='/api')
+    Threads do not survive a fork, so servers that fork workers must call
+    this in each worker (see gunicorn.conf.py). Startup tasks run in the
+    background too, so no network I/O delays serving requests.
 
-@app.route('/')
-def health_check():
-    return "SpeakEasy API is running."
+    Args:
+        migrate (bool): Also run the migrations in the startup thread
+    """
+    # Run the startup checks without blocking startup
+    threading.Thread(target=run_startup_tasks, args=(migrate,), name="startup-tasks", daemon=True).start()
 
-#if __name__ == '__main__':
-#    app.run(debug=True) 
+    # Check dependencies in the background, so /readyz only reads the results
+    start_readiness_monitor()
+
+    # Start the background email workers (resumes any queued emails)
+    start_email_workers()
+
+    # Start the background session reminder scheduler
+    start_reminder_scheduler()
+
+    # Start the background job that clears past bookings for all users
+    start_cleanup_scheduler()
+
+def create_app(start_background=True):
+    """
+    Create and configure the Flask application
+
+    Creating the app does no network I/O; startup tasks run with the
+    background services.
+
+    Args:
+        start_background (bool): Start the startup tasks, migrations and
+            background threads in this process (single-process servers only)
+
+    Returns:
+        Flask: The configured application
+    """
+    # Initialize Flask app
+    app = Flask(__name__)
+
+    # Register blueprints
+    app.register_blueprint(auth_bp, url_prefix='/api')
+    app.register_blueprint(speaker_bp, url_prefix='/api')
+    app.register_blueprint(booking_bp, url_prefix='/api')
+
+    # Expose the per-request auth timing breakdown
+    app.after_request(add_auth_server_timing)
+
+    # Record per-route latency and Mongo usage for /metrics
+    app.before_request(start_request_timer)
+    app.after_request(record_request_metrics)
+
+    @app.route('/')
+    def health_check():
+        return "SpeakEasy API is running."
+
+    # Liveness: the process is up and serving requests
+    @app.route('/healthz')
+    def liveness():
+        return jsonify({'status': 'ok'}), 200
+
+    # Readiness: startup finished and dependencies reachable, as last seen by the readiness monitor
+    @app.route('/readyz')
+    def readiness():
+        ready, checks = check_readiness()
+        return jsonify({'status': 'ready' if ready else 'not ready', 'checks': checks}), 200 if ready else 503
+
+    @app.route('/metrics')
+    def metrics():
+        return Response(render_metrics(), mimetype='text/plain; version=0.0.4')
+
+    if start_background:
+        start_background_services(migrate=True)
+
+    return app
 
 if __name__ == '__main__':
+    # Run the migrations once per deploy, before starting the new release
+    if sys.argv[1:] == ['migrate']:
+        wait_for_database()
+        sys.exit(0 if run_migrations() else 1)
+
+    # Development server only; use gunicorn (see gunicorn.conf.py) in production
     port = int(os.environ.get("PORT", 5000))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    debug = os.environ.get("FLASK_DEBUG", "true").lower() == "true"
+    
+    # The reloader runs this module in a watcher process and again in the serving
+    # child; only the process that serves requests runs migrations and background threads
+    serving = not debug or os.environ.get("WERKZEUG_RUN_MAIN") == "true"
+    create_app(start_background=serving).run(debug=debug, host='0.0.0.0', port=port)
@@ -0,0 +1,27 @@
+# Shared description of the synthetic benchmark dataset
+
+# Password shared by every generated account, used by the load test to log in
+BENCHMARK_PASSWORD = "benchmark-password"
+
+# Hourly session slots allowed by create_session (9:00 to 15:00 starts)
+SESSION_HOURS = [f"{hour:02d}:00" for hour in range(9, 16)]
+
+EXPERTISE = [
+    "Python & Data Science",
+    "JavaScript Development",
+    "Public Speaking",
+    "Machine Learning",
+    "Cloud Architecture",
+    "Product Management",
+    "UX Design",
+    "Career Coaching"
+]
+
+FIRST_NAMES = ["Alex", "Sam", "Jordan", "Taylor", "Morgan", "Casey", "Riley", "Jamie"]
+LAST_NAMES = ["Smith", "Rogers", "Patel", "Garcia", "Kim", "Nguyen", "Brown", "Okafor"]
+
+def user_email(index):
+    return f"bench-user-{index}@example.com"
+
+def speaker_email(index):
+    return f"bench-speaker-{index}@example.com"
@@ -0,0 +1,218 @@
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+from bson import ObjectId
+from config import mongo_client
+from services.auth_service import hash_password
+from services.speaker_service import backfill_speaker_ratings
+from utils.indexes import ensure_indexes
+from benchmarks.dataset import BENCHMARK_PASSWORD, EXPERTISE, FIRST_NAMES, LAST_NAMES, SESSION_HOURS, user_email, speaker_email
+
+# Database holding all collections
+db = mongo_client.speakeasy
+
+# Documents inserted per insert_many call
+INSERT_BATCH_SIZE = 10000
+
+def _insert_in_batches(collection, documents):
+    """
+    Insert documents with insert_many, INSERT_BATCH_SIZE at a time
+
+    Args:
+        collection: Target collection
+        documents: Iterable of documents (may be a generator)
+
+    Returns:
+        int: Number of documents inserted
+    """
+    inserted = 0
+    batch = []
+    for document in documents:
+        batch.append(document)
+        if len(batch) >= INSERT_BATCH_SIZE:
+            inserted += len(collection.insert_many(batch, ordered=False).inserted_ids)
+            batch = []
+            print(f"  {collection.name}: {inserted} inserted", end="\r")
+
+    if batch:
+        inserted += len(collection.insert_many(batch, ordered=False).inserted_ids)
+
+    print(f"  {collection.name}: {inserted} inserted")
+    return inserted
+
+def _account(email, role, password_hash, rng):
+    return {
+        "_id": ObjectId(),
+        "first_name": rng.choice(FIRST_NAMES),
+        "last_name": rng.choice(LAST_NAMES),
+        "email": email,
+        "password": password_hash,
+        "role": role,
+        "otp": "",
+        "is_verified": True,
+        "benchmark": True
+    }
+
+def drop_benchmark_data():
+    """
+    Delete every document created by a previous generator run
+
+    Returns:
+        dict: Number of deleted documents per collection
+    """
+    return {
+        name: db[name].delete_many({"benchmark": True}).deleted_count
+        for name in ("users", "speakers", "sessions", "bookings")
+    }
+
+def generate(users, speakers, sessions_per_speaker, bookings, max_seats, past_fraction, rated_fraction, seed):
+    """
+    Bulk-insert a synthetic dataset
+
+    Bookings are spread round-robin over every session, so each session's
+    seat counters are known up front and no read-back is needed.
+
+    Args:
+        users (int): Number of user accounts
+        speakers (int): Number of speaker accounts, each with a profile
+        sessions_per_speaker (int): Hourly sessions created for each speaker
+        bookings (int): Total number of bookings
+        max_seats (int): Seats per session
+        past_fraction (float): Share of each speaker's sessions that are in the past
+        rated_fraction (float): Share of past bookings that already have feedback
+        seed (int): Random seed, so runs are reproducible
+
+    Returns:
+        dict: Number of inserted documents per collection
+    """
+    session_count = speakers * sessions_per_speaker
+    if bookings > session_count * max_seats:
+        raise ValueError(f"{bookings} bookings do not fit in {session_count} sessions of {max_seats} seats")
+    if bookings and max_seats > users:
+        raise ValueError("max_seats cannot exceed the number of users (each seat needs a different user)")
+
+    rng = random.Random(seed)
+    started_at = time.perf_counter()
+    counts = {}
+
+    # One bcrypt hash shared by every account keeps generation fast
+    password_hash = hash_password(BENCHMARK_PASSWORD)
+
+    print("Generating users and speakers")
+    user_ids = []
+    def user_documents():
+        for index in range(users):
+            account = _account(user_email(index), "user", password_hash, rng)
+            user_ids.append(str(account["_id"]))
+            yield account
+    counts["users"] = _insert_in_batches(db.users, user_documents())
+
+    speaker_accounts = [_account(speaker_email(index), "speaker", password_hash, rng) for index in range(speakers)]
+    counts["users"] += _insert_in_batches(db.users, speaker_accounts)
+    counts["speakers"] = _insert_in_batches(db.speakers, (
+        {
+            "user_id": str(account["_id"]),
+            "first_name": account["first_name"],
+            "last_name": account["last_name"],
+            "expertise": rng.choice(EXPERTISE),
+            "price_per_session": float(rng.randrange(20, 200, 5)),
+            "rating_average": 0,
+            "benchmark": True
+        }
+        for account in speaker_accounts
+    ))
+
+    # Each speaker's sessions fill consecutive hourly slots, starting in the past
+    print("Generating sessions")
+    first_day = date.today() - timedelta(days=int(sessions_per_speaker * past_fraction) // len(SESSION_HOURS) + 1)
+    session_ids = []
+    session_slots = []
+    def session_documents():
+        for speaker_index, account in enumerate(speaker_accounts):
+            for slot in range(sessions_per_speaker):
+                session_index = speaker_index * sessions_per_speaker + slot
+                booked = bookings // session_count + (1 if session_index < bookings % session_count else 0)
+                session_date = (first_day + timedelta(days=slot // len(SESSION_HOURS))).strftime("%Y-%m-%d")
+                session_time = SESSION_HOURS[slot % len(SESSION_HOURS)]
+
+                session_id = ObjectId()
+                session_ids.append(str(session_id))
+                session_slots.append((session_date, session_time))
+                yield {
+                    "_id": session_id,
+                    "speaker_id": str(account["_id"]),
+                    "date": session_date,
+                    "time": session_time,
+                    "max_seats": max_seats,
+                    "seats_booked": booked,
+                    "seats_available": max_seats - booked,
+                    "bookings_cleared": False,
+                    "benchmark": True
+                }
+    counts["sessions"] = _insert_in_batches(db.sessions, session_documents())
+
+    # Booking n goes to session n % session_count; the users of one session
+    # are consecutive (mod users), so no user books the same session twice
+    print("Generating bookings")
+    today = date.today().strftime("%Y-%m-%d")
+    def booking_documents():
+        for booking_index in range(bookings):
+            session_index = booking_index % session_count
+            seat = booking_index // session_count
+            session_date, session_time = session_slots[session_index]
+
+            booking = {
+                "user_id": user_ids[(session_index * max_seats + seat) % users],
+                "session_id": session_ids[session_index],
+                "session_date": session_date,
+                "session_time": session_time,
+                "created_at": datetime.utcnow(),
+                "benchmark": True
+            }
+            if session_date < today and rng.random() < rated_fraction:
+                booking["rating"] = rng.randint(1, 5)
+                booking["feedback_submitted_at"] = datetime.utcnow()
+            yield booking
+    counts["bookings"] = _insert_in_batches(db.bookings, booking_documents())
+
+    print("Computing speaker rating aggregates")
+    backfill_speaker_ratings()
+
+    print(f"Generated dataset in {time.perf_counter() - started_at:.1f}s")
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-insert a synthetic SpeakEasy dataset for benchmarks")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--speakers", type=int, default=100)
+    parser.add_argument("--sessions-per-speaker", type=int, default=70)
+    parser.add_argument("--bookings", type=int, default=20000)
+    parser.add_argument("--max-seats", type=int, default=10)
+    parser.add_argument("--past-fraction", type=float, default=0.3, help="share of sessions in the past")
+    parser.add_argument("--rated-fraction", type=float, default=0.5, help="share of past bookings with feedback")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--drop", action="store_true", help="delete data from previous runs first")
+    args = parser.parse_args()
+
+    if args.drop:
+        for name, deleted in drop_benchmark_data().items():
+            print(f"Deleted {deleted} {name}")
+
+    # Insert against the production indexes so unique constraints hold
+    _, failed = ensure_indexes()
+    if failed:
+        parser.exit(1, f"Could not create indexes: {', '.join(failed)}\n")
+
+    counts = generate(
+        args.users,
+        args.speakers,
+        args.sessions_per_speaker,
+        args.bookings,
+        args.max_seats,
+        args.past_fraction,
+        args.rated_fraction,
+        args.seed
+    )
+    for name, count in counts.items():
+        print(f"{name}: {count}")
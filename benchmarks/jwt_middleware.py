@@ -0,0 +1,64 @@
+import argparse
+import timeit
+import jwt
+from flask import Flask
+from config import JWT_SECRET
+from utils import jwt_handler
+from utils.auth_middleware import token_required
+from utils.jwt_handler import generate_token
+
+def _protected():
+    return "ok"
+
+def benchmark(number):
+    """
+    Time the token_required middleware per request, with and without the
+    verified-token cache
+
+    Each call runs inside its own request context, so the per-request
+    memoization on flask.g does not hide the verification cost.
+
+    Args:
+        number (int): Requests per variant
+
+    Returns:
+        dict: Microseconds per request for each variant
+    """
+    app = Flask(__name__)
+    token = generate_token({"id": "0" * 24, "email": "bench@example.com", "role": "user"})
+    headers = {"Authorization": f"Bearer {token}"}
+    view = token_required(_protected)
+
+    def request_without_auth():
+        with app.test_request_context("/api/profile", headers=headers):
+            _protected()
+
+    def request_cached():
+        with app.test_request_context("/api/profile", headers=headers):
+            view()
+
+    def request_uncached():
+        jwt_handler._token_cache.clear()
+        with app.test_request_context("/api/profile", headers=headers):
+            view()
+
+    request_cached()
+    results = {
+        "request context only": timeit.timeit(request_without_auth, number=number),
+        "token_required, cached": timeit.timeit(request_cached, number=number),
+        "token_required, uncached": timeit.timeit(request_uncached, number=number),
+        "jwt.decode alone": timeit.timeit(lambda: jwt.decode(token, JWT_SECRET, algorithms=["HS256"]), number=number)
+    }
+    return {variant: seconds / number * 1e6 for variant, seconds in results.items()}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmark the JWT middleware with and without the token cache")
+    parser.add_argument("--number", type=int, default=20000, help="requests per variant")
+    args = parser.parse_args()
+
+    results = benchmark(args.number)
+    baseline = results["request context only"]
+    print(f"{'variant':<28} {'us/request':>10} {'middleware us':>14}")
+    for variant, micros in results.items():
+        overhead = f"{micros - baseline:>14.1f}" if variant.startswith("token_required") else f"{'-':>14}"
+        print(f"{variant:<28} {micros:>10.1f} {overhead}")
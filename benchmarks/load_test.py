@@ -0,0 +1,318 @@
+import argparse
+import http.client
+import json
+import math
+import random
+import subprocess
+import threading
+import time
+import uuid
+from datetime import date, datetime
+from urllib.parse import urlencode, urlsplit
+from benchmarks.dataset import BENCHMARK_PASSWORD, EXPERTISE, user_email
+from benchmarks.smtp_sink import SMTPSink
+
+# Default share of each scripted workload in the mix
+DEFAULT_MIX = "browse=50,book=20,cancel=10,feedback=10,login=5,signup=5"
+
+class _Client:
+    """
+    Keep-alive HTTP client for one virtual user, recording every request
+    """
+
+    def __init__(self, base_url, recorder):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.https = parts.scheme == "https"
+        self.recorder = recorder
+        self.token = None
+        self._connection = None
+
+    def _connect(self):
+        connection_class = http.client.HTTPSConnection if self.https else http.client.HTTPConnection
+        self._connection = connection_class(self.host, self.port, timeout=30)
+
+    def request(self, method, path, body=None, params=None):
+        """
+        Send a request and record its latency under "METHOD path"
+
+        Returns:
+            tuple: (status, parsed JSON body or None); status is 0 on connection errors
+        """
+        url = f"/api{path}" + (f"?{urlencode(params)}" if params else "")
+        headers = {"Content-Type": "application/json"}
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+
+        started_at = time.perf_counter()
+        try:
+            if self._connection is None:
+                self._connect()
+            self._connection.request(method, url, json.dumps(body) if body is not None else None, headers)
+            response = self._connection.getresponse()
+            payload = response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self._connection = None
+            status, payload = 0, b""
+
+        self.recorder.record(f"{method} /api{path}", time.perf_counter() - started_at, status)
+
+        try:
+            return status, json.loads(payload) if payload else None
+        except ValueError:
+            return status, None
+
+    def login(self, email):
+        status, data = self.request("POST", "/login", {"email": email, "password": BENCHMARK_PASSWORD})
+        self.token = data.get("token") if status == 200 and data else None
+        return self.token is not None
+
+class _Recorder:
+    """
+    Thread-safe per-endpoint latency and status recorder
+    """
+
+    def __init__(self):
+        self.samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, seconds, status):
+        with self._lock:
+            self.samples.setdefault(endpoint, []).append((seconds, status))
+
+def _percentile(sorted_values, fraction):
+    # Nearest-rank percentile
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+def summarize(samples, elapsed):
+    """
+    Compute throughput and latency percentiles per endpoint
+
+    Args:
+        samples (dict): Endpoint -> list of (seconds, status)
+        elapsed (float): Wall clock duration of the run in seconds
+
+    Returns:
+        dict: Endpoint -> statistics, plus a "TOTAL" entry
+    """
+    summary = {}
+    everything = []
+    for endpoint, endpoint_samples in sorted(samples.items()):
+        everything.extend(endpoint_samples)
+        summary[endpoint] = _summarize_samples(endpoint_samples, elapsed)
+    summary["TOTAL"] = _summarize_samples(everything, elapsed)
+    return summary
+
+def _summarize_samples(samples, elapsed):
+    latencies = sorted(seconds for seconds, _ in samples)
+    if not latencies:
+        return {"requests": 0}
+
+    return {
+        "requests": len(samples),
+        "rps": round(len(samples) / elapsed, 2),
+        # Conflicts like "Session is fully booked" are expected under load; only 5xx and transport failures are errors
+        "client_errors": sum(1 for _, status in samples if 400 <= status < 500),
+        "errors": sum(1 for _, status in samples if status == 0 or status >= 500),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2),
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(_percentile(latencies, 0.99) * 1000, 2)
+    }
+
+# Scripted workloads; each receives the virtual user's client and a random generator
+
+def browse(client, rng):
+    client.request("GET", "/speakers", params={"limit": 50})
+    client.request("GET", "/speakers/search", params={"q": rng.choice(EXPERTISE).split()[0], "sort": "rating", "order": "desc"})
+    client.request("GET", "/sessions/available", params={"limit": 20})
+    client.request("GET", "/my-bookings", params={"limit": 20})
+
+def book(client, rng):
+    status, data = client.request("GET", "/sessions/available", params={"limit": 50})
+    if status == 200 and data and data["sessions"]:
+        session = rng.choice(data["sessions"])
+        client.request("POST", "/book-session", {"session_id": session["session_id"]})
+
+def cancel(client, rng):
+    status, data = client.request("GET", "/my-bookings", params={"limit": 200})
+    if status != 200 or not data:
+        return
+    today = date.today().strftime("%Y-%m-%d")
+    upcoming = [booking for booking in data["bookings"] if booking["date"] >= today]
+    if upcoming:
+        client.request("POST", "/cancel-booking", {"booking_id": rng.choice(upcoming)["booking_id"]})
+
+def feedback(client, rng):
+    status, data = client.request("GET", "/my-bookings", params={"limit": 200})
+    if status != 200 or not data:
+        return
+    today = date.today().strftime("%Y-%m-%d")
+    unrated = [booking for booking in data["bookings"] if booking["date"] < today and "rating" not in booking]
+    if unrated:
+        client.request("POST", "/submit-feedback", {
+            "booking_id": rng.choice(unrated)["booking_id"],
+            "rating": rng.randint(1, 5),
+            "feedback_text": "Benchmark feedback"
+        })
+
+def login(client, rng, users):
+    client.login(user_email(rng.randrange(users)))
+
+def signup(client, rng):
+    client.request("POST", "/signup", {
+        "first_name": "Bench",
+        "last_name": "Signup",
+        "email": f"bench-signup-{uuid.uuid4().hex}@example.com",
+        "password": BENCHMARK_PASSWORD,
+        "role": "user"
+    })
+
+WORKLOADS = {
+    "browse": browse,
+    "book": book,
+    "cancel": cancel,
+    "feedback": feedback,
+    "login": login,
+    "signup": signup
+}
+
+def parse_mix(mix):
+    """
+    Parse "name=weight,..." into workload names and weights
+
+    Raises:
+        ValueError: If a workload is unknown or a weight is not a number
+    """
+    names, weights = [], []
+    for part in mix.split(","):
+        name, weight = part.split("=")
+        if name not in WORKLOADS:
+            raise ValueError(f"Unknown workload: {name}")
+        names.append(name)
+        weights.append(float(weight))
+    return names, weights
+
+def _virtual_user(base_url, users, names, weights, deadline, recorder, seed):
+    rng = random.Random(seed)
+    client = _Client(base_url, recorder)
+
+    # Each virtual user acts as one generated account
+    if not client.login(user_email(rng.randrange(users))):
+        return
+
+    while time.monotonic() < deadline:
+        name = rng.choices(names, weights)[0]
+        if name == "login":
+            login(client, rng, users)
+        else:
+            WORKLOADS[name](client, rng)
+
+def run(base_url, users, concurrency, duration, mix, seed):
+    """
+    Run the mixed workload against a running app
+
+    Args:
+        base_url (str): App URL, e.g. http://localhost:5000
+        users (int): Number of generated users to log in as
+        concurrency (int): Number of virtual users
+        duration (float): Run time in seconds
+        mix (str): Workload mix, e.g. "browse=50,book=20"
+        seed (int): Random seed
+
+    Returns:
+        tuple: (per-endpoint samples, elapsed seconds)
+    """
+    names, weights = parse_mix(mix)
+    recorder = _Recorder()
+    deadline = time.monotonic() + duration
+
+    threads = [
+        threading.Thread(
+            target=_virtual_user,
+            args=(base_url, users, names, weights, deadline, recorder, seed + index),
+            daemon=True
+        )
+        for index in range(concurrency)
+    ]
+    started_at = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return recorder.samples, time.perf_counter() - started_at
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+def print_report(summary, baseline=None):
+    """
+    Print per-endpoint throughput and latency, with deltas against a baseline run
+    """
+    print(f"{'endpoint':<32} {'requests':>9} {'req/s':>9} {'err':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for endpoint, stats in summary.items():
+        if not stats["requests"]:
+            continue
+        line = (
+            f"{endpoint:<32} {stats['requests']:>9} {stats['rps']:>9} {stats['errors']:>6} "
+            f"{stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}"
+        )
+        previous = (baseline or {}).get(endpoint)
+        if previous and previous.get("requests"):
+            line += (
+                f"   (req/s {stats['rps'] - previous['rps']:+.2f},"
+                f" p95 {stats['p95_ms'] - previous['p95_ms']:+.2f} ms)"
+            )
+        print(line)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a mixed workload against SpeakEasy and report per-endpoint latency")
+    parser.add_argument("--base-url", default="http://localhost:5000")
+    parser.add_argument("--users", type=int, default=1000, help="number of users created by benchmarks.generate_data")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=60)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="save results as JSON to this path")
+    parser.add_argument("--compare", help="JSON results of a previous run to compare against")
+    parser.add_argument("--smtp-sink-port", type=int, help="also run a local SMTP sink on this port")
+    args = parser.parse_args()
+
+    sink = SMTPSink(port=args.smtp_sink_port).start() if args.smtp_sink_port else None
+
+    started_at = datetime.utcnow()
+    samples, elapsed = run(args.base_url, args.users, args.concurrency, args.duration, args.mix, args.seed)
+    summary = summarize(samples, elapsed)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["endpoints"]
+
+    print_report(summary, baseline)
+    if sink:
+        print(f"SMTP sink accepted {sink.messages} messages")
+
+    if args.output:
+        results = {
+            "meta": {
+                "started_at": started_at.isoformat(),
+                "git_commit": _git_commit(),
+                "base_url": args.base_url,
+                "users": args.users,
+                "concurrency": args.concurrency,
+                "duration": round(elapsed, 2),
+                "mix": args.mix,
+                "seed": args.seed
+            },
+            "endpoints": summary
+        }
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"Saved results to {args.output}")
@@ -0,0 +1,75 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app import create_app
+from benchmarks.dataset import BENCHMARK_PASSWORD, user_email
+from services import auth_service
+
+def use_hasher(workers):
+    """
+    Replace the password executor with one of the given size
+
+    The pending limit keeps its configured ratio to the worker count.
+
+    Returns:
+        int: The new pending limit
+    """
+    pending = max(1, auth_service.PASSWORD_HASH_MAX_PENDING * workers // auth_service.PASSWORD_HASH_WORKERS)
+    auth_service._password_executor.shutdown()
+    auth_service._password_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+    auth_service._password_slots = threading.BoundedSemaphore(pending)
+    return pending
+
+def run(app, email, concurrency, duration):
+    """
+    Log in from concurrency threads for duration seconds
+
+    Returns:
+        dict: Response counts by status code and logins per second
+    """
+    deadline = time.perf_counter() + duration
+    statuses = {}
+    lock = threading.Lock()
+
+    def client_loop(_):
+        client = app.test_client()
+        while time.perf_counter() < deadline:
+            status = client.post("/api/login", json={"email": email, "password": BENCHMARK_PASSWORD}).status_code
+            with lock:
+                statuses[status] = statuses.get(status, 0) + 1
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(client_loop, range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    return {"statuses": statuses, "logins_per_second": statuses.get(200, 0) / elapsed}
+
+if __name__ == "__main__":
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Measure login throughput per bcrypt worker thread (one per core)")
+    parser.add_argument("--workers", default=",".join(str(n) for n in sorted({1, max(1, cores // 2), cores})),
+                        help="comma separated hasher sizes to measure")
+    parser.add_argument("--concurrency", type=int,
+                        help="concurrent login clients (defaults to the hasher's pending limit, so none are shed)")
+    parser.add_argument("--duration", type=float, default=10, help="seconds per hasher size")
+    args = parser.parse_args()
+
+    # Needs the synthetic dataset: python -m benchmarks.generate_data
+    app = create_app(start_background=False)
+    email = user_email(0)
+    print(f"Logging in as {email}, bcrypt cost {auth_service.BCRYPT_ROUNDS}, {cores} cores")
+
+    print(f"{'workers':>8} {'clients':>8} {'logins/s':>10} {'per core':>10} {'503s':>8}")
+    for workers in (int(size) for size in args.workers.split(",")):
+        pending = use_hasher(workers)
+        concurrency = args.concurrency or pending
+        result = run(app, email, concurrency, args.duration)
+        if set(result["statuses"]) - {200, 503}:
+            raise SystemExit(f"Unexpected responses {result['statuses']}; generate the dataset first")
+
+        busy_cores = min(workers, cores)
+        print(f"{workers:>8} {concurrency:>8} {result['logins_per_second']:>10.1f} {result['logins_per_second'] / busy_cores:>10.1f} "
+              f"{result['statuses'].get(503, 0):>8}")
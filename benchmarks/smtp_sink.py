@@ -0,0 +1,98 @@
+import argparse
+import socketserver
+import threading
+import time
+
+class _SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """
+    Speak just enough SMTP to accept and discard messages
+    """
+
+    def _reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        # Stand in for the TCP/TLS handshake and login of a remote server
+        if self.server.connect_delay:
+            time.sleep(self.server.connect_delay)
+        self.server.count_connection()
+        self._reply("220 localhost SpeakEasy benchmark SMTP sink")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            command = line.decode("utf-8", "replace").strip().split(" ", 1)[0].upper()
+            if command == "EHLO":
+                self._reply("250-localhost")
+                self._reply("250 8BITMIME")
+            elif command == "RCPT" and any(address in line.decode("utf-8", "replace") for address in self.server.refuse_recipients):
+                self._reply("550 No such user")
+            elif command in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                self._reply("250 OK")
+            elif command == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b".\n", b""):
+                    pass
+                self.server.count_message()
+                self._reply("250 OK")
+            elif command == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+class SMTPSink(socketserver.ThreadingTCPServer):
+    """
+    Local SMTP server that accepts every message and only counts them
+
+    Point the app at it with SMTP_SERVER=127.0.0.1, SMTP_PORT=<port>,
+    SMTP_USE_SSL=false and an empty SMTP_PASSWORD. connect_delay (seconds)
+    delays the greeting of every new connection, to approximate the setup
+    cost of a real, remote SMTP server. Recipients in refuse_recipients are
+    rejected with a permanent 550 reply.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host="127.0.0.1", port=2525, connect_delay=0.0, refuse_recipients=()):
+        super().__init__((host, port), _SMTPSinkHandler)
+        self.connect_delay = connect_delay
+        self.refuse_recipients = set(refuse_recipients)
+        self.connections = 0
+        self.messages = 0
+        self._lock = threading.Lock()
+
+    def count_connection(self):
+        with self._lock:
+            self.connections += 1
+
+    def count_message(self):
+        with self._lock:
+            self.messages += 1
+
+    def start(self):
+        """
+        Serve in a daemon thread
+
+        Returns:
+            SMTPSink: This server
+        """
+        threading.Thread(target=self.serve_forever, name="smtp-sink", daemon=True).start()
+        return self
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run a local SMTP sink for benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2525)
+    parser.add_argument("--connect-delay-ms", type=float, default=0, help="delay before greeting each new connection")
+    args = parser.parse_args()
+
+    sink = SMTPSink(args.host, args.port, args.connect_delay_ms / 1000)
+    print(f"SMTP sink listening on {args.host}:{args.port}")
+    try:
+        sink.serve_forever()
+    except KeyboardInterrupt:
+        print(f"Accepted {sink.messages} messages")
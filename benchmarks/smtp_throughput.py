@@ -0,0 +1,77 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from benchmarks.smtp_sink import SMTPSink
+from services import email_service
+
+SUBJECT = "Session Booking Confirmation - SpeakEasy"
+BODY = "<html><body><p>Your session is booked.</p></body></html>" * 20
+
+def send_unpooled(to_email, subject, body):
+    """
+    Send the way send_email did before pooling: a new connection (and login,
+    when credentials are set) for every message
+    """
+    msg = MIMEMultipart()
+    msg["Subject"] = subject
+    msg["From"] = email_service.SMTP_EMAIL
+    msg["To"] = to_email
+    msg.attach(MIMEText(body, "html", "utf-8"))
+
+    server = email_service._open_smtp_connection()
+    try:
+        server.send_message(msg)
+    finally:
+        email_service._close_smtp_connection(server)
+
+def send_pooled(to_email, subject, body):
+    email_service.send_email(to_email, subject, body, is_html=True)
+
+def run(send, messages, concurrency):
+    """
+    Send messages from concurrency threads
+
+    Returns:
+        float: Messages per second
+    """
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda i: send(f"bench-user-{i}@example.com", SUBJECT, BODY), range(messages)))
+    return messages / (time.perf_counter() - started_at)
+
+def drain_pool():
+    # Close idle pooled connections so every run starts cold
+    while not email_service._smtp_idle_connections.empty():
+        email_service._close_smtp_connection(email_service._smtp_idle_connections.get_nowait())
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare pooled and unpooled SMTP throughput against a local sink")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=email_service.SMTP_POOL_SIZE,
+                        help="sending threads (pooled sends are capped at SMTP_POOL_SIZE connections)")
+    parser.add_argument("--connect-delay-ms", type=float, default=20,
+                        help="sink delay per new connection, approximating TLS handshake and login")
+    args = parser.parse_args()
+
+    sink = SMTPSink(port=0, connect_delay=args.connect_delay_ms / 1000).start()
+
+    # Point the email service at the sink
+    email_service.SMTP_SERVER, email_service.SMTP_PORT = sink.server_address
+    email_service.SMTP_USE_SSL = False
+    email_service.SMTP_PASSWORD = ""
+    email_service.SMTP_EMAIL = "noreply@example.com"
+
+    print(f"Sending {args.messages} messages from {args.concurrency} threads "
+          f"(pool size {email_service.SMTP_POOL_SIZE}, {args.connect_delay_ms:g}ms per new connection)")
+
+    results = {}
+    for name, send in (("unpooled", send_unpooled), ("pooled", send_pooled)):
+        drain_pool()
+        results[name] = run(send, args.messages, args.concurrency)
+        print(f"{name:<10} {results[name]:>10.1f} messages/s")
+
+    drain_pool()
+    sink.shutdown()
+    print(f"Pooled is {results['pooled'] / results['unpooled']:.1f}x unpooled; sink accepted {sink.messages} messages")
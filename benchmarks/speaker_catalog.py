@@ -0,0 +1,55 @@
+import argparse
+import time
+from bson import ObjectId
+from flask import Flask, g
+from config import mongo_client
+from services.speaker_service import SPEAKER_LISTING_FIELDS, get_all_speakers, iter_all_speakers
+
+# Database holding all collections
+db = mongo_client.speakeasy
+
+def get_speakers_one_by_one(limit):
+    """
+    Join a page of speakers the way get_all_speakers used to: one users
+    lookup per profile (an N+1 query)
+    """
+    speakers = []
+    for profile in db.speakers.find({}, SPEAKER_LISTING_FIELDS).sort("_id", 1).limit(limit):
+        user = db.users.find_one({"_id": ObjectId(profile["user_id"])}, {"first_name": 1, "last_name": 1, "email": 1})
+        if user:
+            speakers.append({**profile, **user})
+    return speakers
+
+def measure(app, name, func):
+    """
+    Run func in a request context, where the command listener tallies its commands
+
+    Returns:
+        tuple: (name, items returned, commands issued, milliseconds)
+    """
+    with app.test_request_context("/api/speakers"):
+        started_at = time.perf_counter()
+        items = func()
+        elapsed = (time.perf_counter() - started_at) * 1000
+        return name, len(items), g.get("mongo_commands", 0), elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count MongoDB round trips of the speaker catalog joins")
+    parser.add_argument("--page-sizes", default="10,50,200", help="comma separated page sizes")
+    args = parser.parse_args()
+
+    speaker_count = db.speakers.count_documents({})
+    print(f"{speaker_count} speaker profiles (generate more with: python -m benchmarks.generate_data --speakers 10000)")
+
+    app = Flask(__name__)
+    runs = []
+    for limit in (int(size) for size in args.page_sizes.split(",")):
+        runs.append(measure(app, f"page of {limit}, joined", lambda: get_all_speakers(limit)[0]))
+        runs.append(measure(app, f"page of {limit}, N+1", lambda: get_speakers_one_by_one(limit)))
+    runs.append(measure(app, "full catalog, streamed", lambda: list(iter_all_speakers())))
+    runs.append(measure(app, "full catalog, N+1", lambda: get_speakers_one_by_one(0)))
+
+    # getMore batches are not counted, as for the per-request query budgets
+    print(f"{'query':<28} {'speakers':>9} {'commands':>9} {'ms':>9}")
+    for name, items, commands, elapsed in runs:
+        print(f"{name:<28} {items:>9} {commands:>9} {elapsed:>9.1f}")
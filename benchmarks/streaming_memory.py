@@ -0,0 +1,73 @@
+import argparse
+import json
+import resource
+import subprocess
+import sys
+from bson import ObjectId
+from flask import Flask, jsonify
+from benchmarks.dataset import EXPERTISE, FIRST_NAMES, LAST_NAMES, speaker_email
+from utils.streaming import stream_json_array
+
+def speaker_documents(count):
+    """
+    Yield listing items shaped like GET /speakers entries, as a cursor would
+    """
+    for index in range(count):
+        yield {
+            "profile_id": str(ObjectId()),
+            "user_id": str(ObjectId()),
+            "first_name": FIRST_NAMES[index % len(FIRST_NAMES)],
+            "last_name": LAST_NAMES[index % len(LAST_NAMES)],
+            "email": speaker_email(index),
+            "expertise": EXPERTISE[index % len(EXPERTISE)],
+            "price_per_session": 50.0 + index % 100,
+            "rating_average": 4.2,
+            "rating_count": 12,
+            "rating_histogram": {"4": 8, "5": 4}
+        }
+
+def _peak_rss_mb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def measure(mode, items):
+    """
+    Build one response for items in this process and drain its body
+
+    Peak RSS only ever grows, so each mode must run in a fresh process.
+
+    Returns:
+        dict: Peak RSS before and after, and the body size
+    """
+    app = Flask(__name__)
+    with app.test_request_context("/api/speakers"):
+        before = _peak_rss_mb()
+        if mode == "buffered":
+            response = jsonify({"speakers": list(speaker_documents(items)), "count": items})
+        else:
+            response = stream_json_array("speakers", speaker_documents(items))
+
+        body_bytes = sum(len(chunk) for chunk in response.iter_encoded())
+
+    return {"mode": mode, "before_mb": before, "peak_mb": _peak_rss_mb(), "body_bytes": body_bytes}
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare peak RSS of buffered and streamed listing responses")
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--mode", choices=["buffered", "streamed"], help="measure one mode in this process (used internally)")
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(measure(args.mode, args.items)))
+        sys.exit(0)
+
+    print(f"{'mode':<10} {'peak RSS MB':>12} {'growth MB':>10} {'body MB':>8}")
+    for mode in ("buffered", "streamed"):
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.streaming_memory", "--mode", mode, "--items", str(args.items)],
+            check=True, capture_output=True, text=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:<10} {result['peak_mb']:>12.1f} {result['peak_mb'] - result['before_mb']:>10.1f} "
+              f"{result['body_bytes'] / 1e6:>8.1f}")
@@ -0,0 +1,72 @@
+import argparse
+import os
+import timeit
+from utils.template_engine import TEMPLATE_DIR, get_template, render_template
+
+# Each email template with a representative context
+SAMPLE_CONTEXTS = {
+    "emails/booking_confirmation_user.html": {
+        "speaker_name": "Alex Rogers", "session_date": "2030-01-15", "session_time": "10:00"
+    },
+    "emails/booking_confirmation_speaker.html": {
+        "speaker_name": "Alex Rogers", "session_date": "2030-01-15", "session_time": "10:00",
+        "user_name": "Sam Patel", "user_email": "sam@example.com"
+    },
+    "emails/feedback_confirmation.html": {
+        "recipient_name": "Sam Patel", "speaker_name": "Alex Rogers", "session_date": "2030-01-15",
+        "session_time": "10:00", "rating": 4, "feedback_text": "Clear, practical & well paced <3"
+    },
+    "emails/feedback_confirmation_speaker.html": {
+        "speaker_name": "Alex Rogers", "session_date": "2030-01-15", "session_time": "10:00",
+        "user_name": "Sam Patel", "rating": 4, "feedback_text": "Clear, practical & well paced <3"
+    },
+    "emails/session_reminder.html": {
+        "recipient_name": "Sam Patel", "speaker_name": "Alex Rogers", "session_date": "2030-01-15",
+        "session_time": "10:00", "session_topic": "Public Speaking", "session_location": "Online Meeting",
+        "calendar_link": "https://calendar.google.com/calendar/render?action=TEMPLATE&text=SpeakEasy"
+    }
+}
+
+def render_by_replacing(name, **context):
+    """
+    Render the way emails were built before the template engine: read the
+    file on every call and run one str.replace pass per placeholder
+
+    Conditionals and loops are left unrendered, so this baseline does less
+    work than the old code did.
+    """
+    with open(os.path.join(TEMPLATE_DIR, name), "r", encoding="utf-8") as file:
+        html = file.read()
+    for key, value in context.items():
+        html = html.replace("{{ " + key + " }}", str(value))
+    return html
+
+def benchmark(number):
+    """
+    Time rendering every sample template with the engine and with the baseline
+
+    Args:
+        number (int): Renders per template and method
+
+    Returns:
+        list: (template, engine microseconds per render, baseline microseconds per render)
+    """
+    results = []
+    for name, context in SAMPLE_CONTEXTS.items():
+        # Compile outside the timed loop, as happens on the first email sent
+        get_template(name)
+
+        engine = timeit.timeit(lambda: render_template(name, **context), number=number)
+        baseline = timeit.timeit(lambda: render_by_replacing(name, **context), number=number)
+        results.append((name, engine / number * 1e6, baseline / number * 1e6))
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Microbenchmark email template rendering")
+    parser.add_argument("--number", type=int, default=20000, help="renders per template and method")
+    args = parser.parse_args()
+
+    print(f"{'template':<42} {'engine us':>10} {'read+replace us':>16} {'speedup':>8}")
+    for name, engine, baseline in benchmark(args.number):
+        print(f"{name:<42} {engine:>10.1f} {baseline:>16.1f} {baseline / engine:>7.1f}x")
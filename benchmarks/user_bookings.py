@@ -0,0 +1,85 @@
+import argparse
+import time
+from bson import ObjectId
+from flask import Flask, g
+from config import mongo_client
+from services.booking_service import USER_BOOKINGS_SORT, get_user_bookings, iter_user_bookings
+
+# Database holding all collections
+db = mongo_client.speakeasy
+
+def get_user_bookings_one_by_one(user_id, limit=0):
+    """
+    Join a user's bookings the way get_user_bookings used to: a session,
+    speaker user and speaker profile lookup per booking (an N+1 query)
+    """
+    bookings = []
+    # Sorted by the database as well, so a page holds the same bookings as the batched join's
+    for booking in db.bookings.find({"user_id": user_id, "cleared": {"$ne": True}}).sort(USER_BOOKINGS_SORT).limit(limit):
+        session = db.sessions.find_one({"_id": ObjectId(booking["session_id"])})
+        if session:
+            speaker = db.users.find_one({"_id": ObjectId(session["speaker_id"])})
+            speaker_profile = db.speakers.find_one({"user_id": session["speaker_id"]})
+            if speaker and speaker_profile:
+                bookings.append({**booking, "date": session["date"], "time": session["time"]})
+    return sorted(bookings, key=lambda booking: (booking["date"], booking["time"]))
+
+def most_booked_user():
+    """
+    Get the ID of the user with the most bookings, and their booking count
+    """
+    top = next(db.bookings.aggregate([
+        {"$group": {"_id": "$user_id", "bookings": {"$sum": 1}}},
+        {"$sort": {"bookings": -1}},
+        {"$limit": 1}
+    ]), None)
+    if not top:
+        raise SystemExit("No bookings found; generate some with: python -m benchmarks.generate_data --bookings 20000")
+    return top["_id"], top["bookings"]
+
+def measure(app, name, func, repeat):
+    """
+    Run func repeat times, each in a request context where the command listener tallies its commands
+
+    Returns:
+        tuple: (name, items returned, commands per run, p50 ms, p95 ms)
+    """
+    timings = []
+    for _ in range(repeat):
+        with app.test_request_context("/api/my-bookings"):
+            started_at = time.perf_counter()
+            items = func()
+            timings.append((time.perf_counter() - started_at) * 1000)
+            commands = g.get("mongo_commands", 0)
+
+    timings.sort()
+    p50 = timings[len(timings) // 2]
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    return name, len(items), commands, p50, p95
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare round trips and latency of the batched and per-booking user booking joins")
+    parser.add_argument("--user-id", help="user to list bookings for (defaults to the user with the most bookings)")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=50, help="runs per variant, for the latency percentiles")
+    args = parser.parse_args()
+
+    if args.user_id:
+        user_id, booking_count = args.user_id, db.bookings.count_documents({"user_id": args.user_id})
+    else:
+        user_id, booking_count = most_booked_user()
+    print(f"User {user_id} has {booking_count} bookings")
+
+    app = Flask(__name__)
+    limit = args.page_size
+    runs = [
+        measure(app, f"page of {limit}, batched", lambda: get_user_bookings(user_id, limit)[0], args.repeat),
+        measure(app, f"page of {limit}, N+1", lambda: get_user_bookings_one_by_one(user_id, limit), args.repeat),
+        measure(app, "all bookings, streamed", lambda: list(iter_user_bookings(user_id)), args.repeat),
+        measure(app, "all bookings, N+1", lambda: get_user_bookings_one_by_one(user_id), args.repeat)
+    ]
+
+    # getMore batches are not counted, as for the per-request query budgets
+    print(f"{'query':<26} {'bookings':>9} {'commands':>9} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, items, commands, p50, p95 in runs:
+        print(f"{name:<26} {items:>9} {commands:>9} {p50:>9.1f} {p95:>9.1f}")
@@ -1,13 +1,114 @@
 import os
+import threading
 from pymongo import MongoClient
+from pymongo.database import Database
 from pymongo.server_api import ServerApi
 from dotenv import load_dotenv
 
-# Load environment variables
+# Load environment variables, once per process; modules that read settings
+# at import time import config first
 load_dotenv()
 
+from utils.metrics import mongo_command_listener
+
 # Get MongoDB URI from environment
 mongo_uri = os.getenv("MONGO_URI")
 
-# Initialize MongoDB client
-mongo_client = MongoClient(mongo_uri, server_api=ServerApi('1')) 
\ No newline at end of file
+# Get JWT secret from environment
+JWT_SECRET = os.getenv("JWT_SECRET")
+
+# MongoDB connection pool and timeout settings (per process)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_CONNECTING = int(os.getenv("MONGO_MAX_CONNECTING", "2"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "30000"))
+
+# The current process's client; a forked worker creates its own
+_client = None
+_client_pid = None
+_client_lock = threading.Lock()
+
+def get_mongo_client():
+    """
+    Get this process's MongoClient, creating it on first use
+
+    MongoClient is not fork-safe, so a client created before a fork
+    (e.g. in a preloading server's master) is never reused by the child.
+    The client connects lazily, and MONGO_MAX_CONNECTING caps concurrent
+    connection setup so workers do not open a burst of connections at boot.
+
+    Returns:
+        MongoClient: Client for the current process
+    """
+    global _client, _client_pid
+
+    pid = os.getpid()
+    if _client is None or _client_pid != pid:
+        with _client_lock:
+            if _client is None or _client_pid != pid:
+                _client = MongoClient(
+                    mongo_uri,
+                    server_api=ServerApi('1'),
+                    event_listeners=[mongo_command_listener],
+                    maxPoolSize=MONGO_MAX_POOL_SIZE,
+                    minPoolSize=MONGO_MIN_POOL_SIZE,
+                    maxConnecting=MONGO_MAX_CONNECTING,
+                    serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                    connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+                    socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+                    connect=False
+                )
+                _client_pid = pid
+
+    return _client
+
+class _LazyCollection:
+    """
+    Collection handle resolved against the current process's client on use
+    """
+
+    def __init__(self, database_name, name):
+        self._database_name = database_name
+        self._name = name
+
+    def _collection(self):
+        return get_mongo_client()[self._database_name][self._name]
+
+    def __getattr__(self, name):
+        return getattr(self._collection(), name)
+
+class _LazyDatabase:
+    """
+    Database handle whose collections are resolved on use
+    """
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, name):
+        # Database methods and properties, everything else is a collection name
+        if hasattr(Database, name):
+            return getattr(get_mongo_client()[self._name], name)
+        return _LazyCollection(self._name, name)
+
+    def __getitem__(self, name):
+        return _LazyCollection(self._name, name)
+
+class _LazyMongoClient:
+    """
+    Stand-in for a MongoClient that defers creating it until first use
+    """
+
+    def __getattr__(self, name):
+        # Client methods and properties, everything else is a database name
+        if hasattr(MongoClient, name):
+            return getattr(get_mongo_client(), name)
+        return _LazyDatabase(name)
+
+    def __getitem__(self, name):
+        return _LazyDatabase(name)
+
+# MongoDB client used across the services; safe to import before forking
+mongo_client = _LazyMongoClient()
@@ -0,0 +1,37 @@
+import multiprocessing
+import os
+from dotenv import load_dotenv
+
+# Gunicorn settings for production: gunicorn wsgi:app
+# Read .env here too, since the settings below are evaluated before the app is loaded
+load_dotenv()
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# One process per core, each serving requests on a thread pool. Handlers
+# mostly wait on MongoDB, and bcrypt runs in its own pool and releases the GIL.
+workers = int(os.getenv("WEB_CONCURRENCY", str(multiprocessing.cpu_count())))
+# Let the app size its per-process pools (e.g. the bcrypt hasher) to its share of the cores
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "8"))
+
+# Load the app once in the master so workers fork fast; loading does no network I/O.
+# Each worker creates its own MongoClient on first use (see config.get_mongo_client).
+preload_app = True
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers now and then to bound memory growth, staggered so they do not restart together
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "10000"))
+max_requests_jitter = max_requests // 10
+
+accesslog = "-"
+
+def post_worker_init(worker):
+    # Threads do not survive the fork, so start the startup checks, email workers and schedulers in each worker.
+    # Migrations are not run here (workers restart every max_requests); run python -m app migrate once per deploy.
+    from app import start_background_services
+    start_background_services()
@@ -1,11 +1,13 @@
 from flask import Blueprint, request, jsonify
-from services.auth_service import email_exists, save_user, authenticate_user, verify_otp
+from services.auth_service import save_user, authenticate_user, verify_otp, PasswordHasherBusy, EmailAlreadyExists
 from utils.auth_middleware import token_required, role_required
+from utils.query_budget import query_budget
 
 # Create a new Blueprint for authentication routes
 auth_bp = Blueprint('auth', __name__)
 
 @auth_bp.route('/signup', methods=['POST'])
+@query_budget(2)
 def signup():
     # Get request data
     data = request.get_json()
@@ -20,10 +22,6 @@ def signup():
     if data['role'] not in ['user', 'speaker']:
         return jsonify({'error': 'Role must be either "user" or "speaker"'}), 400
     
-    # Check if email already exists
-    if email_exists(data['email']):
-        return jsonify({'error': 'Email already exists'}), 409
-    
     # Create user object
     user = {
         'first_name': data['first_name'],
@@ -34,7 +32,12 @@ def signup():
     }
     
     # Save user to database
-    user_id = save_user(user)
+    try:
+        user_id = save_user(user)
+    except EmailAlreadyExists as e:
+        return jsonify({'error': str(e)}), 409
+    except PasswordHasherBusy as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     
     # Return success response
     return jsonify({
@@ -43,6 +46,7 @@ def signup():
     }), 201
 
 @auth_bp.route('/verify-otp', methods=['POST'])
+@query_budget(2)
 def verify_user_otp():
     """
     Verify user's OTP and set account as verified
@@ -68,6 +72,7 @@ def verify_user_otp():
         }), 400
 
 @auth_bp.route('/login', methods=['POST'])
+@query_budget(2)
 def login():
     # Get request data
     data = request.get_json()
@@ -89,11 +94,14 @@ def login():
             'message': 'Login successful',
             'token': token
         }), 200
+    except PasswordHasherBusy as e:
+        return jsonify({'error': str(e)}), 503, {'Retry-After': '1'}
     except ValueError as e:
         return jsonify({'error': str(e)}), 401
 
 # Test protected route
 @auth_bp.route('/profile', methods=['GET'])
+@query_budget(0)
 @token_required
 def get_profile():
     # Access user info from the token
@@ -109,6 +117,7 @@ def get_profile():
 
 # Test role-specific route (speaker only)
 @auth_bp.route('/speaker-only', methods=['GET'])
+@query_budget(0)
 @role_required(['speaker'])
 def speaker_only():
     return jsonify({
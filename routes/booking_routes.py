@@ -1,10 +1,17 @@
 from flask import Blueprint, request, jsonify
 from utils.auth_middleware import token_required, role_required
+from utils.query_budget import query_budget
+from utils.pagination import parse_page_args
+from utils.streaming import stream_json_array
 from services.booking_service import (
+    AVAILABLE_SESSIONS_CACHE_TTL_SECONDS,
     create_session,
+    get_available_sessions,
     book_session,
     get_user_bookings,
     get_speaker_bookings,
+    iter_user_bookings,
+    iter_speaker_bookings,
     cancel_booking,
     submit_feedback,
     clear_past_sessions
@@ -15,7 +22,7 @@ from datetime import datetime
 booking_bp = Blueprint('booking', __name__)
 
 @booking_bp.route('/speaker/create-session', methods=['POST'])
-@token_required
+@query_budget(2)
 @role_required(["speaker"])
 def create_speaker_session():
     """
@@ -78,8 +85,54 @@ def create_speaker_session():
     except Exception as e:
         return jsonify({'error': 'Failed to create session'}), 500
 
-@booking_bp.route('/book-session', methods=['POST'])
+@booking_bp.route('/sessions/available', methods=['GET'])
+@query_budget(4)
 @token_required
+def get_bookable_sessions():
+    """
+    List upcoming sessions with free seats
+    
+    Query parameters (all optional):
+    - speaker_id: Only sessions of this speaker
+    - date_from / date_to: Date range in YYYY-MM-DD format
+    - expertise: Words to match against the speaker's expertise
+    - limit / cursor: Pagination
+    """
+    # Validate date formats (YYYY-MM-DD)
+    for field in ['date_from', 'date_to']:
+        if field in request.args:
+            try:
+                datetime.strptime(request.args[field], '%Y-%m-%d')
+            except ValueError:
+                return jsonify({'error': f'Invalid {field} format. Use YYYY-MM-DD'}), 400
+    
+    try:
+        limit, cursor = parse_page_args(request.args)
+        
+        # Get available sessions
+        sessions, next_cursor = get_available_sessions(
+            speaker_id=request.args.get('speaker_id'),
+            date_from=request.args.get('date_from'),
+            date_to=request.args.get('date_to'),
+            expertise=request.args.get('expertise'),
+            limit=limit,
+            cursor=cursor
+        )
+        
+        # Return sessions, clients may reuse them briefly
+        return jsonify({
+            'sessions': sessions,
+            'count': len(sessions),
+            'next_cursor': next_cursor
+        }), 200, {'Cache-Control': f'private, max-age={AVAILABLE_SESSIONS_CACHE_TTL_SECONDS}'}
+        
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': 'Failed to fetch available sessions'}), 500
+
+@booking_bp.route('/book-session', methods=['POST'])
+@query_budget(6)
 @role_required(["user"])
 def book_speaker_session():
     """
@@ -112,6 +165,7 @@ def book_speaker_session():
         return jsonify({'error': 'Failed to book session'}), 500
 
 @booking_bp.route('/my-bookings', methods=['GET'])
+@query_budget(4)
 @token_required
 def get_bookings():
     """
@@ -120,29 +174,45 @@ def get_bookings():
     This endpoint returns:
     - For users: List of sessions they have booked
     - For speakers: List of their sessions with booking details
+    
+    Results are ordered by date and time and paginated: pass the returned
+    next_cursor as ?cursor= to get the next page, and ?limit= to set the page size.
+    
+    With ?stream=true the full history is streamed instead of paginated.
     """
     try:
         # Get user info from token
         user_id = request.user.get('id')
         user_role = request.user.get('role')
         
+        # Stream the whole history straight from the database cursor
+        if request.args.get('stream') == 'true':
+            if user_role == "speaker":
+                return stream_json_array('bookings', iter_speaker_bookings(user_id))
+            return stream_json_array('bookings', iter_user_bookings(user_id))
+        
+        limit, cursor = parse_page_args(request.args)
+        
         # Get bookings based on role
         if user_role == "speaker":
-            bookings = get_speaker_bookings(user_id)
+            bookings, next_cursor = get_speaker_bookings(user_id, limit, cursor)
         else:
-            bookings = get_user_bookings(user_id)
+            bookings, next_cursor = get_user_bookings(user_id, limit, cursor)
         
         # Return bookings
         return jsonify({
             'bookings': bookings,
-            'count': len(bookings)
+            'count': len(bookings),
+            'next_cursor': next_cursor
         }), 200
         
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': 'Failed to fetch bookings'}), 500
 
 @booking_bp.route('/cancel-booking', methods=['POST'])
-@token_required
+@query_budget(5)
 @role_required(["user"])
 def cancel_user_booking():
     """
@@ -175,7 +245,7 @@ def cancel_user_booking():
         return jsonify({'error': 'Failed to cancel booking'}), 500
 
 @booking_bp.route('/submit-feedback', methods=['POST'])
-@token_required
+@query_budget(9)
 @role_required(["user"])
 def submit_session_feedback():
     """
@@ -220,6 +290,7 @@ def submit_session_feedback():
         return jsonify({'error': 'Failed to submit feedback'}), 500
 
 @booking_bp.route('/clear-past-sessions', methods=['POST'])
+@query_budget(3)
 @token_required
 def clear_past_sessions_route():
     """
@@ -1,12 +1,21 @@
 from flask import Blueprint, request, jsonify
 from utils.auth_middleware import token_required, role_required
-from services.speaker_service import create_or_update_speaker_profile, get_speaker_profile, get_all_speakers
+from utils.query_budget import query_budget
+from services.speaker_service import (
+    create_or_update_speaker_profile,
+    get_speaker_profile,
+    get_speaker_catalog,
+    iter_all_speakers,
+    search_speakers
+)
+from utils.pagination import parse_page_args
+from utils.streaming import stream_json_array
 
 # Create a new Blueprint for speaker routes
 speaker_bp = Blueprint('speaker', __name__)
 
 @speaker_bp.route('/speaker/profile', methods=['POST'])
-@token_required
+@query_budget(3)
 @role_required(["speaker"])
 def create_profile():
     """
@@ -54,7 +63,7 @@ def create_profile():
     }), 201
 
 @speaker_bp.route('/speaker/profile', methods=['GET'])
-@token_required
+@query_budget(1)
 @role_required(["speaker"])
 def get_profile():
     """
@@ -83,18 +92,85 @@ def get_profile():
     }), 200
 
 @speaker_bp.route('/speakers', methods=['GET'])
+@query_budget(2)
 @token_required
 def get_speakers():
     """
     Get all available speakers
     
     This endpoint allows users to browse all available speakers and their profiles.
+    Results are paginated: pass the returned next_cursor as ?cursor= to get the
+    next page, and ?limit= to set the page size.
+    Clients can send If-None-Match with the last ETag to get a 304 when nothing changed.
+    
+    With ?stream=true the full catalog is streamed instead of paginated.
     """
-    # Get all speaker profiles with user information
-    speakers = get_all_speakers()
+    # Stream the whole catalog straight from the database cursor
+    if request.args.get('stream') == 'true':
+        return stream_json_array('speakers', iter_all_speakers())
+    
+    # Get one page of speaker profiles with user information
+    try:
+        limit, cursor = parse_page_args(request.args)
+        speakers, next_cursor, etag = get_speaker_catalog(limit, cursor)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Let the client reuse its copy if it is still current
+    if etag in request.if_none_match:
+        return '', 304, {'ETag': f'"{etag}"'}
     
     # Return list of speakers
+    response = jsonify({
+        'speakers': speakers,
+        'count': len(speakers),
+        'next_cursor': next_cursor
+    })
+    response.set_etag(etag)
+    return response, 200
+
+@speaker_bp.route('/speakers/search', methods=['GET'])
+@query_budget(2)
+@token_required
+def search_speaker_catalog():
+    """
+    Search speakers
+    
+    This endpoint lets users find speakers without downloading the whole catalog.
+    
+    Query parameters (all optional):
+    - q: Words to match against expertise and speaker names
+    - min_price / max_price: Price per session range
+    - sort: "price" (default) or "rating"
+    - order: "asc" (default) or "desc"
+    - limit / cursor: Pagination, as for GET /speakers
+    """
+    # Validate price range
+    try:
+        min_price = float(request.args['min_price']) if 'min_price' in request.args else None
+        max_price = float(request.args['max_price']) if 'max_price' in request.args else None
+    except ValueError:
+        return jsonify({'error': 'min_price and max_price must be valid numbers'}), 400
+    
+    try:
+        limit, cursor = parse_page_args(request.args)
+        
+        # Search speaker profiles in the database
+        speakers, next_cursor = search_speakers(
+            text=request.args.get('q'),
+            min_price=min_price,
+            max_price=max_price,
+            sort=request.args.get('sort', 'price'),
+            order=request.args.get('order', 'asc'),
+            limit=limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    # Return matching speakers
     return jsonify({
         'speakers': speakers,
-        'count': len(speakers)
-    }), 200 
\ No newline at end of file
+        'count': len(speakers),
+        'next_cursor': next_cursor
+    }), 200
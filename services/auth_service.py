@@ -1,5 +1,9 @@
 import bcrypt
+import os
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pymongo.errors import DuplicateKeyError
 from config import mongo_client
 from utils.jwt_handler import generate_token
 from services.email_service import send_otp_email
@@ -7,22 +11,56 @@ from services.email_service import send_otp_email
 # Database collection
 users_collection = mongo_client.speakeasy.users
 
-# Hash password using bcrypt
-def hash_password(password):
-    salt = bcrypt.gensalt()
+# Password hashing configuration
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+# Each server process gets its share of the cores (gunicorn.conf.py exports WEB_CONCURRENCY)
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(max(1, (os.cpu_count() or 1) // WEB_CONCURRENCY))))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", str(PASSWORD_HASH_WORKERS * 4)))
+
+# bcrypt releases the GIL, so a thread pool hashes on all cores
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_password_slots = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashing jobs are already queued"""
+
+class EmailAlreadyExists(Exception):
+    """Raised when signing up with an email that is already registered"""
+
+# Run a bcrypt job on the password executor, rejecting it if the queue is full
+def _run_password_job(func, *args):
+    if not _password_slots.acquire(blocking=False):
+        raise PasswordHasherBusy("Server is busy, please try again shortly")
+    
+    try:
+        return _password_executor.submit(func, *args).result()
+    finally:
+        _password_slots.release()
+
+def _hash_password(password):
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
-# Verify password using bcrypt
-def verify_password(plain_password, hashed_password):
+def _verify_password(plain_password, hashed_password):
     return bcrypt.checkpw(
         plain_password.encode('utf-8'), 
         hashed_password.encode('utf-8')
     )
 
-# Check if email already exists
-def email_exists(email):
-    return users_collection.find_one({"email": email}) is not None
+# Hash password using bcrypt
+def hash_password(password):
+    return _run_password_job(_hash_password, password)
+
+# Verify password using bcrypt
+def verify_password(plain_password, hashed_password):
+    return _run_password_job(_verify_password, plain_password, hashed_password)
+
+# Check if a stored hash was created with a different cost factor
+def needs_rehash(hashed_password):
+    # bcrypt hashes look like $2b$<rounds>$<salt+hash>
+    return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
 
 # Generate a random 6-digit OTP
 def generate_otp():
@@ -38,10 +76,13 @@ def save_user(user_data):
     user_data["otp"] = otp
     user_data["is_verified"] = False
     
-    # Insert into MongoDB
-    result = users_collection.insert_one(user_data)
+    # Insert into MongoDB, the unique email index rejects duplicate accounts
+    try:
+        result = users_collection.insert_one(user_data)
+    except DuplicateKeyError:
+        raise EmailAlreadyExists("Email already exists")
     
-    # Send OTP email
+    # Queue OTP email, the outbox workers deliver it after the response
     send_otp_email(user_data["email"], otp, user_data["first_name"])
     
     # Return the inserted user's ID
@@ -85,6 +126,17 @@ def authenticate_user(email, password):
     if not verify_password(password, user["password"]):
         return None
     
+    # Transparently upgrade the hash if the cost factor changed; when the
+    # hasher is busy the upgrade waits for a later login, the user is already verified
+    if needs_rehash(user["password"]):
+        try:
+            users_collection.update_one(
+                {"_id": user["_id"]},
+                {"$set": {"password": hash_password(password)}}
+            )
+        except PasswordHasherBusy:
+            print(f"Skipped password rehash for user {user['_id']}, hasher busy")
+    
     # Generate token payload
     payload = {
         "id": str(user["_id"]),
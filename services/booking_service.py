@@ -1,13 +1,46 @@
-from datetime import datetime
+import os
+import threading
+from time import sleep
+from datetime import datetime, timedelta
 from bson import ObjectId
+from pymongo import ReturnDocument, UpdateMany
+from pymongo.errors import DuplicateKeyError
 from config import mongo_client
 from services.email_service import send_booking_confirmation, send_feedback_confirmation
+from services.speaker_service import record_speaker_rating, invalidate_speaker_catalog
+from utils.pagination import DEFAULT_PAGE_SIZE, encode_cursor, decode_cursor, cursor_object_id, keyset_filter
+from utils.streaming import STREAM_BATCH_SIZE, iter_batches
+from utils.cache import TTLCache
+from utils.metrics import register_cache
 
 # Database collections
 sessions_collection = mongo_client.speakeasy.sessions
 bookings_collection = mongo_client.speakeasy.bookings
 users_collection = mongo_client.speakeasy.users
 speakers_collection = mongo_client.speakeasy.speakers
+scheduled_jobs_collection = mongo_client.speakeasy.scheduled_jobs
+
+# Past booking cleanup configuration
+CLEANUP_BATCH_SIZE = int(os.getenv("CLEANUP_BATCH_SIZE", "500"))
+CLEANUP_INTERVAL_SECONDS = int(os.getenv("CLEANUP_INTERVAL_SECONDS", "86400"))
+# Days after a session before its bookings are cleared, leaving time for feedback
+CLEANUP_AFTER_DAYS = int(os.getenv("CLEANUP_AFTER_DAYS", "30"))
+# How often each process checks whether the cleanup is due
+CLEANUP_POLL_SECONDS = min(CLEANUP_INTERVAL_SECONDS, 600)
+
+# Short-lived cache of available session listings
+AVAILABLE_SESSIONS_CACHE_TTL_SECONDS = int(os.getenv("AVAILABLE_SESSIONS_CACHE_TTL_SECONDS", "15"))
+available_sessions_cache = TTLCache(1024, AVAILABLE_SESSIONS_CACHE_TTL_SECONDS)
+register_cache("available_sessions", available_sessions_cache)
+
+# Sort orders of the paged listings, each matching an index and the keyset cursor
+AVAILABLE_SESSIONS_SORT = [("date", 1), ("time", 1), ("_id", 1)]
+USER_BOOKINGS_SORT = [("session_date", 1), ("session_time", 1), ("_id", 1)]
+SPEAKER_SESSIONS_SORT = [("date", 1), ("time", 1)]
+
+# Cleanup scheduler state
+_cleanup_lock = threading.Lock()
+_cleanup_thread = None
 
 def create_session(speaker_id, date, time, max_seats):
     """
@@ -57,13 +90,178 @@ def create_session(speaker_id, date, time, max_seats):
         "date": date,
         "time": time,
         "max_seats": max_seats,
-        "seats_booked": 0
+        "seats_booked": 0,
+        "seats_available": max_seats,
+        "bookings_cleared": False
     }
     
-    # Insert session
-    result = sessions_collection.insert_one(session)
+    # Insert session, the unique (speaker_id, date, time) index rejects concurrent duplicates
+    try:
+        result = sessions_collection.insert_one(session)
+    except DuplicateKeyError:
+        raise ValueError("You already have a session scheduled at this date and time")
     return str(result.inserted_id)
 
+def _available_sessions_filter(now, date_from=None, date_to=None, speaker_ids=None, after=None):
+    """
+    Build the filter for upcoming sessions with free seats
+    
+    Args:
+        now (datetime): Current local time; sessions that started are left out
+        date_from (str, optional): Earliest session date in YYYY-MM-DD format
+        date_to (str, optional): Latest session date in YYYY-MM-DD format
+        speaker_ids (list, optional): Only match these speakers' sessions
+        after (list, optional): Decoded cursor, (date, time, _id) of the last session of the previous page
+        
+    Returns:
+        dict: MongoDB filter
+        
+    Raises:
+        ValueError: If the cursor holds an invalid ID
+    """
+    start_date, start_time = now.strftime("%Y-%m-%d"), now.strftime("%H:%M")
+    if date_from and date_from > start_date:
+        start_date, start_time = date_from, "00:00"
+    
+    # Only sessions that haven't started yet and have free seats
+    conditions = [
+        {"date": {"$gte": start_date}, "seats_available": {"$gt": 0}, "cleared": {"$ne": True}},
+        {"$or": [{"date": {"$gt": start_date}}, {"time": {"$gte": start_time}}]}
+    ]
+    
+    if date_to:
+        conditions.append({"date": {"$lte": date_to}})
+    
+    if speaker_ids is not None:
+        conditions.append({"speaker_id": {"$in": speaker_ids}})
+    
+    # Resume after the last session of the previous page
+    if after:
+        conditions.append(keyset_filter(["date", "time", "_id"], [after[0], after[1], cursor_object_id(after[2])]))
+    
+    return {"$and": conditions}
+
+def get_available_sessions(speaker_id=None, date_from=None, date_to=None, expertise=None,
+                           limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    Get a page of upcoming sessions that still have free seats
+    
+    The query always requires seats_available > 0, so it is served by the
+    partial (date, time, _id) index that only contains sessions with free
+    seats; full and past sessions are never scanned.
+    
+    Args:
+        speaker_id (str, optional): Only return this speaker's sessions
+        date_from (str, optional): Earliest session date in YYYY-MM-DD format
+        date_to (str, optional): Latest session date in YYYY-MM-DD format
+        expertise (str, optional): Words to match against the speaker's expertise
+        limit (int): Maximum number of sessions to return
+        cursor (str, optional): Cursor returned with the previous page
+        
+    Returns:
+        tuple: (list of available sessions with speaker details, next page cursor or None)
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    # Listings are briefly cached since seat counts change often
+    cache_key = (speaker_id, date_from, date_to, expertise, limit, cursor)
+    cached = available_sessions_cache.get(cache_key)
+    if cached:
+        return cached
+    
+    # Restrict to speakers matching the expertise filter
+    speaker_ids = None
+    if expertise:
+        speaker_ids = [
+            profile["user_id"]
+            for profile in speakers_collection.find({"$text": {"$search": expertise}}, {"user_id": 1})
+        ]
+    if speaker_id:
+        speaker_ids = [speaker_id] if speaker_ids is None or speaker_id in speaker_ids else []
+    
+    available_sessions = list(
+        sessions_collection.find(
+            _available_sessions_filter(datetime.now(), date_from, date_to, speaker_ids, decode_cursor(cursor, 3)),
+            {"speaker_id": 1, "date": 1, "time": 1, "max_seats": 1, "seats_available": 1}
+        )
+        .sort(AVAILABLE_SESSIONS_SORT)
+        .limit(limit)
+    )
+    
+    # Fetch the speakers' user records and profiles in one query each
+    page_speaker_ids = list({session["speaker_id"] for session in available_sessions})
+    speakers = {
+        str(speaker["_id"]): speaker
+        for speaker in users_collection.find(
+            {"_id": {"$in": [ObjectId(user_id) for user_id in page_speaker_ids]}},
+            {"first_name": 1, "last_name": 1}
+        )
+    }
+    speaker_profiles = {
+        profile["user_id"]: profile
+        for profile in speakers_collection.find(
+            {"user_id": {"$in": page_speaker_ids}},
+            {"user_id": 1, "expertise": 1, "price_per_session": 1}
+        )
+    }
+    
+    sessions = []
+    for session in available_sessions:
+        speaker = speakers.get(session["speaker_id"])
+        speaker_profile = speaker_profiles.get(session["speaker_id"])
+        
+        if speaker and speaker_profile:
+            sessions.append({
+                "session_id": str(session["_id"]),
+                "speaker_id": session["speaker_id"],
+                "speaker_name": f"{speaker['first_name']} {speaker['last_name']}",
+                "expertise": speaker_profile["expertise"],
+                "price_per_session": speaker_profile["price_per_session"],
+                "date": session["date"],
+                "time": session["time"],
+                "max_seats": session["max_seats"],
+                "seats_available": session["seats_available"]
+            })
+    
+    # A full page means there may be more sessions
+    next_cursor = None
+    if len(available_sessions) == limit:
+        last = available_sessions[-1]
+        next_cursor = encode_cursor([last["date"], last["time"], str(last["_id"])])
+    
+    available_sessions_cache.set(cache_key, (sessions, next_cursor))
+    return sessions, next_cursor
+
+def backfill_seats_available():
+    """
+    Set seats_available on sessions created before it was maintained
+    
+    Returns:
+        int: Number of sessions updated
+    """
+    result = sessions_collection.update_many(
+        {"seats_available": {"$exists": False}},
+        [{"$set": {"seats_available": {"$subtract": ["$max_seats", "$seats_booked"]}}}]
+    )
+    return result.modified_count
+
+def backfill_bookings_cleared():
+    """
+    Set bookings_cleared to False on sessions created before it was stored
+    
+    The cleanup job only looks at sessions with bookings_cleared False,
+    which is what its partial index covers.
+    
+    Returns:
+        int: Number of sessions updated
+    """
+    result = sessions_collection.update_many(
+        {"bookings_cleared": {"$exists": False}},
+        {"$set": {"bookings_cleared": False}}
+    )
+    return result.modified_count
+
 def book_session(user_id, session_id):
     """
     Book a seat in a session
@@ -81,41 +279,41 @@ def book_session(user_id, session_id):
     # Convert session_id to ObjectId
     session_oid = ObjectId(session_id)
     
-    # Check if session exists and has available seats
-    session = sessions_collection.find_one({"_id": session_oid})
-    if not session:
-        raise ValueError("Session not found")
+    # Claim a seat atomically, only succeeds while seats are still available
+    session = sessions_collection.find_one_and_update(
+        {"_id": session_oid, "$expr": {"$lt": ["$seats_booked", "$max_seats"]}},
+        {"$inc": {"seats_booked": 1, "seats_available": -1}},
+        return_document=ReturnDocument.AFTER
+    )
     
-    if session["seats_booked"] >= session["max_seats"]:
+    if not session:
+        if not sessions_collection.find_one({"_id": session_oid}, {"_id": 1}):
+            raise ValueError("Session not found")
+        if bookings_collection.find_one({"user_id": user_id, "session_id": str(session_id)}, {"_id": 1}):
+            raise ValueError("You have already booked this session")
         raise ValueError("This session is fully booked")
     
-    # Check if user already booked this session
-    existing_booking = bookings_collection.find_one({
-        "user_id": user_id,
-        "session_id": str(session_id)
-    })
-    
-    if existing_booking:
-        raise ValueError("You have already booked this session")
-    
-    # Create booking
+    # Create booking (session date and time are copied so bookings can be listed in session order)
     booking = {
         "user_id": user_id,
         "session_id": str(session_id),
+        "session_date": session["date"],
+        "session_time": session["time"],
         "created_at": datetime.utcnow()
     }
     
-    # Start a transaction
-    with mongo_client.start_session() as mongo_session:
-        with mongo_session.start_transaction():
-            # Insert booking
-            bookings_collection.insert_one(booking)
-            
-            # Increment seats_booked
-            sessions_collection.update_one(
-                {"_id": session_oid},
-                {"$inc": {"seats_booked": 1}}
-            )
+    # Insert booking, the unique (user_id, session_id) index from utils.indexes rejects duplicates
+    try:
+        bookings_collection.insert_one(booking)
+    except Exception as e:
+        # Release the seat claimed above, whatever stopped the booking from being stored
+        sessions_collection.update_one(
+            {"_id": session_oid},
+            {"$inc": {"seats_booked": -1, "seats_available": 1}}
+        )
+        if isinstance(e, DuplicateKeyError):
+            raise ValueError("You have already booked this session")
+        raise
     
     # Get user and speaker information for email notification
     user = users_collection.find_one({"_id": ObjectId(user_id)})
@@ -183,7 +381,7 @@ def cancel_booking(user_id, booking_id):
             # Decrement seats_booked
             sessions_collection.update_one(
                 {"_id": session_oid},
-                {"$inc": {"seats_booked": -1}}
+                {"$inc": {"seats_booked": -1, "seats_available": 1}}
             )
             
             # Delete the booking
@@ -227,6 +425,9 @@ def submit_feedback(user_id, booking_id, rating, feedback_text=None):
     if "rating" in booking:
         raise ValueError("Feedback already submitted for this session")
     
+    # Get the session to know which speaker is being rated
+    session = sessions_collection.find_one({"_id": ObjectId(booking["session_id"])})
+    
     # Update booking with feedback
     update_data = {
         "rating": rating,
@@ -236,15 +437,29 @@ def submit_feedback(user_id, booking_id, rating, feedback_text=None):
     if feedback_text:
         update_data["feedback_text"] = feedback_text
     
-    # Update the booking
-    bookings_collection.update_one(
-        {"_id": booking_oid},
-        {"$set": update_data}
-    )
+    # Store the feedback and update the speaker's rating aggregates together
+    def store_feedback(mongo_session):
+        # Only rate once, even if two submissions race
+        result = bookings_collection.update_one(
+            {"_id": booking_oid, "rating": {"$exists": False}},
+            {"$set": update_data},
+            session=mongo_session
+        )
+        if result.modified_count == 0:
+            raise ValueError("Feedback already submitted for this session")
+        
+        if session:
+            record_speaker_rating(session["speaker_id"], rating, mongo_session)
+    
+    # with_transaction retries write conflicts with concurrent feedback for the same speaker
+    with mongo_client.start_session() as mongo_session:
+        mongo_session.with_transaction(store_feedback)
+    
+    if session:
+        invalidate_speaker_catalog()
     
     # Get session and user details for email confirmation
     try:
-        session = sessions_collection.find_one({"_id": ObjectId(booking["session_id"])})
         if not session:
             print(f"Failed to find session with ID: {booking['session_id']}")
             return "Feedback submitted successfully"
@@ -262,16 +477,6 @@ def submit_feedback(user_id, booking_id, rating, feedback_text=None):
         # Get user's full name
         user_name = f"{user['first_name']} {user['last_name']}"
         
-        # Check if files exist
-        import os
-        if not os.path.exists("templates/emails/feedback_confirmation.html"):
-            print("Error: Missing template file: templates/emails/feedback_confirmation.html")
-            return "Feedback submitted successfully"
-            
-        if not os.path.exists("templates/emails/feedback_confirmation_speaker.html"):
-            print("Error: Missing template file: templates/emails/feedback_confirmation_speaker.html")
-            return "Feedback submitted successfully"
-        
         # Send feedback confirmation emails
         send_feedback_confirmation(
             user_email=user["email"],
@@ -285,7 +490,7 @@ def submit_feedback(user_id, booking_id, rating, feedback_text=None):
             rating=rating,
             feedback_text=feedback_text
         )
-        print(f"Successfully sent feedback emails to {user['email']} and {speaker['email']}")
+        print(f"Successfully queued feedback emails to {user['email']} and {speaker['email']}")
     except Exception as e:
         # Log error but don't affect feedback submission status
         print(f"Failed to send feedback confirmation emails: {str(e)}")
@@ -316,24 +521,30 @@ def clear_past_sessions(user_id, role):
     
     if role == "user":
         # For users - mark past bookings as cleared
-        user_bookings = list(bookings_collection.find({"user_id": user_id, "cleared": {"$ne": True}}))
+        user_bookings = list(bookings_collection.find(
+            {"user_id": user_id, "cleared": {"$ne": True}},
+            {"session_id": 1}
+        ))
         print(f"Found {len(user_bookings)} uncleared bookings for user")
         
-        for booking in user_bookings:
-            # Get session details
-            session = sessions_collection.find_one({"_id": ObjectId(booking["session_id"])})
-            if session:
-                print(f"Checking session date: {session['date']} against today: {today}")
-                if session["date"] < today:
-                    # Mark booking as cleared
-                    bookings_collection.update_one(
-                        {"_id": booking["_id"]},
-                        {"$set": {"cleared": True}}
-                    )
-                    result["cleared_count"] += 1
-                    print(f"Cleared booking ID: {booking['_id']} for session on {session['date']}")
-            else:
-                print(f"Session not found for booking ID: {booking['_id']}")
+        # Resolve which of the booked sessions are in the past in a single query
+        session_ids = list({ObjectId(booking["session_id"]) for booking in user_bookings})
+        past_session_ids = [
+            str(session["_id"])
+            for session in sessions_collection.find(
+                {"_id": {"$in": session_ids}, "date": {"$lt": today}},
+                {"_id": 1}
+            )
+        ]
+        
+        # Mark all bookings for past sessions as cleared at once
+        if past_session_ids:
+            update_result = bookings_collection.update_many(
+                {"user_id": user_id, "session_id": {"$in": past_session_ids}, "cleared": {"$ne": True}},
+                {"$set": {"cleared": True}}
+            )
+            result["cleared_count"] = update_result.modified_count
+        print(f"Cleared {result['cleared_count']} past bookings for user")
     
     elif role == "speaker":
         # For speakers - mark past sessions as cleared
@@ -348,28 +559,203 @@ def clear_past_sessions(user_id, role):
     print(f"Clearing complete. Total items cleared: {result['cleared_count']}")
     return result
 
-def get_user_bookings(user_id):
+def _sessions_to_clear_filter(cutoff):
     """
-    Get all sessions booked by a user
+    Build the filter for sessions before cutoff whose bookings aren't cleared yet
     
     Args:
-        user_id (str): ID of the user
+        cutoff (str): Date in YYYY-MM-DD format; earlier sessions match
+        
+    Returns:
+        dict: MongoDB filter, served by the partial index on unprocessed sessions
+    """
+    return {"bookings_cleared": False, "date": {"$lt": cutoff}}
+
+def clear_all_past_bookings(batch_size=CLEANUP_BATCH_SIZE):
+    """
+    Soft-delete the bookings of past sessions for all users
+    
+    Only sessions that ended more than CLEANUP_AFTER_DAYS ago are cleared,
+    so attendees can still see their bookings and leave feedback. Sessions
+    are processed in batches, found through the partial index on
+    unprocessed sessions. Each batch clears its bookings with a single
+    update_many and is then marked with bookings_cleared so later runs
+    skip it.
+    
+    Args:
+        batch_size (int): Number of past sessions handled per batch
         
     Returns:
-        list: List of booked sessions with speaker details
+        dict: Count of cleared bookings
+    """
+    cutoff = (datetime.now() - timedelta(days=CLEANUP_AFTER_DAYS)).strftime("%Y-%m-%d")
+    result = {"cleared_count": 0}
+    
+    while True:
+        # Get the next batch of past sessions that haven't been processed yet
+        session_ids = [
+            session["_id"]
+            for session in sessions_collection.find(_sessions_to_clear_filter(cutoff), {"_id": 1}).limit(batch_size)
+        ]
+        if not session_ids:
+            break
+        
+        update_result = bookings_collection.update_many(
+            {"session_id": {"$in": [str(session_id) for session_id in session_ids]}, "cleared": {"$ne": True}},
+            {"$set": {"cleared": True}}
+        )
+        result["cleared_count"] += update_result.modified_count
+        
+        sessions_collection.update_many(
+            {"_id": {"$in": session_ids}},
+            {"$set": {"bookings_cleared": True}}
+        )
+    
+    print(f"Cleared {result['cleared_count']} past bookings across all users")
+    return result
+
+def backfill_booking_session_times(batch_size=CLEANUP_BATCH_SIZE):
+    """
+    Copy session date and time onto bookings created before they were stored
+    
+    Each batch resolves its sessions with one query and updates the bookings
+    with a single bulk write.
+    
+    Args:
+        batch_size (int): Number of bookings handled per batch
+        
+    Returns:
+        int: Number of bookings updated
+    """
+    updated = 0
+    
+    while True:
+        bookings = list(bookings_collection.find(
+            {"session_date": {"$exists": False}},
+            {"session_id": 1}
+        ).limit(batch_size))
+        if not bookings:
+            break
+        
+        session_ids = list({booking["session_id"] for booking in bookings})
+        sessions = {
+            str(session["_id"]): session
+            for session in sessions_collection.find(
+                {"_id": {"$in": [ObjectId(session_id) for session_id in session_ids]}},
+                {"date": 1, "time": 1}
+            )
+        }
+        
+        # Bookings of deleted sessions get None so they aren't picked up again
+        operations = [
+            UpdateMany(
+                {"session_id": session_id, "session_date": {"$exists": False}},
+                {"$set": {
+                    "session_date": sessions[session_id]["date"] if session_id in sessions else None,
+                    "session_time": sessions[session_id]["time"] if session_id in sessions else None
+                }}
+            )
+            for session_id in session_ids
+        ]
+        updated += bookings_collection.bulk_write(operations, ordered=False).modified_count
+    
+    return updated
+
+def _claim_cleanup_run(now=None):
+    """
+    Claim this interval's cleanup run, across all processes
+    
+    The run is recorded in scheduled_jobs, so however many workers poll
+    (and however often they restart) the cleanup runs once per
+    CLEANUP_INTERVAL_SECONDS.
+    
+    Args:
+        now (datetime, optional): Time of the run, defaults to the current time
+        
+    Returns:
+        bool: True if this caller should run the cleanup
+    """
+    now = now or datetime.utcnow()
+    try:
+        # Upserting fails with a duplicate key when the last run is too recent
+        scheduled_jobs_collection.update_one(
+            {"_id": "clear_past_bookings", "last_run_at": {"$not": {"$gt": now - timedelta(seconds=CLEANUP_INTERVAL_SECONDS)}}},
+            {"$set": {"last_run_at": now}},
+            upsert=True
+        )
+    except DuplicateKeyError:
+        return False
+    return True
+
+def _cleanup_loop():
+    while True:
+        try:
+            if _claim_cleanup_run():
+                clear_all_past_bookings()
+        except Exception as e:
+            print(f"Failed to clear past bookings: {e}")
+        
+        sleep(CLEANUP_POLL_SECONDS)
+
+def start_cleanup_scheduler():
+    """
+    Start the background job that clears past bookings for all users
+    """
+    global _cleanup_thread
+    
+    with _cleanup_lock:
+        if _cleanup_thread:
+            return
+        
+        _cleanup_thread = threading.Thread(target=_cleanup_loop, name="cleanup-scheduler", daemon=True)
+        _cleanup_thread.start()
+
+def _join_booking_details(user_bookings):
+    """
+    Combine a user's bookings with their session and speaker details
+    
+    Args:
+        user_bookings (list): Booking documents
+        
+    Returns:
+        list: Booked sessions with speaker details, in the order given
     """
     bookings = []
     
-    # Find all bookings for this user that aren't cleared
-    user_bookings = bookings_collection.find({"user_id": user_id, "cleared": {"$ne": True}})
+    # Fetch every referenced session in a single query
+    session_ids = {ObjectId(booking["session_id"]) for booking in user_bookings}
+    sessions = {
+        str(session["_id"]): session
+        for session in sessions_collection.find(
+            {"_id": {"$in": list(session_ids)}},
+            {"speaker_id": 1, "date": 1, "time": 1}
+        )
+    }
+    
+    # Fetch the speakers' user records and profiles in one query each
+    speaker_ids = {session["speaker_id"] for session in sessions.values()}
+    speakers = {
+        str(speaker["_id"]): speaker
+        for speaker in users_collection.find(
+            {"_id": {"$in": [ObjectId(speaker_id) for speaker_id in speaker_ids]}},
+            {"first_name": 1, "last_name": 1}
+        )
+    }
+    speaker_profiles = {
+        profile["user_id"]: profile
+        for profile in speakers_collection.find(
+            {"user_id": {"$in": list(speaker_ids)}},
+            {"user_id": 1, "expertise": 1, "price_per_session": 1}
+        )
+    }
     
     for booking in user_bookings:
         # Get session details
-        session = sessions_collection.find_one({"_id": ObjectId(booking["session_id"])})
+        session = sessions.get(booking["session_id"])
         if session:
             # Get speaker details
-            speaker = users_collection.find_one({"_id": ObjectId(session["speaker_id"])})
-            speaker_profile = speakers_collection.find_one({"user_id": session["speaker_id"]})
+            speaker = speakers.get(session["speaker_id"])
+            speaker_profile = speaker_profiles.get(session["speaker_id"])
             
             if speaker and speaker_profile:
                 booking_info = {
@@ -391,31 +777,107 @@ def get_user_bookings(user_id):
                 
                 bookings.append(booking_info)
     
-    # Sort by date and time
-    return sorted(bookings, key=lambda x: (x["date"], x["time"]))
+    return bookings
 
-def get_speaker_bookings(speaker_id):
+def _user_bookings_filter(user_id, after=None):
     """
-    Get all sessions created by a speaker with booking details
+    Build the filter for a user's bookings that aren't cleared
     
     Args:
-        speaker_id (str): ID of the speaker
+        user_id (str): ID of the user
+        after (list, optional): Decoded cursor, (session_date, session_time, _id) of the last booking of the previous page
+        
+    Returns:
+        dict: MongoDB filter
+        
+    Raises:
+        ValueError: If the cursor holds an invalid ID
+    """
+    query = {"user_id": user_id, "cleared": {"$ne": True}}
+    if after:
+        query.update(keyset_filter(
+            ["session_date", "session_time", "_id"],
+            [after[0], after[1], cursor_object_id(after[2])]
+        ))
+    return query
+
+def get_user_bookings(user_id, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    Get a page of sessions booked by a user, ordered by session date and time
+    
+    Args:
+        user_id (str): ID of the user
+        limit (int): Maximum number of bookings to return
+        cursor (str, optional): Cursor returned with the previous page
+        
+    Returns:
+        tuple: (list of booked sessions with speaker details, next page cursor or None)
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    # Find one page of this user's bookings that aren't cleared, sorted by the database
+    user_bookings = list(
+        bookings_collection.find(
+            _user_bookings_filter(user_id, decode_cursor(cursor, 3)),
+            {"session_id": 1, "session_date": 1, "session_time": 1, "rating": 1, "feedback_text": 1}
+        )
+        .sort(USER_BOOKINGS_SORT)
+        .limit(limit)
+    )
+    
+    bookings = _join_booking_details(user_bookings)
+    
+    # A full page means there may be more bookings
+    next_cursor = None
+    if len(user_bookings) == limit:
+        last = user_bookings[-1]
+        next_cursor = encode_cursor([last.get("session_date"), last.get("session_time"), str(last["_id"])])
+    
+    return bookings, next_cursor
+
+def _join_session_bookings(speaker_sessions):
+    """
+    Combine a speaker's sessions with their bookings and attendee details
+    
+    Args:
+        speaker_sessions (list): Session documents
         
     Returns:
-        list: List of sessions with booking details
+        list: Sessions with booking details, in the order given
     """
     sessions = []
     
-    # Find all sessions by this speaker that aren't cleared
-    speaker_sessions = sessions_collection.find({"speaker_id": speaker_id, "cleared": {"$ne": True}})
+    # Fetch the bookings for every session in a single query, grouped by session
+    session_ids = [str(session["_id"]) for session in speaker_sessions]
+    bookings_by_session = {}
+    for booking in bookings_collection.find(
+        {"session_id": {"$in": session_ids}},
+        {"session_id": 1, "user_id": 1, "rating": 1, "feedback_text": 1}
+    ):
+        bookings_by_session.setdefault(booking["session_id"], []).append(booking)
+    
+    # Resolve all attendees in a single query
+    attendee_ids = {
+        ObjectId(booking["user_id"])
+        for session_bookings in bookings_by_session.values()
+        for booking in session_bookings
+    }
+    attendees = {
+        str(user["_id"]): user
+        for user in users_collection.find(
+            {"_id": {"$in": list(attendee_ids)}},
+            {"first_name": 1, "last_name": 1, "email": 1}
+        )
+    }
     
     for session in speaker_sessions:
         # Get all bookings for this session
-        session_bookings = bookings_collection.find({"session_id": str(session["_id"])})
+        session_bookings = bookings_by_session.get(str(session["_id"]), [])
         booked_users = []
         
         for booking in session_bookings:
-            user = users_collection.find_one({"_id": ObjectId(booking["user_id"])})
+            user = attendees.get(booking["user_id"])
             if user:
                 user_info = {
                     "user_id": booking["user_id"],
@@ -442,5 +904,98 @@ def get_speaker_bookings(speaker_id):
         }
         sessions.append(session_info)
     
-    # Sort by date and time
-    return sorted(sessions, key=lambda x: (x["date"], x["time"])) 
\ No newline at end of file
+    return sessions
+
+def _speaker_sessions_filter(speaker_id, after=None):
+    """
+    Build the filter for a speaker's sessions that aren't cleared
+    
+    Args:
+        speaker_id (str): ID of the speaker
+        after (list, optional): Decoded cursor, (date, time) of the last session of the previous page
+        
+    Returns:
+        dict: MongoDB filter
+    """
+    query = {"speaker_id": speaker_id, "cleared": {"$ne": True}}
+    if after:
+        query.update(keyset_filter(["date", "time"], after))
+    return query
+
+def get_speaker_bookings(speaker_id, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    Get a page of sessions created by a speaker with booking details,
+    ordered by date and time
+    
+    Args:
+        speaker_id (str): ID of the speaker
+        limit (int): Maximum number of sessions to return
+        cursor (str, optional): Cursor returned with the previous page
+        
+    Returns:
+        tuple: (list of sessions with booking details, next page cursor or None)
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    # Find one page of this speaker's sessions that aren't cleared, sorted by the database
+    speaker_sessions = list(
+        sessions_collection.find(
+            _speaker_sessions_filter(speaker_id, decode_cursor(cursor, 2)),
+            {"date": 1, "time": 1, "max_seats": 1, "seats_booked": 1}
+        )
+        .sort(SPEAKER_SESSIONS_SORT)
+        .limit(limit)
+    )
+    
+    sessions = _join_session_bookings(speaker_sessions)
+    
+    # A full page means there may be more sessions
+    next_cursor = None
+    if len(speaker_sessions) == limit:
+        last = speaker_sessions[-1]
+        next_cursor = encode_cursor([last["date"], last["time"]])
+    
+    return sessions, next_cursor
+
+def iter_user_bookings(user_id, batch_size=STREAM_BATCH_SIZE):
+    """
+    Iterate over all sessions booked by a user, ordered by session date and time
+    
+    Bookings are read from a single cursor and joined one batch at a time,
+    so memory use does not grow with the booking history.
+    
+    Args:
+        user_id (str): ID of the user
+        batch_size (int): Number of bookings joined per round trip
+        
+    Yields:
+        dict: Booked session with speaker details
+    """
+    user_bookings = bookings_collection.find(
+        _user_bookings_filter(user_id),
+        {"session_id": 1, "rating": 1, "feedback_text": 1}
+    ).sort(USER_BOOKINGS_SORT).batch_size(batch_size)
+    
+    for batch in iter_batches(user_bookings, batch_size):
+        yield from _join_booking_details(batch)
+
+def iter_speaker_bookings(speaker_id, batch_size=STREAM_BATCH_SIZE):
+    """
+    Iterate over all sessions created by a speaker with booking details,
+    ordered by date and time
+    
+    Args:
+        speaker_id (str): ID of the speaker
+        batch_size (int): Number of sessions joined per round trip
+        
+    Yields:
+        dict: Session with booking details
+    """
+    speaker_sessions = sessions_collection.find(
+        _speaker_sessions_filter(speaker_id),
+        {"date": 1, "time": 1, "max_seats": 1, "seats_booked": 1}
+    ).sort(SPEAKER_SESSIONS_SORT).batch_size(batch_size)
+    
+    for batch in iter_batches(speaker_sessions, batch_size):
+        yield from _join_session_bookings(batch)
@@ -1,27 +1,131 @@
 import os
+import queue
 import smtplib
+import socket
 import ssl
+import threading
 import uuid
+from time import perf_counter, sleep
 from email.message import EmailMessage
-from dotenv import load_dotenv
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 from datetime import datetime, timedelta
-
-# Load environment variables
-load_dotenv()
+from bson import ObjectId
+from pymongo import ReturnDocument
+from config import mongo_client
+from utils.template_engine import render_template
+from utils.metrics import smtp_send_duration
 
 # Get SMTP configuration from environment variables
 SMTP_SERVER = os.getenv("SMTP_SERVER")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "465"))
 SMTP_EMAIL = os.getenv("SMTP_EMAIL")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
+SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "true").lower() == "true"
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+
+# Outbound email queue configuration
+EMAIL_WORKERS = int(os.getenv("EMAIL_WORKERS", "2"))
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BASE_SECONDS = float(os.getenv("EMAIL_RETRY_BASE_SECONDS", "2"))
+EMAIL_POLL_INTERVAL_SECONDS = float(os.getenv("EMAIL_POLL_INTERVAL_SECONDS", "5"))
+EMAIL_LEASE_SECONDS = int(os.getenv("EMAIL_LEASE_SECONDS", "300"))
+EMAIL_BOOKKEEPING_ATTEMPTS = 3
+
+# Database collection backing the outbound email queue
+email_outbox_collection = mongo_client.speakeasy.email_outbox
+
+# SMTP connection pool state (idle authenticated connections, capped by SMTP_POOL_SIZE)
+_smtp_idle_connections = queue.LifoQueue()
+_smtp_slots = threading.BoundedSemaphore(SMTP_POOL_SIZE)
+
+# Worker pool state
+_outbox_event = threading.Event()
+_workers_lock = threading.Lock()
+_workers = []
+
+def _open_smtp_connection():
+    """
+    Open and authenticate a new SMTP connection
+    
+    Returns:
+        smtplib.SMTP: Connected (and logged in, if credentials are set) SMTP client
+    """
+    # Plain SMTP is only meant for local SMTP stand-ins
+    if SMTP_USE_SSL:
+        # Create secure SSL context
+        context = ssl.create_default_context()
+        server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context)
+    else:
+        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
+    
+    try:
+        if SMTP_PASSWORD:
+            server.login(SMTP_EMAIL, SMTP_PASSWORD)
+    except Exception:
+        _close_smtp_connection(server)
+        raise
+    
+    return server
+
+def _close_smtp_connection(server):
+    """
+    Close an SMTP connection, ignoring errors from already dead connections
+    
+    Args:
+        server (smtplib.SMTP): SMTP client to close
+    """
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+def _acquire_smtp_connection():
+    """
+    Get a healthy SMTP connection from the pool, opening a new one if needed
+    
+    Idle connections are health-checked with NOOP before being reused; dead
+    ones are discarded.
+    
+    Returns:
+        smtplib.SMTP: Ready-to-use SMTP client
+    """
+    while True:
+        try:
+            server = _smtp_idle_connections.get_nowait()
+        except queue.Empty:
+            return _open_smtp_connection()
+        
+        try:
+            if server.noop()[0] == 250:
+                return server
+        except (smtplib.SMTPException, OSError):
+            pass
+        
+        _close_smtp_connection(server)
+
+def _release_smtp_connection(server):
+    """
+    Reset the mail transaction of a connection and return it to the pool
+    
+    Connections that fail the reset are closed instead.
+    
+    Args:
+        server (smtplib.SMTP): SMTP client whose message was refused
+    """
+    try:
+        server.rset()
+    except (smtplib.SMTPException, OSError):
+        _close_smtp_connection(server)
+        return
+    
+    _smtp_idle_connections.put(server)
 
 def send_email(to_email, subject, body, is_html=False, attachments=None):
     """
-    Send an email using SMTP
+    Send an email using a pooled SMTP connection
     
     Args:
         to_email (str): Recipient email address
@@ -61,19 +165,289 @@ def send_email(to_email, subject, body, is_html=False, attachments=None):
             part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
             msg.attach(part)
     
-    # Create secure SSL context
-    context = ssl.create_default_context()
-    
-    # Send email
-    with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context) as server:
-        server.login(SMTP_EMAIL, SMTP_PASSWORD)
-        server.send_message(msg)
+    # Send email over a pooled connection
+    with _smtp_slots:
+        started_at = perf_counter()
+        server = _acquire_smtp_connection()
+        try:
+            try:
+                server.send_message(msg)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout):
+                # The connection dropped after the health check, retry once on a fresh one
+                _close_smtp_connection(server)
+                server = _open_smtp_connection()
+                server.send_message(msg)
+        except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused):
+            # The server refused this message; the connection itself is fine
+            _release_smtp_connection(server)
+            smtp_send_duration.observe(perf_counter() - started_at, "failure")
+            raise
+        except Exception:
+            _close_smtp_connection(server)
+            smtp_send_duration.observe(perf_counter() - started_at, "failure")
+            raise
+        
+        smtp_send_duration.observe(perf_counter() - started_at, "success")
+        
+        # Return the connection to the pool for reuse
+        _smtp_idle_connections.put(server)
     
     return True
 
+def _build_email_job(to_email, subject, body, is_html=False, attachments=None):
+    """
+    Build an outbox document for a queued email
+    
+    Args:
+        to_email (str): Recipient email address
+        subject (str): Email subject
+        body (str): Email body (text or HTML)
+        is_html (bool): Whether the body is HTML
+        attachments (list, optional): List of attachment tuples (filename, content, mimetype)
+        
+    Returns:
+        dict: Outbox document ready to be inserted
+    """
+    now = datetime.utcnow()
+    return {
+        "to_email": to_email,
+        "subject": subject,
+        "body": body,
+        "is_html": is_html,
+        "attachments": [list(attachment) for attachment in attachments or []],
+        "status": "pending",
+        "attempts": 0,
+        "next_attempt_at": now,
+        "created_at": now
+    }
+
+def enqueue_email(to_email, subject, body, is_html=False, attachments=None):
+    """
+    Queue an email for asynchronous delivery by the email worker pool
+    
+    The message is persisted in the email_outbox collection so it survives
+    restarts, and is picked up by the next free worker.
+    
+    Args:
+        to_email (str): Recipient email address
+        subject (str): Email subject
+        body (str): Email body (text or HTML)
+        is_html (bool): Whether the body is HTML
+        attachments (list, optional): List of attachment tuples (filename, content, mimetype)
+        
+    Returns:
+        str: ID of the queued email job
+    """
+    job = _build_email_job(to_email, subject, body, is_html, attachments)
+    result = email_outbox_collection.insert_one(job)
+    
+    # Make sure workers are running and wake one of them up
+    start_email_workers()
+    _outbox_event.set()
+    
+    return str(result.inserted_id)
+
+def enqueue_emails(messages):
+    """
+    Queue several emails for asynchronous delivery with a single insert
+    
+    Args:
+        messages (list): List of dicts with to_email, subject, body and
+            optionally is_html and attachments
+        
+    Returns:
+        list: IDs of the queued email jobs
+    """
+    if not messages:
+        return []
+    
+    jobs = [_build_email_job(**message) for message in messages]
+    result = email_outbox_collection.insert_many(jobs)
+    
+    # Make sure workers are running and wake them up
+    start_email_workers()
+    _outbox_event.set()
+    
+    return [str(job_id) for job_id in result.inserted_ids]
+
+def get_email_status(job_id):
+    """
+    Get the delivery status of a queued email
+    
+    Args:
+        job_id (str): ID of the queued email job
+        
+    Returns:
+        dict: Status information or None if the job does not exist
+    """
+    job = email_outbox_collection.find_one(
+        {"_id": ObjectId(job_id)},
+        {"status": 1, "attempts": 1, "last_error": 1, "sent_at": 1}
+    )
+    if not job:
+        return None
+    
+    return {
+        "job_id": str(job["_id"]),
+        "status": job["status"],
+        "attempts": job["attempts"],
+        "last_error": job.get("last_error"),
+        "sent_at": job.get("sent_at")
+    }
+
+def start_email_workers(worker_count=None):
+    """
+    Start the background email worker pool, replacing workers that have died
+    
+    Args:
+        worker_count (int, optional): Number of worker threads, defaults to EMAIL_WORKERS
+    """
+    with _workers_lock:
+        # Replace any worker that has died
+        _workers[:] = [worker for worker in _workers if worker.is_alive()]
+        
+        for i in range(len(_workers), worker_count or EMAIL_WORKERS):
+            worker = threading.Thread(target=_email_worker, name=f"email-worker-{i}", daemon=True)
+            worker.start()
+            _workers.append(worker)
+    
+    # Pick up anything left in the outbox by a previous process
+    _outbox_event.set()
+
+def _claimable_email_jobs_filter(now):
+    """
+    Build the filter for jobs that are due, or whose lease has expired
+    
+    Args:
+        now (datetime): Current UTC time
+        
+    Returns:
+        dict: MongoDB filter
+    """
+    return {"$or": [
+        {"status": "pending", "next_attempt_at": {"$lte": now}},
+        {"status": "sending", "locked_at": {"$lt": now - timedelta(seconds=EMAIL_LEASE_SECONDS)}}
+    ]}
+
+def _claim_email_job():
+    """
+    Atomically claim the next email job that is due for delivery
+    
+    Jobs stuck in "sending" longer than the lease (e.g. because a worker died
+    mid-send) are reclaimed as well.
+    
+    Returns:
+        dict: The claimed job or None if nothing is due
+    """
+    now = datetime.utcnow()
+    return email_outbox_collection.find_one_and_update(
+        _claimable_email_jobs_filter(now),
+        {"$set": {"status": "sending", "locked_at": now}, "$inc": {"attempts": 1}},
+        sort=[("next_attempt_at", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+
+def _mark_email_sent(job):
+    """
+    Record that a job was delivered, retrying if MongoDB is briefly unavailable
+    
+    The body and attachments are dropped once sent, so message contents such
+    as OTP codes are not kept around; the job itself expires via the TTL index
+    on completed_at.
+    
+    Args:
+        job (dict): The delivered email job
+    """
+    now = datetime.utcnow()
+    for attempt in range(EMAIL_BOOKKEEPING_ATTEMPTS):
+        try:
+            email_outbox_collection.update_one(
+                {"_id": job["_id"]},
+                {
+                    "$set": {"status": "sent", "sent_at": now, "completed_at": now},
+                    "$unset": {"locked_at": "", "body": "", "attachments": ""}
+                }
+            )
+            return
+        except Exception as e:
+            print(f"Failed to mark email {job['_id']} as sent (attempt {attempt + 1}): {e}")
+            sleep(EMAIL_RETRY_BASE_SECONDS * (2 ** attempt))
+    
+    # The job stays "sending" and is only retried once its lease expires
+    print(f"Email {job['_id']} was sent but could not be marked as sent")
+
+def _reschedule_email_job(job, error):
+    """
+    Record a failed send, rescheduling it with exponential backoff
+    
+    After EMAIL_MAX_ATTEMPTS the job is marked as failed instead.
+    
+    Args:
+        job (dict): The claimed email job
+        error (Exception): Why the send failed
+    """
+    now = datetime.utcnow()
+    if job["attempts"] >= EMAIL_MAX_ATTEMPTS:
+        update = {"status": "failed", "last_error": str(error), "completed_at": now}
+    else:
+        delay = EMAIL_RETRY_BASE_SECONDS * (2 ** (job["attempts"] - 1))
+        update = {
+            "status": "pending",
+            "last_error": str(error),
+            "next_attempt_at": now + timedelta(seconds=delay)
+        }
+    
+    email_outbox_collection.update_one(
+        {"_id": job["_id"]},
+        {"$set": update, "$unset": {"locked_at": ""}}
+    )
+
+def _deliver_email_job(job):
+    """
+    Send a claimed email job and record the outcome
+    
+    Failed sends are rescheduled with exponential backoff until
+    EMAIL_MAX_ATTEMPTS is reached, after which the job is marked as failed.
+    A job that was sent is never rescheduled, even if recording that fails.
+    
+    Args:
+        job (dict): The claimed email job
+    """
+    attachments = [tuple(attachment) for attachment in job.get("attachments", [])]
+    
+    try:
+        send_email(job["to_email"], job["subject"], job["body"], job["is_html"], attachments or None)
+    except Exception as e:
+        print(f"Failed to send email to {job['to_email']} (attempt {job['attempts']}): {e}")
+        _reschedule_email_job(job, e)
+        return
+    
+    _mark_email_sent(job)
+
+def _email_worker():
+    """
+    Worker loop that drains the email outbox
+    
+    Sleeps until woken by enqueue_email, or until the poll interval passes so
+    that scheduled retries are picked up. Errors never end the loop; a job
+    left in "sending" is reclaimed once its lease expires.
+    """
+    while True:
+        _outbox_event.clear()
+        
+        try:
+            job = _claim_email_job()
+            if job is not None:
+                _deliver_email_job(job)
+                continue
+        except Exception as e:
+            print(f"Email worker error: {e}")
+        
+        _outbox_event.wait(EMAIL_POLL_INTERVAL_SECONDS)
+
 def send_otp_email(user_email, otp_code, first_name):
     """
-    Send OTP verification email to a user
+    Queue OTP verification email to a user
     
     Args:
         user_email (str): User's email address
@@ -81,7 +455,7 @@ def send_otp_email(user_email, otp_code, first_name):
         first_name (str): User's first name
     
     Returns:
-        bool: True if email sent successfully
+        bool: True if email queued successfully
     """
     subject = "SpeakEasy OTP Verification"
     
@@ -98,10 +472,10 @@ Welcome aboard!
 """
     
     try:
-        send_email(user_email, subject, body)
+        enqueue_email(user_email, subject, body)
         return True
     except Exception as e:
-        print(f"Failed to send OTP email: {e}")
+        print(f"Failed to queue OTP email: {e}")
         return False
 
 def generate_calendar_invite(session_details, speaker_name, user_name=None):
@@ -190,7 +564,7 @@ def generate_calendar_invite(session_details, speaker_name, user_name=None):
 
 def send_booking_confirmation(user_email, speaker_email, session_details, user_name=None):
     """
-    Send booking confirmation emails to both user and speaker using HTML templates
+    Queue booking confirmation emails to both user and speaker using HTML templates
     
     Args:
         user_email (str): User's email address
@@ -202,36 +576,33 @@ def send_booking_confirmation(user_email, speaker_email, session_details, user_n
         user_name (str, optional): Name of the user who made the booking
             
     Returns:
-        bool: True if both emails sent successfully, False otherwise
+        bool: True if both emails queued successfully, False otherwise
     """
     # Extract session details
     session_date = session_details.get("date")
     session_time = session_details.get("time")
     speaker_name = session_details.get("speaker_name")
     
-    # Read HTML templates
+    # Render HTML templates
     try:
-        with open("templates/emails/booking_confirmation_user.html", "r") as file:
-            user_template = file.read()
-        
-        with open("templates/emails/booking_confirmation_speaker.html", "r") as file:
-            speaker_template = file.read()
+        user_html = render_template(
+            "emails/booking_confirmation_user.html",
+            speaker_name=speaker_name,
+            session_date=session_date,
+            session_time=session_time
+        )
+        speaker_html = render_template(
+            "emails/booking_confirmation_speaker.html",
+            speaker_name=speaker_name,
+            session_date=session_date,
+            session_time=session_time,
+            user_name=user_name or "A user",
+            user_email=user_email
+        )
     except Exception as e:
-        print(f"Failed to read email templates: {e}")
+        print(f"Failed to render email templates: {e}")
         return False
     
-    # Replace placeholders in user template
-    user_html = user_template.replace("{{ speaker_name }}", speaker_name)
-    user_html = user_html.replace("{{ session_date }}", session_date)
-    user_html = user_html.replace("{{ session_time }}", session_time)
-    
-    # Replace placeholders in speaker template
-    speaker_html = speaker_template.replace("{{ speaker_name }}", speaker_name)
-    speaker_html = speaker_html.replace("{{ session_date }}", session_date)
-    speaker_html = speaker_html.replace("{{ session_time }}", session_time)
-    speaker_html = speaker_html.replace("{{ user_name }}", user_name or "A user")
-    speaker_html = speaker_html.replace("{{ user_email }}", user_email)
-    
     # Create email subject lines
     user_subject = "Session Booking Confirmation - SpeakEasy"
     speaker_subject = "New Session Booking - SpeakEasy"
@@ -239,30 +610,30 @@ def send_booking_confirmation(user_email, speaker_email, session_details, user_n
     # Generate calendar invites
     calendar_invite = generate_calendar_invite(session_details, speaker_name, user_name)
     
-    # Send emails and catch any exceptions
+    # Queue emails and catch any exceptions
     success = True
     
     try:
-        # Send HTML email to user with calendar attachment
+        # Queue HTML email to user with calendar attachment
         attachments = [calendar_invite] if calendar_invite else None
-        send_email(user_email, user_subject, user_html, is_html=True, attachments=attachments)
+        enqueue_email(user_email, user_subject, user_html, is_html=True, attachments=attachments)
     except Exception as e:
-        print(f"Failed to send confirmation email to user: {e}")
+        print(f"Failed to queue confirmation email to user: {e}")
         success = False
     
     try:
-        # Send HTML email to speaker with calendar attachment
+        # Queue HTML email to speaker with calendar attachment
         attachments = [calendar_invite] if calendar_invite else None
-        send_email(speaker_email, speaker_subject, speaker_html, is_html=True, attachments=attachments)
+        enqueue_email(speaker_email, speaker_subject, speaker_html, is_html=True, attachments=attachments)
     except Exception as e:
-        print(f"Failed to send notification email to speaker: {e}")
+        print(f"Failed to queue notification email to speaker: {e}")
         success = False
     
     return success
 
 def send_feedback_confirmation(user_email, speaker_email, session_details, user_name, rating, feedback_text=None):
     """
-    Send feedback confirmation emails to both user and speaker using HTML templates
+    Queue feedback confirmation emails to both user and speaker using HTML templates
     
     Args:
         user_email (str): User's email address
@@ -276,7 +647,7 @@ def send_feedback_confirmation(user_email, speaker_email, session_details, user_
         feedback_text (str, optional): Text feedback
             
     Returns:
-        bool: True if both emails sent successfully, False otherwise
+        bool: True if both emails queued successfully, False otherwise
     """
     # Extract session details
     session_date = session_details.get("date")
@@ -285,92 +656,51 @@ def send_feedback_confirmation(user_email, speaker_email, session_details, user_
     
     print(f"Preparing feedback emails with: User={user_name}, Speaker={speaker_name}, Rating={rating}")
     
-    # Read HTML templates
-    try:
-        with open("templates/emails/feedback_confirmation.html", "r", encoding='utf-8') as file:
-            user_template = file.read()
-            print("Successfully loaded user feedback template")
-        
-        with open("templates/emails/feedback_confirmation_speaker.html", "r", encoding='utf-8') as file:
-            speaker_template = file.read()
-            print("Successfully loaded speaker feedback template")
-    except Exception as e:
-        print(f"Failed to read feedback email templates: {str(e)}")
-        return False
-    
+    # Render HTML templates
     try:
-        # Generate star rating HTML
-        stars_html = "⭐" * rating
-        rating_html = f'{stars_html} <span>({rating}/5)</span>'
-        
-        # Replace placeholders in user template
-        user_html = user_template.replace("{{ recipient_name }}", user_name)
-        user_html = user_html.replace("{{ speaker_name }}", speaker_name)
-        user_html = user_html.replace("{{ session_date }}", session_date)
-        user_html = user_html.replace("{{ session_time }}", session_time)
-        user_html = user_html.replace("{{ rating }}", str(rating))
-        user_html = user_html.replace('{% for i in range(rating) %}⭐{% endfor %}', stars_html)
-        
-        # Handle feedback text section
-        if feedback_text:
-            user_html = user_html.replace("{{ feedback_text }}", feedback_text)
-            user_html = user_html.replace("{% if feedback_text %}", "")
-            user_html = user_html.replace("{% endif %}", "")
-        else:
-            feedback_section_start = user_html.find("{% if feedback_text %}")
-            feedback_section_end = user_html.find("{% endif %}") + len("{% endif %}")
-            if feedback_section_start >= 0 and feedback_section_end > 0:
-                feedback_section = user_html[feedback_section_start:feedback_section_end]
-                user_html = user_html.replace(feedback_section, "")
-        
-        # Replace placeholders in speaker template
-        speaker_html = speaker_template.replace("{{ speaker_name }}", speaker_name)
-        speaker_html = speaker_html.replace("{{ session_date }}", session_date)
-        speaker_html = speaker_html.replace("{{ session_time }}", session_time)
-        speaker_html = speaker_html.replace("{{ user_name }}", user_name)
-        speaker_html = speaker_html.replace("{{ rating }}", str(rating))
-        speaker_html = speaker_html.replace('{% for i in range(rating) %}⭐{% endfor %}', stars_html)
-        
-        # Handle feedback text section in speaker template
-        if feedback_text:
-            speaker_html = speaker_html.replace("{{ feedback_text }}", feedback_text)
-            speaker_html = speaker_html.replace("{% if feedback_text %}", "")
-            speaker_html = speaker_html.replace("{% endif %}", "")
-        else:
-            feedback_section_start = speaker_html.find("{% if feedback_text %}")
-            feedback_section_end = speaker_html.find("{% endif %}") + len("{% endif %}")
-            if feedback_section_start >= 0 and feedback_section_end > 0:
-                feedback_section = speaker_html[feedback_section_start:feedback_section_end]
-                speaker_html = speaker_html.replace(feedback_section, "")
-        
-        print("Successfully processed templates and replaced placeholders")
+        user_html = render_template(
+            "emails/feedback_confirmation.html",
+            recipient_name=user_name,
+            speaker_name=speaker_name,
+            session_date=session_date,
+            session_time=session_time,
+            rating=rating,
+            feedback_text=feedback_text
+        )
+        speaker_html = render_template(
+            "emails/feedback_confirmation_speaker.html",
+            speaker_name=speaker_name,
+            session_date=session_date,
+            session_time=session_time,
+            user_name=user_name,
+            rating=rating,
+            feedback_text=feedback_text
+        )
     except Exception as e:
-        print(f"Error processing template placeholders: {str(e)}")
+        print(f"Failed to render feedback email templates: {str(e)}")
         return False
     
     # Create email subject lines
     user_subject = "Feedback Confirmation - SpeakEasy"
     speaker_subject = "New Session Feedback - SpeakEasy"
     
-    # Send emails and catch any exceptions
+    # Queue emails and catch any exceptions
     success = True
     
     try:
-        # Send HTML email to user
-        print(f"Attempting to send feedback confirmation to user: {user_email}")
-        send_email(user_email, user_subject, user_html, is_html=True)
-        print("Successfully sent feedback confirmation to user")
+        # Queue HTML email to user
+        enqueue_email(user_email, user_subject, user_html, is_html=True)
+        print(f"Queued feedback confirmation to user: {user_email}")
     except Exception as e:
-        print(f"Failed to send feedback confirmation email to user: {str(e)}")
+        print(f"Failed to queue feedback confirmation email to user: {str(e)}")
         success = False
     
     try:
-        # Send HTML email to speaker
-        print(f"Attempting to send feedback notification to speaker: {speaker_email}")
-        send_email(speaker_email, speaker_subject, speaker_html, is_html=True)
-        print("Successfully sent feedback notification to speaker")
+        # Queue HTML email to speaker
+        enqueue_email(speaker_email, speaker_subject, speaker_html, is_html=True)
+        print(f"Queued feedback notification to speaker: {speaker_email}")
     except Exception as e:
-        print(f"Failed to send feedback notification email to speaker: {str(e)}")
+        print(f"Failed to queue feedback notification email to speaker: {str(e)}")
         success = False
     
     return success 
\ No newline at end of file
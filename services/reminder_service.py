@@ -0,0 +1,297 @@
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from bson import ObjectId
+from config import mongo_client
+from services.email_service import enqueue_emails
+from utils.template_engine import render_template
+
+# Database collections
+sessions_collection = mongo_client.speakeasy.sessions
+bookings_collection = mongo_client.speakeasy.bookings
+users_collection = mongo_client.speakeasy.users
+speakers_collection = mongo_client.speakeasy.speakers
+
+# Reminder scheduler configuration
+REMINDER_WINDOW_HOURS = int(os.getenv("REMINDER_WINDOW_HOURS", "24"))
+REMINDER_INTERVAL_SECONDS = int(os.getenv("REMINDER_INTERVAL_SECONDS", "900"))
+# How long a run's claim on sessions holds before another run may take them over
+REMINDER_CLAIM_SECONDS = int(os.getenv("REMINDER_CLAIM_SECONDS", "600"))
+# Sessions claimed, rendered and queued at a time, bounding memory after a backlog
+REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "100"))
+
+# Scheduler state
+_scheduler_lock = threading.Lock()
+_scheduler_thread = None
+
+def _upcoming_sessions_filter(window_hours, now):
+    """
+    Build the filter for sessions starting within the next window_hours
+
+    Dates and times are stored as zero-padded strings, so the window is
+    expressed as a lexicographic range over (date, time) that can use the
+    sessions (date, time) index.
+
+    Args:
+        window_hours (int): Size of the look-ahead window in hours
+        now (datetime, optional): Start of the window, defaults to the current time
+
+    Returns:
+        dict: MongoDB filter
+    """
+    start = now or datetime.now()
+    end = start + timedelta(hours=window_hours)
+    start_date, start_time = start.strftime("%Y-%m-%d"), start.strftime("%H:%M")
+    end_date, end_time = end.strftime("%Y-%m-%d"), end.strftime("%H:%M")
+
+    return {
+        "date": {"$gte": start_date, "$lte": end_date},
+        "$and": [
+            {"$or": [{"date": {"$gt": start_date}}, {"time": {"$gte": start_time}}]},
+            {"$or": [{"date": {"$lt": end_date}}, {"time": {"$lt": end_time}}]}
+        ],
+        "cleared": {"$ne": True}
+    }
+
+def _claimable_reminders_filter(window_hours, now, claimed_at):
+    """
+    Build the filter for upcoming sessions that still need a reminder and
+    are not claimed by a live run
+
+    Args:
+        window_hours (int): Size of the look-ahead window in hours
+        now (datetime, optional): Start of the window, defaults to the current time
+        claimed_at (datetime): Time of the new claim; older claims than
+            REMINDER_CLAIM_SECONDS before it are taken over
+
+    Returns:
+        dict: MongoDB filter
+    """
+    return {
+        **_upcoming_sessions_filter(window_hours, now),
+        "reminder_sent_at": {"$exists": False},
+        "$nor": [{"reminder_claimed_at": {"$gte": claimed_at - timedelta(seconds=REMINDER_CLAIM_SECONDS)}}]
+    }
+
+def _claim_session_reminders(window_hours=REMINDER_WINDOW_HOURS, now=None, batch_size=REMINDER_BATCH_SIZE):
+    """
+    Claim the next batch of upcoming sessions that still need a reminder
+
+    Up to batch_size candidates are found first, then claimed with an
+    update_many that repeats the claim conditions and tags them with a
+    token unique to this batch, so only one scheduler (across restarts
+    and app instances) claims each session. Claims older than
+    REMINDER_CLAIM_SECONDS are taken over, so a run that died before
+    finishing does not lose its reminders.
+
+    Args:
+        window_hours (int): Size of the look-ahead window in hours
+        now (datetime, optional): Start of the window, defaults to the current time
+        batch_size (int): Maximum number of sessions to claim
+
+    Returns:
+        tuple: (claim token, claimed session documents), or None when no
+            session is left to claim
+    """
+    token = ObjectId()
+    claimed_at = datetime.utcnow()
+    claimable = _claimable_reminders_filter(window_hours, now, claimed_at)
+
+    session_ids = [session["_id"] for session in sessions_collection.find(claimable, {"_id": 1}).limit(batch_size)]
+    if not session_ids:
+        return None
+
+    sessions_collection.update_many(
+        {**claimable, "_id": {"$in": session_ids}},
+        {"$set": {"reminder_claim": token, "reminder_claimed_at": claimed_at}}
+    )
+
+    # Candidates another run claimed in the meantime are left out
+    sessions = list(sessions_collection.find(
+        {"_id": {"$in": session_ids}, "reminder_claim": token},
+        {"speaker_id": 1, "date": 1, "time": 1}
+    ))
+    return token, sessions
+
+def _finish_session_reminders(token, sent):
+    """
+    Settle the sessions claimed by a run
+
+    Args:
+        token (ObjectId): Claim token of the run
+        sent (bool): Whether the reminders were queued; if not, the claims
+            are released so the next run picks the sessions up again
+    """
+    update = {"$unset": {"reminder_claim": "", "reminder_claimed_at": ""}}
+    if sent:
+        update["$set"] = {"reminder_sent_at": datetime.utcnow()}
+
+    sessions_collection.update_many({"reminder_claim": token}, update)
+
+def _build_calendar_link(session, speaker_name):
+    """
+    Build an "add to calendar" link for a session
+
+    Args:
+        session (dict): Session document
+        speaker_name (str): Full name of the speaker
+
+    Returns:
+        str: Google Calendar event link
+    """
+    start = datetime.strptime(f"{session['date']} {session['time']}", "%Y-%m-%d %H:%M")
+    end = start + timedelta(hours=1)  # 1-hour session
+    query = urlencode({
+        "action": "TEMPLATE",
+        "text": f"SpeakEasy Session with {speaker_name}",
+        "dates": f"{start.strftime('%Y%m%dT%H%M%S')}/{end.strftime('%Y%m%dT%H%M%S')}",
+        "location": "Online Meeting"
+    })
+    return f"https://calendar.google.com/calendar/render?{query}"
+
+def send_session_reminders(window_hours=REMINDER_WINDOW_HOURS, now=None, batch_size=REMINDER_BATCH_SIZE):
+    """
+    Queue reminder emails for every attendee and speaker of upcoming sessions
+
+    Sessions are claimed, rendered and queued batch_size at a time, so a
+    backlog (e.g. after an outage) never has to fit in memory at once. A
+    batch is only marked as reminded once its emails are in the outbox; if
+    queueing fails, its claims are released instead.
+
+    Args:
+        window_hours (int): Size of the look-ahead window in hours
+        now (datetime, optional): Start of the window, defaults to the current time
+        batch_size (int): Maximum number of sessions per batch
+
+    Returns:
+        dict: Number of sessions reminded and emails queued
+    """
+    result = {"sessions_reminded": 0, "emails_queued": 0}
+
+    while True:
+        # Claim the next batch this run is responsible for
+        claim = _claim_session_reminders(window_hours, now, batch_size)
+        if claim is None:
+            return result
+
+        token, sessions = claim
+        if not sessions:
+            continue
+
+        try:
+            batch_result = _queue_session_reminders(sessions)
+        except Exception:
+            # Nothing of this batch was queued, let the next run retry these sessions
+            _finish_session_reminders(token, sent=False)
+            raise
+
+        _finish_session_reminders(token, sent=True)
+        result["sessions_reminded"] += batch_result["sessions_reminded"]
+        result["emails_queued"] += batch_result["emails_queued"]
+
+def _queue_session_reminders(sessions):
+    """
+    Render and queue the reminder emails for claimed sessions
+
+    Args:
+        sessions (list): Session documents
+
+    Returns:
+        dict: Number of sessions reminded and emails queued
+    """
+    result = {"sessions_reminded": 0, "emails_queued": 0}
+
+    # Fetch bookings, attendees, speakers and speaker profiles in one query each
+    session_ids = [str(session["_id"]) for session in sessions]
+    bookings = list(bookings_collection.find(
+        {"session_id": {"$in": session_ids}},
+        {"session_id": 1, "user_id": 1}
+    ))
+
+    speaker_ids = {session["speaker_id"] for session in sessions}
+    user_ids = {booking["user_id"] for booking in bookings} | speaker_ids
+    users = {
+        str(user["_id"]): user
+        for user in users_collection.find(
+            {"_id": {"$in": [ObjectId(user_id) for user_id in user_ids]}},
+            {"first_name": 1, "last_name": 1, "email": 1}
+        )
+    }
+    profiles = {
+        profile["user_id"]: profile
+        for profile in speakers_collection.find(
+            {"user_id": {"$in": list(speaker_ids)}},
+            {"user_id": 1, "expertise": 1}
+        )
+    }
+
+    attendees_by_session = {}
+    for booking in bookings:
+        attendees_by_session.setdefault(booking["session_id"], []).append(booking["user_id"])
+
+    # Render a reminder for every attendee and the speaker of each session
+    messages = []
+    for session in sessions:
+        speaker = users.get(session["speaker_id"])
+        if not speaker:
+            continue
+
+        speaker_name = f"{speaker['first_name']} {speaker['last_name']}"
+        profile = profiles.get(session["speaker_id"])
+        context = {
+            "session_date": session["date"],
+            "session_time": session["time"],
+            "speaker_name": speaker_name,
+            "session_topic": profile["expertise"] if profile else "SpeakEasy Session",
+            "session_location": "Online Meeting",
+            "calendar_link": _build_calendar_link(session, speaker_name)
+        }
+
+        recipients = [users[user_id] for user_id in attendees_by_session.get(str(session["_id"]), []) if user_id in users]
+        recipients.append(speaker)
+
+        for recipient in recipients:
+            messages.append({
+                "to_email": recipient["email"],
+                "subject": "Upcoming Session Reminder - SpeakEasy",
+                "body": render_template(
+                    "emails/session_reminder.html",
+                    recipient_name=f"{recipient['first_name']} {recipient['last_name']}",
+                    **context
+                ),
+                "is_html": True
+            })
+
+        result["sessions_reminded"] += 1
+
+    # Hand the batch's reminders to the email queue in one insert
+    enqueue_emails(messages)
+    result["emails_queued"] = len(messages)
+
+    return result
+
+def _reminder_loop():
+    while True:
+        try:
+            result = send_session_reminders()
+            if result["sessions_reminded"]:
+                print(f"Queued {result['emails_queued']} reminders for {result['sessions_reminded']} sessions")
+        except Exception as e:
+            print(f"Failed to send session reminders: {e}")
+
+        time.sleep(REMINDER_INTERVAL_SECONDS)
+
+def start_reminder_scheduler():
+    """
+    Start the background session reminder scheduler if it is not already running
+    """
+    global _scheduler_thread
+
+    with _scheduler_lock:
+        if _scheduler_thread:
+            return
+
+        _scheduler_thread = threading.Thread(target=_reminder_loop, name="reminder-scheduler", daemon=True)
+        _scheduler_thread.start()
@@ -1,10 +1,63 @@
+import hashlib
+import json
+import os
 from config import mongo_client
 from bson.objectid import ObjectId
+from pymongo import UpdateMany, UpdateOne
+from utils.cache import TTLCache
+from utils.metrics import register_cache
+from utils.pagination import DEFAULT_PAGE_SIZE, encode_cursor, decode_cursor, cursor_object_id, keyset_filter
+from utils.streaming import STREAM_BATCH_SIZE, iter_batches
 
 # Database collection
 speakers_collection = mongo_client.speakeasy.speakers
 users_collection = mongo_client.speakeasy.users
 
+# Speaker catalog cache, invalidated whenever a profile is written
+SPEAKER_CACHE_TTL_SECONDS = int(os.getenv("SPEAKER_CACHE_TTL_SECONDS", "60"))
+SPEAKER_CACHE_MAX_ENTRIES = int(os.getenv("SPEAKER_CACHE_MAX_ENTRIES", "128"))
+speaker_catalog_cache = TTLCache(SPEAKER_CACHE_MAX_ENTRIES, SPEAKER_CACHE_TTL_SECONDS)
+register_cache("speaker_catalog", speaker_catalog_cache)
+
+# Profile fields returned by speaker listings, rating aggregates included
+SPEAKER_LISTING_FIELDS = {
+    "user_id": 1,
+    "expertise": 1,
+    "price_per_session": 1,
+    "rating_average": 1,
+    "rating_count": 1,
+    "rating_histogram": 1
+}
+
+# Sort options for speaker search, mapped to indexed profile fields
+SEARCH_SORT_FIELDS = {
+    "price": "price_per_session",
+    "rating": "rating_average"
+}
+
+def empty_rating_histogram():
+    """
+    Get a rating histogram with no ratings, keyed by every star value "1" to "5"
+    
+    Returns:
+        dict: Zero count per star value
+    """
+    return {str(stars): 0 for stars in range(1, 6)}
+
+def empty_rating_aggregates():
+    """
+    Get the rating aggregates of a speaker without any rating
+    
+    Returns:
+        dict: Zero count, sum, average and histogram
+    """
+    return {
+        "rating_count": 0,
+        "rating_sum": 0,
+        "rating_average": 0,
+        "rating_histogram": empty_rating_histogram()
+    }
+
 def create_or_update_speaker_profile(user_id, expertise, price_per_session):
     """
     Create a new speaker profile or update existing one
@@ -17,9 +70,14 @@ def create_or_update_speaker_profile(user_id, expertise, price_per_session):
     Returns:
         str: ID of the created/updated speaker profile
     """
+    # Speaker names are kept on the profile so search can match them
+    user = users_collection.find_one({"_id": ObjectId(user_id)}, {"first_name": 1, "last_name": 1})
+    
     # Create speaker profile document
     speaker_profile = {
         "user_id": user_id,
+        "first_name": user["first_name"] if user else "",
+        "last_name": user["last_name"] if user else "",
         "expertise": expertise,
         "price_per_session": price_per_session
     }
@@ -33,11 +91,112 @@ def create_or_update_speaker_profile(user_id, expertise, price_per_session):
             {"user_id": user_id},
             {"$set": speaker_profile}
         )
-        return str(existing_profile["_id"])
+        profile_id = str(existing_profile["_id"])
     else:
-        # Create new profile
+        # Create new profile, with every rating aggregate in place
+        speaker_profile.update(empty_rating_aggregates())
         result = speakers_collection.insert_one(speaker_profile)
-        return str(result.inserted_id)
+        profile_id = str(result.inserted_id)
+    
+    # The cached catalog no longer reflects this speaker
+    invalidate_speaker_catalog()
+    
+    return profile_id
+
+def _rating_aggregate_update(count, total, histogram):
+    """
+    Build an update pipeline that adds ratings to a profile's aggregates
+    
+    Every star value is written, so profiles created before the aggregates
+    existed end up with the same complete histogram as new ones.
+    
+    Args:
+        count (int): Number of ratings to add
+        total (int): Sum of the ratings to add
+        histogram (dict): Number of ratings to add per star value ("1" to "5")
+        
+    Returns:
+        list: Update pipeline keeping count, sum, histogram and average in step
+    """
+    added = {
+        "rating_count": {"$add": [{"$ifNull": ["$rating_count", 0]}, count]},
+        "rating_sum": {"$add": [{"$ifNull": ["$rating_sum", 0]}, total]}
+    }
+    for stars in empty_rating_histogram():
+        added[f"rating_histogram.{stars}"] = {
+            "$add": [{"$ifNull": [f"$rating_histogram.{stars}", 0]}, histogram.get(stars, 0)]
+        }
+    
+    return [
+        {"$set": added},
+        {"$set": {"rating_average": {"$divide": ["$rating_sum", "$rating_count"]}}}
+    ]
+
+def record_speaker_rating(speaker_id, rating, session=None):
+    """
+    Add a rating to a speaker's aggregates in a single atomic update
+    
+    Args:
+        speaker_id (str): ID of the user (speaker)
+        rating (int): Rating from 1 to 5
+        session (ClientSession, optional): Session of the surrounding transaction
+    """
+    speakers_collection.update_one(
+        {"user_id": speaker_id},
+        _rating_aggregate_update(1, rating, {str(rating): 1}),
+        session=session
+    )
+
+def backfill_speaker_ratings():
+    """
+    Recompute every speaker's rating aggregates from the rated bookings
+    
+    Ratings are grouped per speaker and star value by one aggregation,
+    then written with a single bulk write. Run it while no feedback is
+    being submitted, since it overwrites the aggregates.
+    
+    Returns:
+        int: Number of profiles updated
+    """
+    aggregates = {}
+    
+    pipeline = [
+        {"$match": {"rating": {"$exists": True}}},
+        {"$lookup": {
+            "from": "sessions",
+            "let": {"session_oid": {"$toObjectId": "$session_id"}},
+            "pipeline": [
+                {"$match": {"$expr": {"$eq": ["$_id", "$$session_oid"]}}},
+                {"$project": {"speaker_id": 1}}
+            ],
+            "as": "session"
+        }},
+        {"$unwind": "$session"},
+        {"$group": {
+            "_id": {"speaker_id": "$session.speaker_id", "rating": "$rating"},
+            "count": {"$sum": 1}
+        }}
+    ]
+    for group in mongo_client.speakeasy.bookings.aggregate(pipeline):
+        speaker = aggregates.setdefault(group["_id"]["speaker_id"], empty_rating_aggregates())
+        speaker["rating_count"] += group["count"]
+        speaker["rating_sum"] += group["_id"]["rating"] * group["count"]
+        speaker["rating_histogram"][str(group["_id"]["rating"])] += group["count"]
+    
+    # Speakers without any rating are reset to empty aggregates
+    operations = [
+        UpdateMany(
+            {"user_id": {"$nin": list(aggregates)}},
+            {"$set": empty_rating_aggregates()}
+        )
+    ]
+    for speaker_id, speaker in aggregates.items():
+        speaker["rating_average"] = speaker["rating_sum"] / speaker["rating_count"]
+        operations.append(UpdateOne({"user_id": speaker_id}, {"$set": speaker}))
+    
+    result = speakers_collection.bulk_write(operations, ordered=False)
+    invalidate_speaker_catalog()
+    return result.modified_count
 
 def get_speaker_profile(user_id):
     """
@@ -52,21 +211,32 @@ def get_speaker_profile(user_id):
     profile = speakers_collection.find_one({"user_id": user_id})
     return profile
 
-def get_all_speakers():
+def _join_speaker_users(profiles):
     """
-    Get all speaker profiles with user information
+    Combine speaker profiles with their user records
     
+    Args:
+        profiles (list): Speaker profile documents
+        
     Returns:
-        list: List of speaker profiles with basic user information
+        list: Speaker profiles with basic user information, profiles without
+            a matching user are skipped
     """
     speakers = []
     
-    # Find all speaker profiles
-    profiles = speakers_collection.find()
+    # Fetch the user records for every profile in a single query
+    user_ids = [ObjectId(profile["user_id"]) for profile in profiles]
+    users = {
+        str(user["_id"]): user
+        for user in users_collection.find(
+            {"_id": {"$in": user_ids}},
+            {"first_name": 1, "last_name": 1, "email": 1}
+        )
+    }
     
     for profile in profiles:
         # Get user information for this speaker
-        user = users_collection.find_one({"_id": ObjectId(profile["user_id"])})
+        user = users.get(profile["user_id"])
         
         if user:
             # Create combined speaker information
@@ -77,9 +247,254 @@ def get_all_speakers():
                 "last_name": user["last_name"],
                 "email": user["email"],
                 "expertise": profile["expertise"],
-                "price_per_session": profile["price_per_session"]
+                "price_per_session": profile["price_per_session"],
+                "rating_average": profile.get("rating_average", 0),
+                "rating_count": profile.get("rating_count", 0),
+                "rating_histogram": {**empty_rating_histogram(), **profile.get("rating_histogram", {})}
             }
             
             speakers.append(speaker_info)
     
-    return speakers 
\ No newline at end of file
+    return speakers
+
+def get_all_speakers(limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    Get a page of speaker profiles with user information
+    
+    Speakers are ordered by profile ID so pages can be fetched with a
+    cursor on the _id index.
+    
+    Args:
+        limit (int): Maximum number of speakers to return
+        cursor (str, optional): Cursor returned with the previous page
+        
+    Returns:
+        tuple: (list of speaker profiles with basic user information, next page cursor or None)
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    # Resume after the last profile of the previous page
+    query = {}
+    after = decode_cursor(cursor, 1)
+    if after:
+        query["_id"] = {"$gt": cursor_object_id(after[0])}
+    
+    # Find one page of speaker profiles
+    profiles = list(
+        speakers_collection.find(query, SPEAKER_LISTING_FIELDS)
+        .sort("_id", 1)
+        .limit(limit)
+    )
+    
+    speakers = _join_speaker_users(profiles)
+    
+    # A full page means there may be more speakers
+    next_cursor = encode_cursor([str(profiles[-1]["_id"])]) if len(profiles) == limit else None
+    
+    return speakers, next_cursor
+
+def get_speaker_catalog(limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    Get a page of speakers with an ETag for the page, served from cache when fresh
+    
+    Args:
+        limit (int): Maximum number of speakers to return
+        cursor (str, optional): Cursor returned with the previous page
+        
+    Returns:
+        tuple: (list of speaker profiles, next page cursor or None, ETag string)
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    cache_key = (limit, cursor)
+    cached = speaker_catalog_cache.get(cache_key)
+    if cached:
+        return cached
+    
+    speakers, next_cursor = get_all_speakers(limit, cursor)
+    etag = hashlib.sha256(json.dumps([speakers, next_cursor], sort_keys=True).encode('utf-8')).hexdigest()
+    
+    speaker_catalog_cache.set(cache_key, (speakers, next_cursor, etag))
+    return speakers, next_cursor, etag
+
+def iter_all_speakers(batch_size=STREAM_BATCH_SIZE):
+    """
+    Iterate over every speaker profile with user information
+    
+    Profiles are read from a single cursor and joined with their users one
+    batch at a time, so memory use does not grow with the catalog size.
+    
+    Args:
+        batch_size (int): Number of profiles joined per users query
+        
+    Yields:
+        dict: Speaker profile with basic user information
+    """
+    profiles = speakers_collection.find(
+        {},
+        SPEAKER_LISTING_FIELDS
+    ).sort("_id", 1).batch_size(batch_size)
+    
+    for batch in iter_batches(profiles, batch_size):
+        yield from _join_speaker_users(batch)
+
+def _search_speakers_filter(text, min_price, max_price, sort, order, after=None):
+    """
+    Build the filter for a speaker search
+    
+    Args:
+        text (str, optional): Words to match against expertise and names
+        min_price (float, optional): Minimum price per session
+        max_price (float, optional): Maximum price per session
+        sort (str): "price" or "rating"
+        order (str): "asc" or "desc"
+        after (list, optional): Decoded cursor, (sort value, _id) of the last speaker of the previous page
+        
+    Returns:
+        dict: MongoDB filter
+        
+    Raises:
+        ValueError: If the cursor holds an invalid ID
+    """
+    query = {}
+    if text:
+        query["$text"] = {"$search": text}
+    
+    price_range = {}
+    if min_price is not None:
+        price_range["$gte"] = min_price
+    if max_price is not None:
+        price_range["$lte"] = max_price
+    if price_range:
+        query["price_per_session"] = price_range
+    
+    # Resume after the last speaker of the previous page
+    if after:
+        query.update(keyset_filter(
+            [SEARCH_SORT_FIELDS[sort], "_id"],
+            [after[0], cursor_object_id(after[1])],
+            descending=order == "desc"
+        ))
+    
+    return query
+
+def _search_speakers_sort(sort, order):
+    # Sort by the chosen field, with _id as the tiebreaker the cursor relies on
+    direction = 1 if order == "asc" else -1
+    return [(SEARCH_SORT_FIELDS[sort], direction), ("_id", direction)]
+
+def search_speakers(text=None, min_price=None, max_price=None, sort="price", order="asc",
+                    limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """
+    Search speakers by expertise and name, filtered by price range
+    
+    Text matching uses the speakers text index, and price filtering and
+    sorting use the (price_per_session, _id) and (rating_average, _id)
+    indexes, so filtering happens in the database.
+    
+    Args:
+        text (str, optional): Words to match against expertise and names
+        min_price (float, optional): Minimum price per session
+        max_price (float, optional): Maximum price per session
+        sort (str): "price" or "rating"
+        order (str): "asc" or "desc"
+        limit (int): Maximum number of speakers to return
+        cursor (str, optional): Cursor returned with the previous page
+        
+    Returns:
+        tuple: (list of matching speaker profiles, next page cursor or None)
+        
+    Raises:
+        ValueError: If the sort, order or cursor is invalid
+    """
+    if sort not in SEARCH_SORT_FIELDS:
+        raise ValueError("sort must be one of: " + ", ".join(SEARCH_SORT_FIELDS))
+    if order not in ("asc", "desc"):
+        raise ValueError("order must be either asc or desc")
+    
+    sort_field = SEARCH_SORT_FIELDS[sort]
+    
+    profiles = list(
+        speakers_collection.find(
+            _search_speakers_filter(text, min_price, max_price, sort, order, decode_cursor(cursor, 2)),
+            SPEAKER_LISTING_FIELDS
+        )
+        .sort(_search_speakers_sort(sort, order))
+        .limit(limit)
+    )
+    
+    speakers = _join_speaker_users(profiles)
+    
+    # A full page means there may be more speakers
+    next_cursor = None
+    if len(profiles) == limit:
+        last = profiles[-1]
+        next_cursor = encode_cursor([last.get(sort_field), str(last["_id"])])
+    
+    return speakers, next_cursor
+
+def backfill_speaker_search_fields(batch_size=STREAM_BATCH_SIZE):
+    """
+    Copy speaker names onto profiles created before they were stored there
+    
+    Args:
+        batch_size (int): Number of profiles handled per batch
+        
+    Returns:
+        int: Number of profiles updated
+    """
+    updated = 0
+    
+    while True:
+        profiles = list(speakers_collection.find(
+            {"first_name": {"$exists": False}},
+            {"user_id": 1}
+        ).limit(batch_size))
+        if not profiles:
+            break
+        
+        users = {
+            str(user["_id"]): user
+            for user in users_collection.find(
+                {"_id": {"$in": [ObjectId(profile["user_id"]) for profile in profiles]}},
+                {"first_name": 1, "last_name": 1}
+            )
+        }
+        
+        operations = []
+        for profile in profiles:
+            user = users.get(profile["user_id"], {})
+            operations.append(UpdateOne(
+                {"_id": profile["_id"]},
+                {"$set": {
+                    "first_name": user.get("first_name", ""),
+                    "last_name": user.get("last_name", "")
+                }}
+            ))
+        
+        # Profiles without a rating yet sort as 0
+        speakers_collection.update_many(
+            {"_id": {"$in": [profile["_id"] for profile in profiles]}, "rating_average": {"$exists": False}},
+            {"$set": {"rating_average": 0}}
+        )
+        updated += speakers_collection.bulk_write(operations, ordered=False).modified_count
+    
+    return updated
+
+def invalidate_speaker_catalog():
+    """
+    Drop the cached speaker catalog
+    
+    Call this whenever a speaker profile or a speaker's user record changes.
+    """
+    speaker_catalog_cache.clear()
+
+if __name__ == "__main__":
+    import sys
+    
+    if sys.argv[1:] == ["backfill-ratings"]:
+        print(f"Updated rating aggregates on {backfill_speaker_ratings()} speaker profiles")
+    else:
+        print("Usage: python -m services.speaker_service backfill-ratings")
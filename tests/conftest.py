@@ -0,0 +1,247 @@
+import os
+
+# Test settings, applied before the app reads its configuration (and so
+# before .env, which never overrides variables that are already set)
+os.environ.update({
+    "MONGO_URI": os.environ.get("MONGO_TEST_URI", "mongodb://localhost:27017"),
+    "JWT_SECRET": "test-secret",
+    "SMTP_SERVER": "",
+    "SMTP_PASSWORD": "",
+    "BCRYPT_ROUNDS": "4",
+    "EMAIL_WORKERS": "0",
+    "QUERY_BUDGET_STRICT": "true"
+})
+
+import contextlib
+import re
+from datetime import date, datetime, timedelta
+import mongomock
+import pytest
+from bson import ObjectId
+from flask import g, has_request_context
+from pymongo import MongoClient
+from pymongo.database import Database
+
+import config
+from app import create_app
+from services.auth_service import hash_password
+from services.booking_service import available_sessions_cache
+from services.speaker_service import speaker_catalog_cache
+from utils.indexes import ensure_indexes
+from utils.jwt_handler import generate_token
+from utils.metrics import mongo_command_listener
+
+# Set MONGO_TEST_URI to run against a real, disposable deployment (a replica
+# set, for transactions). Its "speakeasy" database is dropped before every test.
+MONGO_TEST_URI = os.environ.get("MONGO_TEST_URI")
+
+requires_mongod = pytest.mark.skipif(not MONGO_TEST_URI, reason="needs a real MongoDB (set MONGO_TEST_URI)")
+
+# Collection methods that each send one command to the server
+_COMMAND_METHODS = {
+    "aggregate", "bulk_write", "count_documents", "create_index", "delete_many", "delete_one",
+    "distinct", "find", "find_one", "find_one_and_delete", "find_one_and_replace",
+    "find_one_and_update", "insert_many", "insert_one", "replace_one", "update_many", "update_one"
+}
+
+def _count_command():
+    # Same per-request tally the command listener keeps against a real server
+    if has_request_context():
+        g.mongo_commands = g.get("mongo_commands", 0) + 1
+
+class _CountingCollection:
+    """
+    mongomock collection that counts commands like the command listener does
+
+    mongomock emits no command events, so each call is counted here; as with
+    the listener, iterating a cursor does not add to the count.
+    """
+
+    def __init__(self, collection):
+        self._collection = collection
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if name not in _COMMAND_METHODS:
+            return attribute
+
+        def command(*args, session=None, **kwargs):
+            _count_command()
+            return attribute(*args, **kwargs)
+        return command
+
+class _CountingDatabase:
+    def __init__(self, database):
+        self._database = database
+
+    def __getattr__(self, name):
+        if name == "command":
+            def command(*args, **kwargs):
+                _count_command()
+                return self._database.command(*args, **kwargs)
+            return command
+        if hasattr(Database, name):
+            return getattr(self._database, name)
+        return _CountingCollection(getattr(self._database, name))
+
+    def __getitem__(self, name):
+        return _CountingCollection(self._database[name])
+
+class _Session:
+    """
+    Stand-in for a client session; mongomock has no transactions, so the
+    callback simply runs (without rollback on error)
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def start_transaction(self):
+        return contextlib.nullcontext()
+
+    def with_transaction(self, callback):
+        return callback(self)
+
+class _CountingClient:
+    def __init__(self, client):
+        self._client = client
+
+    def start_session(self):
+        return _Session()
+
+    def __getattr__(self, name):
+        if hasattr(MongoClient, name):
+            return getattr(self._client, name)
+        return _CountingDatabase(getattr(self._client, name))
+
+    def __getitem__(self, name):
+        return _CountingDatabase(self._client[name])
+
+@pytest.fixture(autouse=True)
+def mongo(monkeypatch):
+    """
+    Point the app at an empty database with every registered index
+    """
+    if MONGO_TEST_URI:
+        client = MongoClient(MONGO_TEST_URI, event_listeners=[mongo_command_listener])
+    else:
+        client = _CountingClient(mongomock.MongoClient())
+
+    monkeypatch.setattr(config, "get_mongo_client", lambda: client)
+    reset_database()
+
+    yield client
+
+    if MONGO_TEST_URI:
+        client.close()
+
+def reset_database():
+    """
+    Drop all data and recreate the indexes
+    """
+    config.get_mongo_client().drop_database("speakeasy")
+    ensure_indexes()
+    clear_caches()
+
+def clear_caches():
+    speaker_catalog_cache.clear()
+    available_sessions_cache.clear()
+
+@pytest.fixture
+def app():
+    app = create_app(start_background=False)
+    app.testing = True
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+def mongo_commands(response):
+    """
+    Get the number of MongoDB commands a request issued, from its Server-Timing header
+    """
+    match = re.search(r'mongo;desc="(\d+) commands"', response.headers.get("Server-Timing", ""))
+    assert match, "response has no mongo Server-Timing entry"
+    return int(match.group(1))
+
+def day(offset):
+    return (date.today() + timedelta(days=offset)).strftime("%Y-%m-%d")
+
+def auth_headers(user):
+    token = generate_token({"id": str(user["_id"]), "email": user["email"], "role": user["role"]})
+    return {"Authorization": f"Bearer {token}"}
+
+# Password hashed once per test run, bcrypt is slow on purpose
+_password_hash = None
+
+def create_user(role="user", email=None, **fields):
+    """
+    Insert a verified account whose password is "password"
+    """
+    global _password_hash
+    if _password_hash is None:
+        _password_hash = hash_password("password")
+
+    user = {
+        "_id": ObjectId(),
+        "first_name": "Test",
+        "last_name": role.title(),
+        "email": email or f"{ObjectId()}@example.com",
+        "password": _password_hash,
+        "role": role,
+        "otp": "",
+        "is_verified": True,
+        **fields
+    }
+    config.mongo_client.speakeasy.users.insert_one(user)
+    return user
+
+def create_speaker(expertise="Public Speaking", price=50.0):
+    """
+    Insert a speaker account with a profile
+    """
+    speaker = create_user("speaker")
+    config.mongo_client.speakeasy.speakers.insert_one({
+        "user_id": str(speaker["_id"]),
+        "first_name": speaker["first_name"],
+        "last_name": speaker["last_name"],
+        "expertise": expertise,
+        "price_per_session": price,
+        "rating_average": 0
+    })
+    return speaker
+
+def create_session(speaker, date_offset, time="10:00", max_seats=5, seats_booked=0):
+    session = {
+        "_id": ObjectId(),
+        "speaker_id": str(speaker["_id"]),
+        "date": day(date_offset),
+        "time": time,
+        "max_seats": max_seats,
+        "seats_booked": seats_booked,
+        "seats_available": max_seats - seats_booked,
+        "bookings_cleared": False
+    }
+    config.mongo_client.speakeasy.sessions.insert_one(session)
+    return session
+
+def create_booking(user, session, **fields):
+    booking = {
+        "_id": ObjectId(),
+        "user_id": str(user["_id"]),
+        "session_id": str(session["_id"]),
+        "session_date": session["date"],
+        "session_time": session["time"],
+        "created_at": datetime.utcnow(),
+        **fields
+    }
+    config.mongo_client.speakeasy.bookings.insert_one(booking)
+    config.mongo_client.speakeasy.sessions.update_one(
+        {"_id": session["_id"]},
+        {"$inc": {"seats_booked": 1, "seats_available": -1}}
+    )
+    return booking
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+import config
+from conftest import create_user
+from services import auth_service
+
+def test_login_succeeds_when_the_rehash_finds_the_hasher_busy(client, monkeypatch):
+    # Stored with a different cost factor, so login wants to upgrade it
+    old_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=auth_service.BCRYPT_ROUNDS + 1)).decode()
+    user = create_user(password=old_hash)
+
+    def hash_password(password):
+        raise auth_service.PasswordHasherBusy("Server is busy, please try again shortly")
+    monkeypatch.setattr(auth_service, "hash_password", hash_password)
+
+    response = client.post("/api/login", json={"email": user["email"], "password": "password"})
+
+    assert response.status_code == 200
+    assert "token" in response.get_json()
+    assert config.mongo_client.speakeasy.users.find_one({"_id": user["_id"]})["password"] == old_hash
+
+def test_login_upgrades_an_outdated_hash(client):
+    old_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=auth_service.BCRYPT_ROUNDS + 1)).decode()
+    user = create_user(password=old_hash)
+
+    response = client.post("/api/login", json={"email": user["email"], "password": "password"})
+
+    assert response.status_code == 200
+    stored = config.mongo_client.speakeasy.users.find_one({"_id": user["_id"]})["password"]
+    assert not auth_service.needs_rehash(stored)
+
+def test_concurrent_signups_with_one_email_create_one_account(app):
+    # Stay within the hasher's queue, so every request reaches the insert
+    attempts = min(8, auth_service.PASSWORD_HASH_MAX_PENDING)
+
+    def signup(_):
+        return app.test_client().post("/api/signup", json={
+            "first_name": "Same", "last_name": "Person", "email": "same@example.com", "password": "password", "role": "user"
+        }).status_code
+
+    with ThreadPoolExecutor(max_workers=attempts) as pool:
+        statuses = list(pool.map(signup, range(attempts)))
+
+    assert statuses.count(201) == 1
+    assert statuses.count(409) == attempts - 1
+    assert config.mongo_client.speakeasy.users.count_documents({"email": "same@example.com"}) == 1
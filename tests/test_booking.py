@@ -0,0 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from bson import ObjectId
+from pymongo.errors import AutoReconnect
+
+import config
+from conftest import auth_headers, create_session, create_speaker, create_user
+from services import booking_service
+
+class _FailingInserts:
+    """
+    Bookings collection whose inserts fail, e.g. on a lost connection
+    """
+
+    def insert_one(self, document, **kwargs):
+        raise AutoReconnect("connection lost")
+
+def test_failed_booking_insert_releases_the_seat(monkeypatch):
+    session = create_session(create_speaker(), 7, max_seats=2)
+    user = create_user()
+    monkeypatch.setattr(booking_service, "bookings_collection", _FailingInserts())
+
+    with pytest.raises(AutoReconnect):
+        booking_service.book_session(str(user["_id"]), str(session["_id"]))
+
+    stored = config.mongo_client.speakeasy.sessions.find_one({"_id": session["_id"]})
+    assert stored["seats_booked"] == 0
+    assert stored["seats_available"] == 2
+
+def test_concurrent_bookings_never_oversell(app):
+    max_seats, attempts = 5, 40
+    session = create_session(create_speaker(), 7, max_seats=max_seats)
+
+    # Every user tries twice, so duplicates race with each other as well as for seats
+    users = [create_user() for _ in range(attempts // 2)]
+    requests = [user for user in users for _ in range(2)]
+
+    def book(user):
+        return app.test_client().post(
+            "/api/book-session",
+            headers=auth_headers(user),
+            json={"session_id": str(session["_id"])}
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        statuses = list(pool.map(book, requests))
+
+    assert statuses.count(201) == max_seats
+    assert statuses.count(409) == attempts - max_seats
+
+    db = config.mongo_client.speakeasy
+    bookings = list(db.bookings.find({"session_id": str(session["_id"])}))
+    assert len(bookings) == max_seats
+    assert len({booking["user_id"] for booking in bookings}) == max_seats
+
+    stored = db.sessions.find_one({"_id": session["_id"]})
+    assert stored["seats_booked"] == max_seats
+    assert stored["seats_available"] == 0
+
+def test_booking_a_missing_session_is_rejected(client):
+    response = client.post("/api/book-session", headers=auth_headers(create_user()), json={"session_id": str(ObjectId())})
+
+    assert response.status_code == 409
+    assert response.get_json()["error"] == "Session not found"
@@ -0,0 +1,27 @@
+import config
+from conftest import create_booking, create_session, create_speaker, create_user
+from services.booking_service import CLEANUP_AFTER_DAYS, backfill_bookings_cleared, clear_all_past_bookings
+
+def test_cleanup_waits_for_the_retention_delay():
+    speaker, user = create_speaker(), create_user()
+    recent = create_booking(user, create_session(speaker, -1))
+    old_session = create_session(speaker, -CLEANUP_AFTER_DAYS - 1)
+    old = create_booking(user, old_session)
+
+    result = clear_all_past_bookings(batch_size=1)
+
+    db = config.mongo_client.speakeasy
+    assert result == {"cleared_count": 1}
+    assert db.bookings.find_one({"_id": old["_id"]})["cleared"] is True
+    assert "cleared" not in db.bookings.find_one({"_id": recent["_id"]})
+    assert db.sessions.find_one({"_id": old_session["_id"]})["bookings_cleared"] is True
+
+def test_cleanup_picks_up_sessions_created_before_the_flag():
+    session = create_session(create_speaker(), -CLEANUP_AFTER_DAYS - 1)
+    booking = create_booking(create_user(), session)
+    db = config.mongo_client.speakeasy
+    db.sessions.update_one({"_id": session["_id"]}, {"$unset": {"bookings_cleared": ""}})
+
+    assert backfill_bookings_cleared() == 1
+    assert clear_all_past_bookings() == {"cleared_count": 1}
+    assert db.bookings.find_one({"_id": booking["_id"]})["cleared"] is True
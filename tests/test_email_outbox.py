@@ -0,0 +1,138 @@
+import smtplib
+import socket
+from datetime import datetime, timedelta
+
+import pytest
+
+import config
+from benchmarks.smtp_sink import SMTPSink
+from services import email_service
+
+def outbox_job(job_id):
+    return config.mongo_client.speakeasy.email_outbox.find_one({"_id": job_id})
+
+def closed_port():
+    # A port nothing listens on, so connecting to it is refused
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+def drain_pool():
+    while not email_service._smtp_idle_connections.empty():
+        email_service._close_smtp_connection(email_service._smtp_idle_connections.get_nowait())
+
+@pytest.fixture
+def sink(monkeypatch):
+    """
+    Point the email service at a local SMTP sink
+    """
+    sink = SMTPSink(port=0).start()
+    monkeypatch.setattr(email_service, "SMTP_SERVER", sink.server_address[0])
+    monkeypatch.setattr(email_service, "SMTP_PORT", sink.server_address[1])
+    monkeypatch.setattr(email_service, "SMTP_USE_SSL", False)
+    monkeypatch.setattr(email_service, "SMTP_EMAIL", "noreply@example.com")
+    monkeypatch.setattr(email_service, "EMAIL_RETRY_BASE_SECONDS", 2)
+
+    yield sink
+
+    drain_pool()
+    sink.shutdown()
+    sink.server_close()
+
+@pytest.fixture
+def refused(sink, monkeypatch):
+    monkeypatch.setattr(email_service, "SMTP_PORT", closed_port())
+
+def queue_email(**fields):
+    job = email_service._build_email_job(
+        "attendee@example.com", "Your OTP", "Your code is 123456",
+        attachments=[("invite.ics", "BEGIN:VCALENDAR", "text/calendar")]
+    )
+    job.update(fields)
+    return config.mongo_client.speakeasy.email_outbox.insert_one(job).inserted_id
+
+def test_claim_leases_the_due_job():
+    job_id = queue_email()
+    queue_email(next_attempt_at=datetime.utcnow() + timedelta(minutes=5))
+
+    job = email_service._claim_email_job()
+
+    assert job["_id"] == job_id
+    assert job["status"] == "sending"
+    assert job["attempts"] == 1
+    assert "locked_at" in job
+
+    # The other job is not due yet
+    assert email_service._claim_email_job() is None
+
+def test_job_with_an_expired_lease_is_reclaimed():
+    now = datetime.utcnow()
+    lease = timedelta(seconds=email_service.EMAIL_LEASE_SECONDS)
+    job_id = queue_email(status="sending", attempts=1, locked_at=now - lease / 2)
+
+    # Still leased by a live worker
+    assert email_service._claim_email_job() is None
+
+    # The worker died mid-send
+    config.mongo_client.speakeasy.email_outbox.update_one({"_id": job_id}, {"$set": {"locked_at": now - lease * 2}})
+    job = email_service._claim_email_job()
+
+    assert job["_id"] == job_id
+    assert job["attempts"] == 2
+
+def test_delivered_job_drops_its_contents(sink):
+    job_id = queue_email()
+
+    email_service._deliver_email_job(email_service._claim_email_job())
+
+    job = outbox_job(job_id)
+    assert sink.messages == 1
+    assert job["status"] == "sent"
+    assert job["attempts"] == 1
+    assert job["sent_at"] == job["completed_at"]
+    for field in ("body", "attachments", "locked_at"):
+        assert field not in job
+
+def test_failed_send_is_retried_with_backoff(refused):
+    job_id = queue_email(attempts=2)
+
+    before = datetime.utcnow()
+    email_service._deliver_email_job(email_service._claim_email_job())
+    after = datetime.utcnow()
+
+    # Third attempt: EMAIL_RETRY_BASE_SECONDS * 2 ** 2
+    job = outbox_job(job_id)
+    assert job["status"] == "pending"
+    assert job["attempts"] == 3
+    assert job["last_error"]
+    assert "locked_at" not in job
+    assert "completed_at" not in job
+    assert before + timedelta(seconds=8) - timedelta(milliseconds=1) <= job["next_attempt_at"] <= after + timedelta(seconds=8)
+
+    # Not due again until the backoff has passed
+    assert email_service._claim_email_job() is None
+
+def test_job_fails_after_max_attempts(refused):
+    job_id = queue_email(attempts=email_service.EMAIL_MAX_ATTEMPTS - 1)
+
+    email_service._deliver_email_job(email_service._claim_email_job())
+
+    job = outbox_job(job_id)
+    assert job["status"] == "failed"
+    assert job["attempts"] == email_service.EMAIL_MAX_ATTEMPTS
+    assert job["last_error"]
+    assert "completed_at" in job
+    assert email_service._claim_email_job() is None
+
+def test_refused_recipient_keeps_the_pooled_connection(sink):
+    sink.refuse_recipients.add("missing@example.com")
+
+    with pytest.raises(smtplib.SMTPRecipientsRefused):
+        email_service.send_email("missing@example.com", "Hello", "Hi")
+
+    # No reconnect and resend; the connection goes back to the pool and is reused
+    assert email_service._smtp_idle_connections.qsize() == 1
+    email_service.send_email("attendee@example.com", "Hello", "Hi")
+
+    assert sink.connections == 1
+    assert sink.messages == 1
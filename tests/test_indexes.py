@@ -0,0 +1,122 @@
+from datetime import datetime
+
+import pytest
+from bson import ObjectId
+
+import config
+from conftest import create_user, requires_mongod
+from services import booking_service, email_service, reminder_service, speaker_service
+from utils import health
+from utils.indexes import INDEXES, ensure_indexes, index_name, missing_unique_indexes
+
+@pytest.fixture
+def ready_process(monkeypatch):
+    # Startup finished, and no results from an earlier test's checks
+    monkeypatch.setattr(health, "_dependency_checks", None)
+    health.mark_startup_complete()
+
+def test_ensure_indexes_creates_every_registered_index():
+    ensured, failed = ensure_indexes()
+
+    assert failed == {}
+    assert ensured == [
+        f"{collection_name}.{index_name(index['keys'])}"
+        for collection_name, indexes in INDEXES.items()
+        for index in indexes
+    ]
+
+def test_ensure_indexes_reports_each_failure_and_creates_the_rest():
+    users = config.mongo_client.speakeasy.users
+    users.drop_index("email_1")
+    create_user(email="taken@example.com")
+    create_user(email="taken@example.com")
+
+    ensured, failed = ensure_indexes()
+
+    assert list(failed) == ["users.email_1"]
+    assert "bookings.user_id_1_session_id_1" in ensured
+    assert missing_unique_indexes() == ["users.email_1"]
+
+def test_readyz_reports_not_ready_without_a_unique_index(client, ready_process):
+    config.mongo_client.speakeasy.bookings.drop_index("user_id_1_session_id_1")
+    health.refresh_readiness()
+
+    response = client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.get_json()["checks"]["indexes"] == "missing: bookings.user_id_1_session_id_1"
+
+def test_readyz_reports_ready_with_every_index(client, ready_process):
+    health.refresh_readiness()
+
+    response = client.get("/readyz")
+
+    assert response.status_code == 200
+    assert response.get_json()["checks"]["indexes"] == "ok"
+
+def test_readyz_only_reads_the_monitor_results(client, ready_process, monkeypatch):
+    def unreachable():
+        raise AssertionError("/readyz must not check dependencies itself")
+
+    for check in ("_check_mongo", "_check_indexes", "_check_smtp"):
+        monkeypatch.setattr(health, check, unreachable)
+
+    # The monitor has not run yet
+    response = client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.get_json()["checks"]["mongo"] == "pending"
+
+def plan_stages(plan):
+    """
+    Get every stage of an explain plan, depth first
+    """
+    stages = [plan["stage"]]
+    for child in plan.get("inputStages", []) + [plan[key] for key in ("inputStage", "queryPlan") if key in plan]:
+        stages.extend(plan_stages(child))
+    return stages
+
+# Hot queries, built by the services' own filter builders, as (name, collection, filter, sort)
+NOW = datetime(2099, 1, 1, 12, 0)
+SOME_ID = "0" * 24
+HOT_QUERIES = [
+    ("user by email", "users", {"email": "someone@example.com"}, None),
+    ("speaker profile", "speakers", {"user_id": SOME_ID}, None),
+    ("speaker catalog", "speakers", {"_id": {"$gt": ObjectId(SOME_ID)}}, [("_id", 1)]),
+    ("speaker search by price",
+     "speakers", speaker_service._search_speakers_filter(None, 10, 100, "price", "asc", [50, SOME_ID]),
+     speaker_service._search_speakers_sort("price", "asc")),
+    ("speaker search by rating",
+     "speakers", speaker_service._search_speakers_filter(None, None, None, "rating", "desc", [4.5, SOME_ID]),
+     speaker_service._search_speakers_sort("rating", "desc")),
+    ("speaker search by text",
+     "speakers", speaker_service._search_speakers_filter("python", 10, None, "price", "asc", [50, SOME_ID]),
+     speaker_service._search_speakers_sort("price", "asc")),
+    ("session slot", "sessions", {"speaker_id": SOME_ID, "date": "2099-01-01", "time": "10:00"}, None),
+    ("available sessions",
+     "sessions", booking_service._available_sessions_filter(NOW), booking_service.AVAILABLE_SESSIONS_SORT),
+    ("available sessions, filtered and paged",
+     "sessions", booking_service._available_sessions_filter(NOW, "2099-01-02", "2099-02-01", [SOME_ID], ["2099-01-05", "10:00", SOME_ID]),
+     booking_service.AVAILABLE_SESSIONS_SORT),
+    ("speaker sessions",
+     "sessions", booking_service._speaker_sessions_filter(SOME_ID, ["2099-01-01", "10:00"]), booking_service.SPEAKER_SESSIONS_SORT),
+    ("sessions to clear", "sessions", booking_service._sessions_to_clear_filter("2099-01-01"), None),
+    ("sessions to remind", "sessions", reminder_service._claimable_reminders_filter(24, NOW, NOW), None),
+    ("user bookings", "bookings", booking_service._user_bookings_filter(SOME_ID), booking_service.USER_BOOKINGS_SORT),
+    ("user bookings, paged",
+     "bookings", booking_service._user_bookings_filter(SOME_ID, ["2099-01-01", "10:00", SOME_ID]), booking_service.USER_BOOKINGS_SORT),
+    ("session bookings", "bookings", {"session_id": {"$in": [SOME_ID]}}, None),
+    ("email jobs to claim", "email_outbox", email_service._claimable_email_jobs_filter(NOW), [("next_attempt_at", 1)])
+]
+
+@requires_mongod
+@pytest.mark.parametrize("collection_name, query, sort", [query[1:] for query in HOT_QUERIES], ids=[query[0] for query in HOT_QUERIES])
+def test_hot_queries_use_an_index(collection_name, query, sort):
+    cursor = config.mongo_client.speakeasy[collection_name].find(query)
+    if sort:
+        cursor = cursor.sort(sort)
+
+    stages = plan_stages(cursor.explain()["queryPlanner"]["winningPlan"])
+
+    assert "IXSCAN" in stages
+    assert "COLLSCAN" not in stages
@@ -0,0 +1,115 @@
+import time
+
+import jwt
+import pytest
+
+from utils import jwt_handler
+from utils.jwt_handler import evict_token, generate_token, verify_token
+
+class _Clock:
+    """
+    Stand-in for the time module, moved forward by hand
+    """
+
+    def __init__(self):
+        self.now = time.time()
+
+    def time(self):
+        return self.now
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    jwt_handler._token_cache.clear()
+    yield
+    jwt_handler._token_cache.clear()
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(jwt_handler, "time", clock)
+    return clock
+
+@pytest.fixture
+def decodes(monkeypatch):
+    """
+    Count the tokens jwt_handler decodes
+    """
+    calls = []
+    original_decode = jwt.decode
+
+    def decode(token, *args, **kwargs):
+        calls.append(token)
+        return original_decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(jwt_handler.jwt, "decode", decode)
+    return calls
+
+def token(user_id="1"):
+    return generate_token({"id": user_id, "email": f"{user_id}@example.com", "role": "user"})
+
+def test_verified_token_is_served_from_the_cache(decodes):
+    user_token = token()
+
+    first = verify_token(user_token)
+    first["role"] = "speaker"
+
+    assert verify_token(user_token)["role"] == "user"
+    assert len(decodes) == 1
+
+def test_cached_token_is_verified_again_after_the_ttl(clock, decodes):
+    user_token = token()
+    verify_token(user_token)
+
+    clock.now += jwt_handler.TOKEN_CACHE_TTL_SECONDS - 1
+    verify_token(user_token)
+    assert len(decodes) == 1
+
+    clock.now += 2
+    verify_token(user_token)
+    assert len(decodes) == 2
+
+def test_token_is_never_cached_past_its_exp(clock, decodes):
+    exp = int(clock.now) + 10
+    user_token = jwt.encode({"id": "1", "exp": exp}, jwt_handler.JWT_SECRET, algorithm="HS256")
+
+    verify_token(user_token)
+    assert jwt_handler._token_cache[jwt_handler._token_digest(user_token)][1] == exp
+
+    # Past its exp the cached entry is dropped and the token decoded again
+    clock.now = exp + 1
+    verify_token(user_token)
+    assert len(decodes) == 2
+
+def test_cache_evicts_the_least_recently_used_token(monkeypatch, decodes):
+    monkeypatch.setattr(jwt_handler, "TOKEN_CACHE_SIZE", 2)
+    first, second, third = token("1"), token("2"), token("3")
+
+    verify_token(first)
+    verify_token(second)
+    verify_token(first)
+    verify_token(third)
+
+    assert len(jwt_handler._token_cache) == 2
+    verify_token(first)
+    assert len(decodes) == 3
+
+    verify_token(second)
+    assert len(decodes) == 4
+
+def test_evicted_token_is_decoded_again(decodes):
+    user_token = token()
+    verify_token(user_token)
+
+    evict_token(user_token)
+
+    assert verify_token(user_token)["id"] == "1"
+    assert len(decodes) == 2
+
+def test_invalid_tokens_are_rejected_and_not_cached():
+    expired = jwt.encode({"id": "1", "exp": int(time.time()) - 1}, jwt_handler.JWT_SECRET, algorithm="HS256")
+    forged = jwt.encode({"id": "1", "exp": int(time.time()) + 60}, "another-secret", algorithm="HS256")
+
+    assert verify_token(expired) is None
+    assert verify_token(forged) is None
+    assert verify_token("not a token") is None
+    assert len(jwt_handler._token_cache) == 0
@@ -0,0 +1,76 @@
+import base64
+import json
+
+import pytest
+from bson import ObjectId
+
+import config
+from conftest import auth_headers, create_booking, create_session, create_speaker, create_user
+from utils.pagination import cursor_object_id, decode_cursor, encode_cursor
+
+def raw_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+def test_cursor_round_trip():
+    values = ["2030-01-01", None, 4.5, str(ObjectId())]
+    assert decode_cursor(encode_cursor(values), 4) == values
+
+@pytest.mark.parametrize("values", [
+    [{"$ne": 1}, "x"],
+    [["a"], "x"],
+    [True, "x"],
+    ["x"],
+    {"date": "x"}
+])
+def test_decode_cursor_rejects_anything_but_plain_sort_keys(values):
+    with pytest.raises(ValueError):
+        decode_cursor(raw_cursor(values), 2)
+
+@pytest.mark.parametrize("value", [None, 1, "not an id", {"$gt": ""}])
+def test_cursor_object_id_rejects_invalid_ids(value):
+    with pytest.raises(ValueError):
+        cursor_object_id(value)
+
+@pytest.mark.parametrize("path", ["/api/speakers", "/api/speakers/search", "/api/sessions/available", "/api/my-bookings"])
+def test_operator_in_cursor_is_a_bad_request(client, path):
+    cursor = raw_cursor([{"$ne": 1}, "x", str(ObjectId())])
+
+    response = client.get(path, query_string={"cursor": cursor}, headers=auth_headers(create_user()))
+
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Invalid cursor"
+
+def read_all_pages(client, path, key, user, **args):
+    """
+    Follow next_cursor from the first page to the last, one item per page
+    """
+    items, cursor = [], None
+    while True:
+        query = {"limit": 1, **args, **({"cursor": cursor} if cursor else {})}
+        page = client.get(path, query_string=query, headers=auth_headers(user)).get_json()
+        items.extend(page[key])
+        cursor = page["next_cursor"]
+        if not cursor:
+            return items
+
+def test_bookings_without_session_date_do_not_end_pagination(client):
+    speaker, user = create_speaker(), create_user()
+    dated = [create_booking(user, create_session(speaker, offset)) for offset in (3, 5)]
+
+    # Bookings of deleted sessions are backfilled with a null date and sort first
+    for _ in range(2):
+        create_booking(user, {"_id": ObjectId(), "date": None, "time": None})
+
+    bookings = read_all_pages(client, "/api/my-bookings", "bookings", user)
+
+    assert [booking["booking_id"] for booking in bookings] == [str(booking["_id"]) for booking in dated]
+
+def test_descending_pages_include_speakers_without_a_rating(client):
+    speakers = [create_speaker() for _ in range(3)]
+    db = config.mongo_client.speakeasy
+    db.speakers.update_one({"user_id": str(speakers[0]["_id"])}, {"$set": {"rating_average": 4.5}})
+    db.speakers.update_one({"user_id": str(speakers[1]["_id"])}, {"$unset": {"rating_average": ""}})
+
+    found = read_all_pages(client, "/api/speakers/search", "speakers", create_user(), sort="rating", order="desc")
+
+    assert len(found) == 3
@@ -0,0 +1,171 @@
+import pytest
+
+import config
+from conftest import (
+    auth_headers, clear_caches, create_booking, create_session, create_speaker, create_user, mongo_commands,
+    reset_database
+)
+
+# Two data sizes: a handful of documents, and more than a cursor's first batch (101)
+SMALL, LARGE = 3, 150
+
+def seed(scale):
+    """
+    Create speakers with upcoming and past sessions, and a user who booked them
+
+    Every count grows with the scale, so a view whose queries depend on the
+    data size issues a different number of commands at each scale.
+    """
+    speakers = [create_speaker(price=10.0 + i) for i in range(scale)]
+    user = create_user("user", email="attendee@example.com")
+
+    upcoming = [create_session(speaker, 7, time=f"{9 + i % 8:02d}:00", max_seats=scale + 5) for i, speaker in enumerate(speakers)]
+    past = [create_session(speaker, -7, max_seats=scale + 5) for speaker in speakers]
+
+    # Fill the first upcoming session with other attendees, so the speaker has bookings to list
+    for _ in range(scale):
+        create_booking(create_user("user"), upcoming[0])
+
+    bookings = [create_booking(user, session) for session in upcoming[1:] + past]
+
+    return {
+        "user": user,
+        "speaker": speakers[0],
+        "speakers": speakers,
+        "upcoming": upcoming,
+        "past": past,
+        "bookings": bookings
+    }
+
+def signup(client, data):
+    return client.post("/api/signup", json={
+        "first_name": "New", "last_name": "User", "email": "new@example.com", "password": "password", "role": "user"
+    })
+
+def verify_otp(client, data):
+    config.mongo_client.speakeasy.users.update_one({"_id": data["user"]["_id"]}, {"$set": {"otp": "123456", "is_verified": False}})
+    return client.post("/api/verify-otp", json={"email": data["user"]["email"], "otp": "123456"})
+
+def login(client, data):
+    return client.post("/api/login", json={"email": data["user"]["email"], "password": "password"})
+
+def profile(client, data):
+    return client.get("/api/profile", headers=auth_headers(data["user"]))
+
+def speaker_only(client, data):
+    return client.get("/api/speaker-only", headers=auth_headers(data["speaker"]))
+
+def update_speaker_profile(client, data):
+    return client.post("/api/speaker/profile", headers=auth_headers(data["speaker"]), json={
+        "expertise": "Storytelling", "price_per_session": 75
+    })
+
+def get_speaker_profile(client, data):
+    return client.get("/api/speaker/profile", headers=auth_headers(data["speaker"]))
+
+def list_speakers(client, data):
+    return client.get("/api/speakers", headers=auth_headers(data["user"]))
+
+def list_speakers_next_page(client, data):
+    first = client.get("/api/speakers?limit=2", headers=auth_headers(data["user"])).get_json()
+    return client.get("/api/speakers", query_string={"limit": 2, "cursor": first["next_cursor"]}, headers=auth_headers(data["user"]))
+
+def search_speakers(client, data):
+    return client.get("/api/speakers/search?min_price=10&sort=rating&order=desc", headers=auth_headers(data["user"]))
+
+def create_speaker_session(client, data):
+    return client.post("/api/speaker/create-session", headers=auth_headers(data["speaker"]), json={
+        "date": "2099-01-01", "time": "10:00", "max_seats": 10
+    })
+
+def available_sessions(client, data):
+    return client.get("/api/sessions/available", headers=auth_headers(data["user"]))
+
+def available_sessions_of_speaker(client, data):
+    speaker_id = str(data["speaker"]["_id"])
+    return client.get(f"/api/sessions/available?speaker_id={speaker_id}", headers=auth_headers(data["user"]))
+
+def book_session(client, data):
+    session = create_session(data["speaker"], 14)
+    return client.post("/api/book-session", headers=auth_headers(data["user"]), json={"session_id": str(session["_id"])})
+
+def user_bookings(client, data):
+    return client.get("/api/my-bookings", headers=auth_headers(data["user"]))
+
+def speaker_bookings(client, data):
+    return client.get("/api/my-bookings", headers=auth_headers(data["speaker"]))
+
+def cancel_booking(client, data):
+    booking = data["bookings"][0]
+    return client.post("/api/cancel-booking", headers=auth_headers(data["user"]), json={"booking_id": str(booking["_id"])})
+
+def submit_feedback(client, data):
+    booking = data["bookings"][-1]
+    return client.post("/api/submit-feedback", headers=auth_headers(data["user"]), json={
+        "booking_id": str(booking["_id"]), "rating": 5, "feedback_text": "Great"
+    })
+
+def clear_user_past_sessions(client, data):
+    return client.post("/api/clear-past-sessions", headers=auth_headers(data["user"]))
+
+def clear_speaker_past_sessions(client, data):
+    return client.post("/api/clear-past-sessions", headers=auth_headers(data["speaker"]))
+
+# (view function name, request, expected status)
+SCENARIOS = [
+    ("auth.signup", signup, 201),
+    ("auth.verify_user_otp", verify_otp, 200),
+    ("auth.login", login, 200),
+    ("auth.get_profile", profile, 200),
+    ("auth.speaker_only", speaker_only, 200),
+    ("speaker.create_profile", update_speaker_profile, 201),
+    ("speaker.get_profile", get_speaker_profile, 200),
+    ("speaker.get_speakers", list_speakers, 200),
+    ("speaker.get_speakers", list_speakers_next_page, 200),
+    ("speaker.search_speaker_catalog", search_speakers, 200),
+    ("booking.create_speaker_session", create_speaker_session, 201),
+    ("booking.get_bookable_sessions", available_sessions, 200),
+    ("booking.get_bookable_sessions", available_sessions_of_speaker, 200),
+    ("booking.book_speaker_session", book_session, 201),
+    ("booking.get_bookings", user_bookings, 200),
+    ("booking.get_bookings", speaker_bookings, 200),
+    ("booking.cancel_user_booking", cancel_booking, 200),
+    ("booking.submit_session_feedback", submit_feedback, 200),
+    ("booking.clear_past_sessions_route", clear_user_past_sessions, 200),
+    ("booking.clear_past_sessions_route", clear_speaker_past_sessions, 200)
+]
+
+def run_scenario(app, scenario, scale):
+    """
+    Seed data at the given scale and return the response and its command count
+    """
+    seed_data = seed(scale)
+    clear_caches()
+    response = scenario(app.test_client(), seed_data)
+    return response, mongo_commands(response)
+
+def test_every_api_view_has_a_query_budget(app):
+    for endpoint, view in app.view_functions.items():
+        if endpoint.split(".")[0] in ("auth", "speaker", "booking"):
+            assert hasattr(view, "query_budget"), f"{endpoint} has no @query_budget"
+
+def test_every_api_view_is_exercised(app):
+    exercised = {endpoint for endpoint, _, _ in SCENARIOS}
+    for endpoint in app.view_functions:
+        if endpoint.split(".")[0] in ("auth", "speaker", "booking"):
+            assert endpoint in exercised, f"{endpoint} has no query budget scenario"
+
+@pytest.mark.parametrize("endpoint, scenario, status", SCENARIOS, ids=[scenario.__name__ for _, scenario, _ in SCENARIOS])
+def test_view_stays_within_query_budget(app, endpoint, scenario, status):
+    budget = app.view_functions[endpoint].query_budget
+
+    response, small = run_scenario(app, scenario, SMALL)
+    assert response.status_code == status, response.get_data(as_text=True)
+    assert small <= budget, f"{endpoint} issued {small} commands, budget is {budget}"
+
+    # Start over with more data than fits in a cursor's first batch
+    reset_database()
+
+    response, large = run_scenario(app, scenario, LARGE)
+    assert response.status_code == status, response.get_data(as_text=True)
+    assert large == small, f"{endpoint} issued {small} commands with {SMALL} records but {large} with {LARGE}"
@@ -0,0 +1,79 @@
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+import config
+from conftest import create_booking, create_session, create_speaker, create_user
+from services import reminder_service
+
+# Noon today; sessions tomorrow morning fall inside the 24 hour window
+NOW = datetime.combine(date.today(), time(12, 0))
+
+def reminder_state(session):
+    stored = config.mongo_client.speakeasy.sessions.find_one({"_id": session["_id"]})
+    return {field: field in stored for field in ("reminder_sent_at", "reminder_claim", "reminder_claimed_at")}
+
+def queued_emails():
+    return config.mongo_client.speakeasy.email_outbox.count_documents({})
+
+@pytest.fixture
+def session():
+    session = create_session(create_speaker(), 1, time="10:00")
+    create_booking(create_user(), session)
+    return session
+
+def test_reminders_are_queued_once(session):
+    outside_window = create_session(create_speaker(), 3)
+
+    assert reminder_service.send_session_reminders(now=NOW) == {"sessions_reminded": 1, "emails_queued": 2}
+    assert reminder_state(session) == {"reminder_sent_at": True, "reminder_claim": False, "reminder_claimed_at": False}
+    assert reminder_state(outside_window)["reminder_sent_at"] is False
+
+    assert reminder_service.send_session_reminders(now=NOW) == {"sessions_reminded": 0, "emails_queued": 0}
+    assert queued_emails() == 2
+
+def test_failed_enqueue_releases_the_claims(session, monkeypatch):
+    def enqueue_emails(messages):
+        raise ConnectionError("outbox unavailable")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(reminder_service, "enqueue_emails", enqueue_emails)
+        with pytest.raises(ConnectionError):
+            reminder_service.send_session_reminders(now=NOW)
+
+    assert reminder_state(session) == {"reminder_sent_at": False, "reminder_claim": False, "reminder_claimed_at": False}
+
+    # The next run picks the session up again
+    assert reminder_service.send_session_reminders(now=NOW)["sessions_reminded"] == 1
+    assert queued_emails() == 2
+
+def test_sessions_claimed_by_another_run_are_skipped_until_the_claim_expires(session):
+    sessions = config.mongo_client.speakeasy.sessions
+    sessions.update_one({"_id": session["_id"]}, {"$set": {"reminder_claim": "other run", "reminder_claimed_at": datetime.utcnow()}})
+
+    assert reminder_service.send_session_reminders(now=NOW)["sessions_reminded"] == 0
+
+    # The other run died; once its claim is stale the session is claimed again
+    stale = datetime.utcnow() - timedelta(seconds=reminder_service.REMINDER_CLAIM_SECONDS + 1)
+    sessions.update_one({"_id": session["_id"]}, {"$set": {"reminder_claimed_at": stale}})
+
+    assert reminder_service.send_session_reminders(now=NOW)["sessions_reminded"] == 1
+    assert reminder_state(session)["reminder_sent_at"] is True
+
+def test_reminders_are_claimed_and_queued_in_batches(session, monkeypatch):
+    for hour in ("09:00", "11:00"):
+        other = create_session(create_speaker(), 1, time=hour)
+        create_booking(create_user(), other)
+
+    batches = []
+    enqueue_emails = reminder_service.enqueue_emails
+
+    def record_batch(messages):
+        batches.append(len(messages))
+        return enqueue_emails(messages)
+
+    monkeypatch.setattr(reminder_service, "enqueue_emails", record_batch)
+
+    assert reminder_service.send_session_reminders(now=NOW, batch_size=2) == {"sessions_reminded": 3, "emails_queued": 6}
+    assert batches == [4, 2]
+    assert queued_emails() == 6
@@ -0,0 +1,28 @@
+from conftest import auth_headers, create_speaker, create_user, mongo_commands
+
+def test_unchanged_catalog_revalidates_and_profile_writes_invalidate_it(client):
+    speaker = create_speaker(expertise="Public Speaking")
+    create_speaker(expertise="Storytelling")
+    headers = auth_headers(create_user())
+
+    first = client.get("/api/speakers", headers=headers)
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    # Unchanged: 304 without a body, served from the cache
+    revalidated = client.get("/api/speakers", headers={**headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.get_data() == b""
+    assert mongo_commands(revalidated) == 0
+
+    response = client.post("/api/speaker/profile", headers=auth_headers(speaker), json={
+        "expertise": "Negotiation", "price_per_session": 80
+    })
+    assert response.status_code == 201
+
+    # The write invalidated the cache, so the stale ETag gets the new list
+    changed = client.get("/api/speakers", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert "Negotiation" in [entry["expertise"] for entry in changed.get_json()["speakers"]]
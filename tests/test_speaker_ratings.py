@@ -0,0 +1,73 @@
+import config
+from conftest import auth_headers, create_booking, create_session, create_speaker, create_user, requires_mongod
+from services.speaker_service import backfill_speaker_ratings, empty_rating_histogram
+
+def profile_of(speaker):
+    return config.mongo_client.speakeasy.speakers.find_one({"user_id": str(speaker["_id"])})
+
+def listed_speaker(client, speaker):
+    speakers = client.get("/api/speakers", headers=auth_headers(create_user())).get_json()["speakers"]
+    return next(entry for entry in speakers if entry["user_id"] == str(speaker["_id"]))
+
+def submit_feedback(client, user, booking, rating):
+    return client.post("/api/submit-feedback", headers=auth_headers(user), json={
+        "booking_id": str(booking["_id"]), "rating": rating, "feedback_text": "Thanks"
+    })
+
+def test_new_profile_starts_with_empty_aggregates(client):
+    speaker = create_user("speaker")
+
+    response = client.post("/api/speaker/profile", headers=auth_headers(speaker), json={
+        "expertise": "Storytelling", "price_per_session": 40
+    })
+
+    assert response.status_code == 201
+    profile = profile_of(speaker)
+    assert profile["rating_count"] == 0
+    assert profile["rating_sum"] == 0
+    assert profile["rating_average"] == 0
+    assert profile["rating_histogram"] == empty_rating_histogram()
+
+def test_feedback_updates_the_speaker_aggregates(client):
+    # A profile from before the aggregates existed
+    speaker = create_speaker()
+    session = create_session(speaker, -1)
+    first, second = create_user(), create_user()
+
+    assert submit_feedback(client, first, create_booking(first, session), 5).status_code == 200
+    assert submit_feedback(client, second, create_booking(second, session), 2).status_code == 200
+
+    profile = profile_of(speaker)
+    assert profile["rating_count"] == 2
+    assert profile["rating_sum"] == 7
+    assert profile["rating_average"] == 3.5
+    assert profile["rating_histogram"] == {"1": 0, "2": 1, "3": 0, "4": 0, "5": 1}
+
+def test_listing_reports_every_star_value(client):
+    speaker = create_speaker()
+
+    # No aggregates stored yet
+    listed = listed_speaker(client, speaker)
+
+    assert listed["rating_count"] == 0
+    assert listed["rating_histogram"] == empty_rating_histogram()
+
+@requires_mongod
+def test_backfill_recomputes_the_aggregates():
+    rated, unrated = create_speaker(), create_speaker()
+    session = create_session(rated, -1)
+    for rating in (4, 4, 1):
+        create_booking(create_user(), session, rating=rating)
+    create_booking(create_user(), create_session(unrated, -1))
+
+    # Aggregates that drifted from the bookings
+    config.mongo_client.speakeasy.speakers.update_many({}, {"$set": {"rating_count": 9, "rating_histogram": {"5": 9}}})
+
+    backfill_speaker_ratings()
+
+    assert profile_of(rated)["rating_count"] == 3
+    assert profile_of(rated)["rating_sum"] == 9
+    assert profile_of(rated)["rating_average"] == 3
+    assert profile_of(rated)["rating_histogram"] == {"1": 1, "2": 0, "3": 0, "4": 2, "5": 0}
+    assert profile_of(unrated)["rating_count"] == 0
+    assert profile_of(unrated)["rating_histogram"] == empty_rating_histogram()
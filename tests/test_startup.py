@@ -0,0 +1,37 @@
+from datetime import datetime, timedelta
+
+import app as application
+import config
+from services import booking_service
+from utils.indexes import missing_unique_indexes
+
+def test_worker_startup_does_not_run_migrations(monkeypatch):
+    calls = []
+    monkeypatch.setattr(application, "run_migrations", lambda: calls.append("migrate"))
+
+    application.run_startup_tasks()
+    assert calls == []
+
+    application.run_startup_tasks(migrate=True)
+    assert calls == ["migrate"]
+
+def test_migrations_create_indexes_and_backfill():
+    db = config.mongo_client.speakeasy
+    db.drop_collection("users")
+    db.sessions.insert_one({"speaker_id": "0" * 24, "date": "2030-01-01", "time": "10:00", "max_seats": 3, "seats_booked": 1})
+
+    assert application.run_migrations() is True
+    assert missing_unique_indexes() == []
+
+    session = db.sessions.find_one()
+    assert session["seats_available"] == 2
+    assert session["bookings_cleared"] is False
+
+def test_cleanup_runs_once_per_interval_across_processes():
+    now = datetime.utcnow()
+    interval = timedelta(seconds=booking_service.CLEANUP_INTERVAL_SECONDS)
+
+    assert booking_service._claim_cleanup_run(now) is True
+    # Another worker, or this one after a restart
+    assert booking_service._claim_cleanup_run(now + timedelta(seconds=1)) is False
+    assert booking_service._claim_cleanup_run(now + interval) is True
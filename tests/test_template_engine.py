@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from utils.template_engine import TEMPLATE_DIR, _render_segments, compile_template, render_template
+
+def render(source, **context):
+    output = []
+    _render_segments(compile_template(source), context, output)
+    return "".join(output)
+
+def test_variables_are_html_escaped():
+    assert render("<p>{{ name }}</p>", name='<b>"Al" & co</b>') == "<p>&lt;b&gt;&quot;Al&quot; &amp; co&lt;/b&gt;</p>"
+    assert render("[{{ missing }}]") == "[]"
+
+def test_if_else_and_not():
+    source = "{% if feedback %}yes{% else %}no{% endif %}|{% if not feedback %}empty{% endif %}"
+
+    assert render(source, feedback="Great") == "yes|"
+    assert render(source, feedback="") == "no|empty"
+
+def test_nested_if_and_for():
+    source = "{% for name in names %}{% if name %}<li>{{ name }}</li>{% else %}<li>?</li>{% endif %}{% endfor %}"
+
+    assert render(source, names=["Ann", "", "<Bo>"]) == "<li>Ann</li><li>?</li><li>&lt;Bo&gt;</li>"
+    assert render(source) == ""
+
+def test_for_over_range_of_a_name():
+    source = "{% for star in range(rating) %}*{% endfor %}{% if not rating %}none{% endif %}"
+
+    assert render(source, rating=3) == "***"
+    assert render(source, rating=0) == "none"
+
+@pytest.mark.parametrize("source", [
+    "{% if a %}open",
+    "{% for x in items %}{% if x %}{% endfor %}",
+    "{% endif %}",
+    "{% else %}",
+    "{% endfor %}",
+    "{% for x items %}{% endfor %}",
+    "{% include 'header.html' %}"
+])
+def test_unbalanced_or_unknown_tags_are_rejected(source):
+    with pytest.raises(ValueError):
+        compile_template(source)
+
+def test_user_supplied_feedback_is_escaped():
+    html = render_template(
+        "emails/feedback_confirmation_speaker.html",
+        speaker_name="Sam Kim",
+        session_date="2099-01-01",
+        session_time="10:00",
+        user_name="<img src=x onerror=alert(1)>",
+        rating=4,
+        feedback_text="<script>alert('hi')</script>"
+    )
+
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(&#x27;hi&#x27;)&lt;/script&gt;" in html
+    assert "<img src=x" not in html
+
+@pytest.mark.parametrize("name", sorted(os.listdir(os.path.join(TEMPLATE_DIR, "emails"))))
+def test_every_email_template_compiles(name):
+    with open(os.path.join(TEMPLATE_DIR, "emails", name), encoding="utf-8") as file:
+        assert compile_template(file.read())
@@ -1,52 +1,102 @@
 from functools import wraps
-from flask import request, jsonify
+from time import perf_counter
+from flask import request, jsonify, g
 from utils.jwt_handler import verify_token
 
+# Extract the bearer token from the Authorization header
+def _extract_token():
+    # Check if Authorization header exists
+    if 'Authorization' in request.headers:
+        auth_header = request.headers['Authorization']
+
+        # Check if header has the correct format (Bearer token)
+        parts = auth_header.split()
+        if len(parts) == 2 and parts[0].lower() == 'bearer':
+            return parts[1]
+
+    return None
+
+# Authentication pipeline, runs at most once per request
+def authenticate_request():
+    """
+    Extract and verify the request's token, memoizing the outcome on flask.g
+
+    Returns:
+        tuple: (payload, error_response) where exactly one is None
+    """
+    if 'auth_result' in g:
+        return g.auth_result
+
+    g.auth_timings = {}
+
+    # Extract the token
+    start = perf_counter()
+    token = _extract_token()
+    g.auth_timings['extract'] = perf_counter() - start
+
+    if not token:
+        g.auth_result = (None, (jsonify({'error': 'Token is missing'}), 401))
+        return g.auth_result
+
+    # Verify the token
+    start = perf_counter()
+    payload = verify_token(token)
+    g.auth_timings['verify'] = perf_counter() - start
+
+    if not payload:
+        g.auth_result = (None, (jsonify({'error': 'Token is invalid or expired'}), 401))
+        return g.auth_result
+
+    # Add user info from token to request
+    request.user = payload
+    g.auth_result = (payload, None)
+    return g.auth_result
+
+# Add the auth pipeline timing breakdown as a Server-Timing header
+def add_auth_server_timing(response):
+    timings = g.get('auth_timings')
+    if timings:
+        response.headers.add(
+            'Server-Timing',
+            ', '.join(f'auth-{step};dur={duration * 1000:.3f}' for step, duration in timings.items())
+        )
+    return response
+
 # Authentication middleware
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
-        token = None
-        
-        # Check if Authorization header exists
-        if 'Authorization' in request.headers:
-            auth_header = request.headers['Authorization']
-            
-            # Check if header has the correct format (Bearer token)
-            parts = auth_header.split()
-            if len(parts) == 2 and parts[0].lower() == 'bearer':
-                token = parts[1]
-        
-        # Return error if no token provided
-        if not token:
-            return jsonify({'error': 'Token is missing'}), 401
-        
-        # Verify the token
-        payload = verify_token(token)
-        
-        # Return error if token is invalid
-        if not payload:
-            return jsonify({'error': 'Token is invalid or expired'}), 401
-        
-        # Add user info from token to request
-        request.user = payload
-        
+        payload, error = authenticate_request()
+
+        # Return error if token is missing or invalid
+        if error:
+            return error
+
         # Continue to the protected route
         return f(*args, **kwargs)
-    
+
     return decorated
 
 # Role-based access control middleware
 def role_required(allowed_roles):
     def decorator(f):
         @wraps(f)
-        @token_required
         def decorated_function(*args, **kwargs):
+            payload, error = authenticate_request()
+
+            # Return error if token is missing or invalid
+            if error:
+                return error
+
             # Check if user has the required role
-            if request.user.get('role') not in allowed_roles:
+            start = perf_counter()
+            allowed = payload.get('role') in allowed_roles
+            g.auth_timings['role'] = perf_counter() - start
+
+            if not allowed:
                 return jsonify({'error': 'Access denied'}), 403
-            
+
             # Continue to the protected route
             return f(*args, **kwargs)
         return decorated_function
-    return decorator 
\ No newline at end of file
+    return decorator
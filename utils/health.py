@@ -0,0 +1,123 @@
+import os
+import socket
+import threading
+import time
+import pymongo
+from config import mongo_client
+from utils.indexes import missing_unique_indexes
+
+# How often the readiness monitor re-checks this process's dependencies
+READINESS_REFRESH_SECONDS = float(os.getenv("READINESS_REFRESH_SECONDS", "5"))
+
+# Per-dependency timeout for readiness checks
+READINESS_TIMEOUT_SECONDS = float(os.getenv("READINESS_TIMEOUT_SECONDS", "2"))
+
+# Set once this process's startup tasks have finished
+_startup_complete = threading.Event()
+
+# Latest dependency checks of the readiness monitor, None until its first run
+_dependency_checks = None
+
+_monitor_lock = threading.Lock()
+_monitor_thread = None
+
+def mark_startup_complete():
+    """
+    Mark this process as warm, so it can report ready
+    """
+    _startup_complete.set()
+
+def _check_mongo():
+    try:
+        # Client-side timeout bounds server selection as well as the command
+        with pymongo.timeout(READINESS_TIMEOUT_SECONDS):
+            mongo_client.admin.command('ping')
+        return "ok"
+    except Exception as e:
+        return f"unavailable: {e}"
+
+def _check_indexes():
+    # Unique indexes back the duplicate checks, so serving without them risks duplicate records
+    try:
+        with pymongo.timeout(READINESS_TIMEOUT_SECONDS):
+            missing = missing_unique_indexes()
+    except Exception as e:
+        return f"unavailable: {e}"
+    return f"missing: {', '.join(missing)}" if missing else "ok"
+
+def _check_smtp():
+    # Imported here so the readiness check does not pull the email service into utils
+    from services.email_service import SMTP_SERVER, SMTP_PORT
+
+    if not SMTP_SERVER:
+        return "not configured"
+
+    # A TCP connect is enough to tell the server is reachable, without logging in
+    try:
+        socket.create_connection((SMTP_SERVER, SMTP_PORT), timeout=READINESS_TIMEOUT_SECONDS).close()
+        return "ok"
+    except OSError as e:
+        return f"unavailable: {e}"
+
+def refresh_readiness():
+    """
+    Check MongoDB, the unique indexes and SMTP, and publish the results
+
+    Runs on the readiness monitor thread, so probes never wait on network I/O.
+
+    Returns:
+        dict: Status of each dependency
+    """
+    global _dependency_checks
+
+    checks = {
+        "mongo": _check_mongo(),
+        "indexes": _check_indexes(),
+        "smtp": _check_smtp()
+    }
+    _dependency_checks = checks
+    return checks
+
+def _readiness_monitor():
+    while True:
+        try:
+            refresh_readiness()
+        except Exception as e:
+            print(f"Readiness check failed: {e}")
+
+        time.sleep(READINESS_REFRESH_SECONDS)
+
+def start_readiness_monitor():
+    """
+    Start the background readiness monitor if it is not already running
+    """
+    global _monitor_thread
+
+    with _monitor_lock:
+        if _monitor_thread:
+            return
+
+        _monitor_thread = threading.Thread(target=_readiness_monitor, name="readiness-monitor", daemon=True)
+        _monitor_thread.start()
+
+def check_readiness():
+    """
+    Check whether this process should receive traffic
+
+    The process is ready once its startup tasks have finished, MongoDB
+    answers a ping and every unique index exists. Dependencies are checked
+    by the readiness monitor every READINESS_REFRESH_SECONDS; this only
+    reads its latest results, so a slow or unreachable dependency never
+    delays a probe. SMTP reachability is reported but does not affect
+    readiness, since emails wait in the outbox until SMTP is back.
+
+    Returns:
+        tuple: (ready, checks) where checks maps each dependency to its status
+    """
+    checks = {
+        "startup": "ok" if _startup_complete.is_set() else "in progress",
+        **(_dependency_checks or {"mongo": "pending", "indexes": "pending", "smtp": "pending"})
+    }
+    ready = all(checks[name] == "ok" for name in ("startup", "mongo", "indexes"))
+
+    return ready, checks
@@ -0,0 +1,167 @@
+import os
+from pymongo import ASCENDING, TEXT
+from config import mongo_client
+
+# How long sent and failed emails are kept in the outbox
+EMAIL_OUTBOX_RETENTION_SECONDS = int(os.getenv("EMAIL_OUTBOX_RETENTION_SECONDS", str(7 * 24 * 3600)))
+
+# Database holding all collections
+db = mongo_client.speakeasy
+
+# Index registry: every index the services rely on, per collection.
+# Compound indexes also serve queries on their leading fields, e.g.
+# bookings (user_id, session_id) serves the user's booking list.
+# Indexes use MongoDB's default names (e.g. "email_1"); "partial" holds a
+# partialFilterExpression for indexes that only cover matching documents,
+# and "ttl" makes MongoDB delete documents that many seconds after the
+# indexed date.
+INDEXES = {
+    "users": [
+        {"keys": [("email", ASCENDING)], "unique": True}
+    ],
+    "speakers": [
+        {"keys": [("user_id", ASCENDING)], "unique": True},
+        {"keys": [("expertise", TEXT), ("first_name", TEXT), ("last_name", TEXT)]},
+        {"keys": [("price_per_session", ASCENDING), ("_id", ASCENDING)]},
+        {"keys": [("rating_average", ASCENDING), ("_id", ASCENDING)]}
+    ],
+    "sessions": [
+        {
+            "keys": [("speaker_id", ASCENDING), ("date", ASCENDING), ("time", ASCENDING)],
+            "unique": True
+        },
+        {"keys": [("date", ASCENDING), ("time", ASCENDING)]},
+        {
+            "keys": [("date", ASCENDING), ("time", ASCENDING), ("_id", ASCENDING)],
+            "partial": {"seats_available": {"$gt": 0}}
+        },
+        # Past sessions the cleanup job has not processed yet
+        {"keys": [("date", ASCENDING)], "partial": {"bookings_cleared": False}}
+    ],
+    "bookings": [
+        {
+            "keys": [("user_id", ASCENDING), ("session_id", ASCENDING)],
+            "unique": True
+        },
+        {"keys": [("session_id", ASCENDING)]},
+        {"keys": [("user_id", ASCENDING), ("session_date", ASCENDING), ("session_time", ASCENDING), ("_id", ASCENDING)]}
+    ],
+    "email_outbox": [
+        {"keys": [("status", ASCENDING), ("next_attempt_at", ASCENDING)]},
+        {"keys": [("completed_at", ASCENDING)], "ttl": EMAIL_OUTBOX_RETENTION_SECONDS}
+    ]
+}
+
+def index_name(keys):
+    """
+    Get MongoDB's default name for an index key specification
+
+    Args:
+        keys (list): List of (field, direction) tuples
+
+    Returns:
+        str: Index name, e.g. "user_id_1_session_id_1"
+    """
+    return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+def ensure_indexes():
+    """
+    Create every registered index that does not exist yet
+
+    create_index is a no-op for indexes that already exist with the same
+    keys and options, so this is safe to run on every boot. Each index is
+    created on its own, so one failure (e.g. duplicate values blocking a
+    unique index) does not stop the rest; failures are logged and returned.
+
+    Returns:
+        tuple: (ensured, failed) where ensured lists the ensured indexes as
+            collection.index and failed maps each failed index to its error
+    """
+    ensured = []
+    failed = {}
+
+    for collection_name, indexes in INDEXES.items():
+        collection = db[collection_name]
+        for index in indexes:
+            options = {"unique": index.get("unique", False)}
+            if "partial" in index:
+                options["partialFilterExpression"] = index["partial"]
+            if "ttl" in index:
+                options["expireAfterSeconds"] = index["ttl"]
+
+            name = f"{collection_name}.{index_name(index['keys'])}"
+            try:
+                collection.create_index(index["keys"], **options)
+                ensured.append(name)
+            except Exception as e:
+                print(f"Failed to create index {name}: {e}")
+                failed[name] = str(e)
+
+    return ensured, failed
+
+def missing_unique_indexes():
+    """
+    Find registered unique indexes that do not exist in the database
+
+    Without them, duplicate accounts, profiles, sessions or bookings can be
+    written, so the process should not take traffic until they exist.
+
+    Returns:
+        list: Missing unique indexes as collection.index
+    """
+    missing = []
+
+    for collection_name, indexes in INDEXES.items():
+        unique = [index_name(index["keys"]) for index in indexes if index.get("unique")]
+        if not unique:
+            continue
+
+        existing = {index["name"] for index in db[collection_name].list_indexes()}
+        missing.extend(f"{collection_name}.{name}" for name in unique if name not in existing)
+
+    return missing
+
+def report_indexes():
+    """
+    Compare the registry against the indexes that exist in the database
+
+    Returns:
+        dict: Per collection, the missing registered indexes, indexes that
+            are not in the registry, and indexes with no recorded usage
+            according to $indexStats
+    """
+    report = {}
+
+    for collection_name, indexes in INDEXES.items():
+        collection = db[collection_name]
+        registered = {index_name(index["keys"]) for index in indexes}
+        existing = {index["name"] for index in collection.list_indexes()}
+        usage = {
+            stats["name"]: stats["accesses"]["ops"]
+            for stats in collection.aggregate([{"$indexStats": {}}])
+        }
+
+        report[collection_name] = {
+            "missing": sorted(registered - existing),
+            "unregistered": sorted(existing - registered - {"_id_"}),
+            "unused": sorted(name for name, ops in usage.items() if ops == 0 and name != "_id_")
+        }
+
+    return report
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report or apply the SpeakEasy MongoDB indexes")
+    parser.add_argument("--apply", action="store_true", help="create missing indexes before reporting")
+    args = parser.parse_args()
+
+    if args.apply:
+        ensured, failed = ensure_indexes()
+        for name in ensured:
+            print(f"Ensured index {name}")
+
+    for collection_name, result in report_indexes().items():
+        print(f"{collection_name}:")
+        for key in ("missing", "unregistered", "unused"):
+            print(f"  {key}: {', '.join(result[key]) or '-'}")
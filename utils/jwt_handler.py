@@ -1,13 +1,20 @@
 import jwt
 import os
+import time
 import datetime
-from dotenv import load_dotenv
+import hashlib
+import threading
+from collections import OrderedDict
+from config import JWT_SECRET
 
-# Load environment variables
-load_dotenv()
+# Verified token cache configuration
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = int(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
 
-# Get JWT secret from environment
-JWT_SECRET = os.getenv("JWT_SECRET")
+# Verified tokens: digest -> (payload, expires_at), least recently used first.
+# The cache is per process; tokens are stateless, so there is no revocation.
+_token_cache = OrderedDict()
+_token_lock = threading.Lock()
 
 # Generate JWT token from payload
 def generate_token(payload):
@@ -16,12 +23,46 @@ def generate_token(payload):
     # Sign the token with our secret
     return jwt.encode(payload, JWT_SECRET, algorithm="HS256")
 
+# Digest used as the cache key so raw tokens are never kept in memory
+def _token_digest(token):
+    return hashlib.sha256(token.encode('utf-8')).digest()
+
 # Verify and decode JWT token
 def verify_token(token):
+    digest = _token_digest(token)
+    now = time.time()
+
+    # Serve from the cache while the entry is fresh
+    with _token_lock:
+        cached = _token_cache.get(digest)
+        if cached:
+            payload, expires_at = cached
+            if expires_at > now:
+                _token_cache.move_to_end(digest)
+                return dict(payload)
+            del _token_cache[digest]
+
     try:
         # Decode and verify the token
-        return jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
     except jwt.ExpiredSignatureError:
         return None
     except jwt.InvalidTokenError:
-        return None 
\ No newline at end of file
+        return None
+
+    # Cache the payload, never past the token's own expiry
+    expires_at = min(payload.get("exp", now), now + TOKEN_CACHE_TTL_SECONDS)
+    with _token_lock:
+        _token_cache[digest] = (payload, expires_at)
+        _token_cache.move_to_end(digest)
+        while len(_token_cache) > TOKEN_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+
+    return dict(payload)
+
+# Drop a token from this process's cache, so its next use is decoded and verified again.
+# This is not revocation: other processes keep their cached entry, and the token
+# itself stays valid until its exp.
+def evict_token(token):
+    with _token_lock:
+        _token_cache.pop(_token_digest(token), None)
@@ -0,0 +1,307 @@
+import threading
+from bisect import bisect_left
+from time import perf_counter
+from flask import g, has_request_context, request
+from pymongo import monitoring
+
+# Latency buckets in seconds, from 1ms to 10s
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Commands that only page through or close an open cursor
+CURSOR_COMMANDS = {"getMore", "killCursors"}
+
+# Buckets for the number of Mongo commands issued by a single request
+COMMAND_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(names, values, extra=None):
+    pairs = list(zip(names, values))
+    if extra:
+        pairs.append(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + "}"
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    """
+    Monotonically increasing value per label set
+    """
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        """
+        Increase the counter for the given label values
+
+        Args:
+            *label_values: One value per label, in declaration order
+            amount (float): Amount to add
+        """
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        """
+        Render the counter in Prometheus text format
+
+        Returns:
+            list: Exposition lines
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = list(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}")
+        return lines
+
+class Gauge:
+    """
+    Value that can go up and down, per label set
+    """
+
+    def __init__(self, name, documentation, labels=()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def set(self, value, *label_values):
+        """
+        Set the gauge for the given label values
+
+        Args:
+            value (float): New value
+            *label_values: One value per label, in declaration order
+        """
+        with self._lock:
+            self._values[label_values] = value
+
+    def render(self):
+        """
+        Render the gauge in Prometheus text format
+
+        Returns:
+            list: Exposition lines
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            values = list(self._values.items())
+        for label_values, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labels, label_values)} {_format_value(value)}")
+        return lines
+
+class Histogram:
+    """
+    Distribution of observations in fixed cumulative buckets per label set
+    """
+
+    def __init__(self, name, documentation, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        """
+        Record an observation for the given label values
+
+        Args:
+            value (float): Observed value
+            *label_values: One value per label, in declaration order
+        """
+        # Observations are counted in the first bucket they fit, cumulated on render
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        """
+        Render the histogram in Prometheus text format
+
+        Returns:
+            list: Exposition lines
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items()]
+        for label_values, counts, total, count in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = ("le", _format_value(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, label_values, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, label_values)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, label_values)} {count}")
+        return lines
+
+# Process startup metrics
+startup_seconds = Gauge(
+    "speakeasy_startup_seconds",
+    "Time spent in each startup phase of this process",
+    labels=("phase",)
+)
+
+# HTTP metrics
+http_request_duration = Histogram(
+    "speakeasy_http_request_duration_seconds",
+    "Time spent handling HTTP requests",
+    labels=("method", "route", "status")
+)
+http_request_mongo_commands = Histogram(
+    "speakeasy_http_request_mongo_commands",
+    "Number of MongoDB commands issued per HTTP request",
+    labels=("method", "route"),
+    buckets=COMMAND_COUNT_BUCKETS
+)
+
+http_query_budget_exceeded = Counter(
+    "speakeasy_http_query_budget_exceeded_total",
+    "Requests that issued more MongoDB commands than their route's query budget",
+    labels=("method", "route")
+)
+
+# MongoDB metrics
+mongo_commands = Counter(
+    "speakeasy_mongo_commands_total",
+    "MongoDB commands issued",
+    labels=("collection", "command", "outcome")
+)
+mongo_command_seconds = Counter(
+    "speakeasy_mongo_command_seconds_total",
+    "Time spent waiting for MongoDB commands",
+    labels=("collection", "command")
+)
+
+# SMTP metrics
+smtp_send_duration = Histogram(
+    "speakeasy_smtp_send_duration_seconds",
+    "Time spent sending an email over SMTP",
+    labels=("outcome",)
+)
+
+# Caches reported on /metrics, by name
+_caches = {}
+
+def register_cache(name, cache):
+    """
+    Report a TTLCache's hit, miss and size counters on /metrics
+
+    Args:
+        name (str): Cache name used as the metric label
+        cache (TTLCache): Cache to report
+    """
+    _caches[name] = cache
+
+def _render_caches():
+    stats = {name: cache.stats() for name, cache in list(_caches.items())}
+    lines = []
+    for metric, key, kind, documentation in (
+        ("speakeasy_cache_hits_total", "hits", "counter", "Cache lookups served from the cache"),
+        ("speakeasy_cache_misses_total", "misses", "counter", "Cache lookups that missed"),
+        ("speakeasy_cache_entries", "entries", "gauge", "Entries currently cached")
+    ):
+        lines.append(f"# HELP {metric} {documentation}")
+        lines.append(f"# TYPE {metric} {kind}")
+        for name, values in stats.items():
+            lines.append(f"{metric}{_format_labels(('cache',), (name,))} {values[key]}")
+    return lines
+
+class MongoCommandListener(monitoring.CommandListener):
+    """
+    Count MongoDB commands and their time, per collection and per request
+
+    Events fire on the thread running the command, so commands issued
+    while handling a request are also tallied on flask.g. The per-request
+    tally leaves out getMore and killCursors: how many batches a cursor
+    takes depends on the data, not on how many queries the code issues.
+    """
+
+    def __init__(self):
+        self._collections = {}
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        # Collection commands name it as their first value, getMore in "collection"
+        if event.command_name == "getMore":
+            collection = event.command.get("collection", "-")
+        else:
+            collection = event.command.get(event.command_name)
+            if not isinstance(collection, str):
+                collection = "-"
+        with self._lock:
+            self._collections[event.request_id] = collection
+
+    def _finished(self, event, outcome):
+        with self._lock:
+            collection = self._collections.pop(event.request_id, "-")
+        duration = event.duration_micros / 1_000_000
+
+        mongo_commands.inc(collection, event.command_name, outcome)
+        mongo_command_seconds.inc(collection, event.command_name, amount=duration)
+
+        if has_request_context():
+            # Cursor batches depend on result size, so only round trips the code asks for are counted
+            if event.command_name not in CURSOR_COMMANDS:
+                g.mongo_commands = g.get("mongo_commands", 0) + 1
+            g.mongo_seconds = g.get("mongo_seconds", 0.0) + duration
+
+    def succeeded(self, event):
+        self._finished(event, "success")
+
+    def failed(self, event):
+        self._finished(event, "failure")
+
+mongo_command_listener = MongoCommandListener()
+
+# Start timing the current request
+def start_request_timer():
+    g.request_started_at = perf_counter()
+
+# Record latency and Mongo usage of the current request
+def record_request_metrics(response):
+    started_at = g.get("request_started_at")
+    if started_at is None:
+        return response
+
+    # Use the route pattern rather than the raw path to keep label values bounded
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    commands = g.get("mongo_commands", 0)
+
+    http_request_duration.observe(perf_counter() - started_at, request.method, route, str(response.status_code))
+    http_request_mongo_commands.observe(commands, request.method, route)
+
+    response.headers.add("Server-Timing", f'mongo;desc="{commands} commands";dur={g.get("mongo_seconds", 0.0) * 1000:.3f}')
+    return response
+
+def render_metrics():
+    """
+    Render every metric in Prometheus text format
+
+    Returns:
+        str: Exposition body for /metrics
+    """
+    lines = []
+    for metric in (startup_seconds, http_request_duration, http_request_mongo_commands, http_query_budget_exceeded, mongo_commands, mongo_command_seconds, smtp_send_duration):
+        lines.extend(metric.render())
+    lines.extend(_render_caches())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,132 @@
+import base64
+import json
+import os
+from bson import ObjectId
+
+# Page size limits for listing endpoints
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "200"))
+
+def encode_cursor(values):
+    """
+    Encode the sort key of the last item on a page as an opaque cursor
+
+    Args:
+        values (list): JSON-serializable sort key values
+
+    Returns:
+        str: URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor, length):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Cursors come from clients, so only plain sort key values are accepted:
+    strings, numbers and null. Anything else (e.g. {"$ne": 1}) would end
+    up as an operator in the query.
+
+    Args:
+        cursor (str): Cursor string, or None for the first page
+        length (int): Number of values in the sort key
+
+    Returns:
+        list: Sort key values, or None for the first page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return None
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Invalid cursor")
+
+    for value in values:
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (str, int, float))):
+            raise ValueError("Invalid cursor")
+
+    return values
+
+def cursor_object_id(value):
+    """
+    Convert an _id value from a cursor back to an ObjectId
+
+    Args:
+        value: Value decoded from a cursor
+
+    Returns:
+        ObjectId: The ID
+
+    Raises:
+        ValueError: If the value is not an ObjectId hex string
+    """
+    if not isinstance(value, str) or not ObjectId.is_valid(value):
+        raise ValueError("Invalid cursor")
+
+    return ObjectId(value)
+
+def keyset_filter(fields, values, descending=False):
+    """
+    Build a query matching documents that sort after the given key
+
+    For fields (a, b, c) and values (x, y, z) this matches
+    a > x, or a == x and b > y, or a == x and b == y and c > z,
+    which an index on (a, b, c) can serve.
+
+    MongoDB sorts null (and missing fields) before any other value, but
+    $gt and $lt never match null. So in ascending order everything that
+    is not null comes after a null key, and in descending order nulls
+    come after every other value.
+
+    Args:
+        fields (list): Sort fields, in sort order
+        values (list): Sort key of the last item on the previous page
+        descending (bool): Whether all fields are sorted in descending order
+
+    Returns:
+        dict: MongoDB query fragment
+    """
+    operator = "$lt" if descending else "$gt"
+    clauses = []
+    for i, field in enumerate(fields):
+        equal = {fields[j]: values[j] for j in range(i)}
+        if values[i] is None:
+            # Nothing sorts below null, everything else sorts above it
+            if not descending:
+                clauses.append({**equal, field: {"$ne": None}})
+        else:
+            clauses.append({**equal, field: {operator: values[i]}})
+            if descending:
+                clauses.append({**equal, field: None})
+
+    return {"$or": clauses}
+
+def parse_page_args(args):
+    """
+    Read the limit and cursor query parameters of a listing request
+
+    Args:
+        args: Request query arguments (e.g. flask.request.args)
+
+    Returns:
+        tuple: (limit, cursor) where limit is clamped to MAX_PAGE_SIZE
+
+    Raises:
+        ValueError: If limit is not a positive integer
+    """
+    try:
+        limit = int(args.get("limit", DEFAULT_PAGE_SIZE))
+    except (TypeError, ValueError):
+        raise ValueError("limit must be a positive integer")
+
+    if limit <= 0:
+        raise ValueError("limit must be a positive integer")
+
+    return min(limit, MAX_PAGE_SIZE), args.get("cursor")
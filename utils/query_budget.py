@@ -0,0 +1,50 @@
+import os
+from functools import wraps
+from flask import g, request
+from utils.metrics import http_query_budget_exceeded
+
+# Fail requests that exceed their budget instead of only reporting them (for development and CI)
+QUERY_BUDGET_STRICT = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"
+
+class QueryBudgetExceeded(Exception):
+    """Raised in strict mode when a request issues more MongoDB commands than its budget"""
+
+# Declare the maximum number of MongoDB commands a route may issue per request
+def query_budget(max_commands):
+    """
+    Check a route against a fixed MongoDB command budget
+
+    The budget must not depend on data size, so a per-row lookup
+    (an N+1 query) pushes a request over it. Commands are counted by
+    the command listener in utils.metrics, which leaves out getMore so
+    large result sets do not count against the budget. Streamed bodies
+    run after the view returns and are not counted.
+
+    Args:
+        max_commands (int): Maximum MongoDB commands per request
+
+    Returns:
+        function: Route decorator
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            response = f(*args, **kwargs)
+
+            commands = g.get('mongo_commands', 0)
+            if commands > max_commands:
+                http_query_budget_exceeded.inc(request.method, request.url_rule.rule)
+                message = (
+                    f"Query budget exceeded on {request.method} {request.url_rule.rule}: "
+                    f"{commands} MongoDB commands, budget is {max_commands}"
+                )
+                if QUERY_BUDGET_STRICT:
+                    raise QueryBudgetExceeded(message)
+                print(message)
+
+            return response
+
+        # Keep the declared budget visible for tooling
+        decorated.query_budget = max_commands
+        return decorated
+    return decorator
@@ -0,0 +1,68 @@
+import json
+import os
+from flask import Response, stream_with_context
+
+# Number of documents joined per round trip when streaming
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))
+
+# Approximate size of each chunk written to the client
+STREAM_CHUNK_BYTES = 64 * 1024
+
+def iter_batches(iterable, size):
+    """
+    Group an iterable (e.g. a Mongo cursor) into lists of at most size items
+
+    Args:
+        iterable: Items to group
+        size (int): Maximum batch size
+
+    Yields:
+        list: The next batch of items
+    """
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+def stream_json_array(key, items):
+    """
+    Stream {"<key>": [...], "count": n} without building the list in memory
+
+    The body is sent with chunked transfer encoding, and items are
+    serialized as they are produced.
+
+    Args:
+        key (str): Name of the array field
+        items: Iterable of JSON-serializable items
+
+    Returns:
+        flask.Response: Streaming JSON response
+    """
+    def generate():
+        buffer = ["{", json.dumps(key), ": ["]
+        buffered = 0
+        count = 0
+
+        for item in items:
+            if count:
+                buffer.append(",")
+            encoded = json.dumps(item)
+            buffer.append(encoded)
+            buffered += len(encoded)
+            count += 1
+
+            # Flush in reasonably sized chunks instead of one write per item
+            if buffered >= STREAM_CHUNK_BYTES:
+                yield "".join(buffer)
+                buffer = []
+                buffered = 0
+
+        buffer.append(f'], "count": {count}}}')
+        yield "".join(buffer)
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
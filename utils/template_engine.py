@@ -0,0 +1,164 @@
+import html
+import os
+import re
+import threading
+
+# Directory holding all templates
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates")
+
+# Re-read templates whose file changed on disk (meant for development)
+TEMPLATE_AUTO_RELOAD = os.getenv("TEMPLATE_AUTO_RELOAD", "false").lower() == "true"
+
+# Matches {{ expression }} and {% statement %} tags
+_TAG_PATTERN = re.compile(r"\{\{\s*(.+?)\s*\}\}|\{%\s*(.+?)\s*%\}")
+_FOR_PATTERN = re.compile(r"for\s+(\w+)\s+in\s+(.+)$")
+_RANGE_PATTERN = re.compile(r"range\(\s*(\w+)\s*\)$")
+
+# Compiled templates keyed by name: (mtime, segments)
+_template_cache = {}
+_template_cache_lock = threading.Lock()
+
+def compile_template(source):
+    """
+    Compile template source into a list of segments
+
+    Supported syntax: {{ name }} (HTML-escaped), {% if name %} / {% if not name %}
+    with optional {% else %}, and {% for x in items %} / {% for x in range(name) %}.
+
+    Args:
+        source (str): Template source
+
+    Returns:
+        list: Segments, each either a literal string or a tuple node
+
+    Raises:
+        ValueError: If the template contains an unsupported or unbalanced tag
+    """
+    root = []
+    # Stack of (tag, segments being filled, node)
+    stack = [("root", root, None)]
+    position = 0
+
+    for match in _TAG_PATTERN.finditer(source):
+        if match.start() > position:
+            stack[-1][1].append(source[position:match.start()])
+        position = match.end()
+
+        expression, statement = match.groups()
+        segments = stack[-1][1]
+
+        if expression is not None:
+            segments.append(("var", expression))
+        elif statement.startswith("if "):
+            node = ("if", statement[3:].strip(), [], [])
+            segments.append(node)
+            stack.append(("if", node[2], node))
+        elif statement == "else":
+            if stack[-1][0] != "if":
+                raise ValueError("Unexpected {% else %} in template")
+            node = stack[-1][2]
+            stack[-1] = ("else", node[3], node)
+        elif statement == "endif":
+            if stack[-1][0] not in ("if", "else"):
+                raise ValueError("Unexpected {% endif %} in template")
+            stack.pop()
+        elif statement.startswith("for "):
+            loop = _FOR_PATTERN.match(statement)
+            if not loop:
+                raise ValueError(f"Invalid for statement in template: {statement}")
+            node = ("for", loop.group(1), loop.group(2).strip(), [])
+            segments.append(node)
+            stack.append(("for", node[3], node))
+        elif statement == "endfor":
+            if stack[-1][0] != "for":
+                raise ValueError("Unexpected {% endfor %} in template")
+            stack.pop()
+        else:
+            raise ValueError(f"Unsupported template statement: {statement}")
+
+    if len(stack) > 1:
+        raise ValueError(f"Unclosed {{% {stack[-1][0]} %}} in template")
+
+    if position < len(source):
+        root.append(source[position:])
+
+    return root
+
+def get_template(name):
+    """
+    Get a compiled template, loading and compiling it on first use
+
+    Args:
+        name (str): Template path relative to the templates directory
+
+    Returns:
+        list: Compiled template segments
+    """
+    cached = _template_cache.get(name)
+    if cached and not TEMPLATE_AUTO_RELOAD:
+        return cached[1]
+
+    path = os.path.join(TEMPLATE_DIR, name)
+    mtime = os.path.getmtime(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _template_cache_lock:
+        with open(path, "r", encoding="utf-8") as file:
+            segments = compile_template(file.read())
+        _template_cache[name] = (mtime, segments)
+
+    return segments
+
+def render_template(name, **context):
+    """
+    Render a template in a single pass over its compiled segments
+
+    Args:
+        name (str): Template path relative to the templates directory
+        **context: Values available to the template
+
+    Returns:
+        str: Rendered template
+    """
+    output = []
+    _render_segments(get_template(name), context, output)
+    return "".join(output)
+
+def _resolve(expression, context):
+    # Names come from the context, anything else is treated as an int literal
+    if expression in context:
+        return context[expression]
+    try:
+        return int(expression)
+    except ValueError:
+        return None
+
+def _is_true(expression, context):
+    if expression.startswith("not "):
+        return not _resolve(expression[4:].strip(), context)
+    return bool(_resolve(expression, context))
+
+def _iterate(expression, context):
+    range_match = _RANGE_PATTERN.match(expression)
+    if range_match:
+        return range(int(_resolve(range_match.group(1), context) or 0))
+    return _resolve(expression, context) or []
+
+def _render_segments(segments, context, output):
+    for segment in segments:
+        if isinstance(segment, str):
+            output.append(segment)
+        elif segment[0] == "var":
+            value = _resolve(segment[1], context)
+            if value is not None:
+                output.append(html.escape(str(value)))
+        elif segment[0] == "if":
+            _, expression, body, else_body = segment
+            _render_segments(body if _is_true(expression, context) else else_body, context, output)
+        elif segment[0] == "for":
+            _, name, expression, body = segment
+            loop_context = dict(context)
+            for item in _iterate(expression, context):
+                loop_context[name] = item
+                _render_segments(body, loop_context, output)
@@ -0,0 +1,6 @@
+from app import create_app
+
+# Production entry point: gunicorn wsgi:app
+# Creating the app does no network I/O, so it is safe to preload before forking;
+# startup tasks and background threads are started per worker by gunicorn.conf.py
+app = create_app(start_background=False)